@@ -1,7 +1,9 @@
 # custom_components/philips_shaver/__init__.py
 from __future__ import annotations
 
+from functools import partial
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -9,6 +11,7 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers import area_registry as ar, config_validation as cv, device_registry as dr
 from homeassistant.helpers.typing import ConfigType
 
@@ -23,6 +26,8 @@ from .const import (
     CONF_AREA,
     CONF_PIPELINED_READS,
     DEFAULT_PIPELINED_READS,
+    CONF_REPLAY_FIXTURE,
+    CONF_REPLAY_SCRIPT,
     CHAR_SYSTEM_NOTIFICATIONS,
 )
 from .coordinator import PhilipsShaverCoordinator, async_remove_stored_data
@@ -31,6 +36,8 @@ from .frontend import (
     async_register_card,
     async_remove_card_resource,
 )
+from .path_stats import async_get_path_stats, async_setup_path_stats
+from .text_blocks import async_clear_text_blocks
 from .transport import (
     UNPAIR_OK,
     UNPAIR_UNAVAILABLE,
@@ -38,6 +45,10 @@ from .transport import (
     EspBridgeTransport,
     async_unpair_bridge_slot,
 )
+from .websocket_api import (
+    async_end_subscriptions,
+    async_register_websocket_commands,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -224,11 +235,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Philips Shaver component (one-time, entry-independent)."""
     # Serve the bundled Lovelace card on every dashboard.
     await async_register_card(hass)
+    # Its live data: one subscription per shaver instead of entity states.
+    async_register_websocket_commands(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Philips Shaver from a config entry."""
+    started = time.perf_counter()
     # Removing the last entry deletes the card's Lovelace resource — a later
     # re-add must restore it without a restart (idempotent otherwise).
     await async_ensure_card_resource(hass)
@@ -250,17 +264,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     else:
         address = entry.data["address"]
-        transport = BleakTransport(hass, address)
+        replay = None
+        if fixture := entry.options.get(CONF_REPLAY_FIXTURE):
+            # Developer option: only entries that replay pay for the import.
+            from .replay import ReplayDevice
+
+            try:
+                replay = await hass.async_add_executor_job(
+                    partial(
+                        ReplayDevice.from_file,
+                        fixture,
+                        address=address,
+                        script=entry.options.get(CONF_REPLAY_SCRIPT) or None,
+                    )
+                )
+            except (OSError, ValueError, KeyError) as err:
+                raise ConfigEntryError(
+                    f"Cannot load replay fixture {fixture}: {err}"
+                ) from err
+            _LOGGER.warning(
+                "%s: replaying %s instead of the real shaver", address, fixture
+            )
+        transport = BleakTransport(hass, address, replay=replay)
+        # Connect history per scanner — decides which path the direct
+        # connects take (see path_stats).
+        await async_setup_path_stats(hass)
 
     coordinator = PhilipsShaverCoordinator(hass, entry, transport)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator}
+    # One statistics row per hour of shaving (see session_stats).
+    entry.async_on_unload(
+        coordinator.async_add_listener(coordinator.session_stats.async_observe)
+    )
 
     # Non-blocking: shaver sleeps most of the time, don't block HA startup.
     # Entities come up with the persisted last-known values (or "Unknown" on
     # a fresh install) until the device next wakes up.
     await coordinator.async_load_stored_data()
+    # Right after the config flow: reuse its probe reads (and link).
+    coordinator.async_apply_probe_handoff()
     coordinator.async_set_updated_data(coordinator.data or {})
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -288,11 +332,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 first = next(iter(hass.data[DOMAIN].values()), None)
                 if not first:
                     _LOGGER.error("No Philips Shaver devices configured")
-                    return {"sessions": []}
+                    return {"sessions": [], "pressure_history": []}
                 coord = first["coordinator"]
 
             sessions = await coord.async_fetch_history()
-            return {"sessions": sessions}
+            return {
+                "sessions": sessions,
+                "pressure_history": coord.data.get("pressure_history", []),
+            }
 
         hass.services.async_register(
             DOMAIN,
@@ -437,56 +484,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if not hass.services.has_service(DOMAIN, SERVICE_ACKNOWLEDGE_NOTIFICATION):
         async def handle_acknowledge_notification(call: ServiceCall) -> None:
-            """Clear a specific notification bit via read-modify-write on 0x0110."""
+            """Clear notification bits on 0x0110 in a single write."""
             coord = _get_coordinator(hass, call.data.get("entry_id"))
             if not coord:
                 _LOGGER.warning("acknowledge_notification: no coordinator found")
                 return
 
-            notification = call.data["notification"]
-            bit_mask = NOTIFICATION_BIT_MAP.get(notification)
-            if bit_mask is None:
-                _LOGGER.error("Unknown notification key: %s", notification)
-                return
-
-            if not coord.transport.is_connected:
-                _LOGGER.warning("Shaver not connected – cannot acknowledge notification")
-                return
+            notifications = call.data["notification"]
+            bit_mask = 0
+            for notification in notifications:
+                bit_mask |= NOTIFICATION_BIT_MAP[notification]
 
+            # No read after, and none before once the shaver sent the
+            # register on this link: it is subscribed, so the cached value
+            # is current and the shaver's next notification confirms the
+            # clear. While the shaver sleeps the clear waits for the next
+            # connect.
             try:
-                raw = await coord.transport.read_char(CHAR_SYSTEM_NOTIFICATIONS)
-                if raw is None:
-                    _LOGGER.warning("Could not read system notifications")
-                    return
-                current = int.from_bytes(raw, "little")
-                updated = current & ~bit_mask
-                await coord.transport.write_char(
-                    CHAR_SYSTEM_NOTIFICATIONS, updated.to_bytes(4, "little")
-                )
-                _LOGGER.info(
-                    "Notification %s cleared (0x%08X → 0x%08X)",
-                    notification, current, updated,
-                )
+                if await coord.writer.async_clear_bits(
+                    CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", bit_mask
+                ):
+                    _LOGGER.info(
+                        "Notification(s) %s cleared (0x%08X)",
+                        ", ".join(notifications),
+                        coord.data["system_notifications"],
+                    )
             except Exception as e:
-                _LOGGER.error("Failed to acknowledge notification %s: %s", notification, e)
-                return
-
-            # Re-read to confirm and update state
-            try:
-                raw = await coord.transport.read_char(CHAR_SYSTEM_NOTIFICATIONS)
-                if raw is not None:
-                    updated = int.from_bytes(raw, "little")
-            except Exception:
-                pass
-
-            new_data = coord.data.copy()
-            new_data["system_notifications"] = updated
-            coord.async_set_updated_data(new_data)
+                _LOGGER.error(
+                    "Failed to acknowledge notification(s) %s: %s",
+                    ", ".join(notifications), e,
+                )
 
         hass.services.async_register(
             DOMAIN, SERVICE_ACKNOWLEDGE_NOTIFICATION, handle_acknowledge_notification,
             schema=vol.Schema({
-                vol.Required("notification"): vol.In(list(NOTIFICATION_BIT_MAP.keys())),
+                vol.Required("notification"): vol.All(
+                    cv.ensure_list, [vol.In(list(NOTIFICATION_BIT_MAP.keys()))]
+                ),
                 vol.Optional("entry_id"): str,
             }),
         )
@@ -524,7 +558,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     device_id = entry.data.get("address") or entry.data.get(CONF_ESP_DEVICE_NAME)
-    _LOGGER.info("Philips Shaver integration loaded – device: %s", device_id)
+    # The duration is what scripts/benchmark.py --startup reports per entry.
+    _LOGGER.info(
+        "Philips Shaver integration loaded – device: %s (setup %.0f ms)",
+        device_id, (time.perf_counter() - started) * 1000,
+    )
     return True
 
 
@@ -537,6 +575,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator = hass.data[DOMAIN].pop(entry.entry_id)["coordinator"]
     await coordinator.async_shutdown()
+    # Card streams follow the coordinator; a reload brings a new one.
+    async_end_subscriptions(hass, entry.entry_id)
+
+    # The cached flow text goes with the integration (see text_blocks).
+    async_clear_text_blocks(hass)
 
     # Remove services if no more entries
     if not hass.data[DOMAIN]:
@@ -563,6 +606,10 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     bond the shaver may no longer honour (Sonicare parity).
     """
     await async_remove_stored_data(hass, entry.entry_id)
+    if (address := entry.data.get(CONF_ADDRESS)) and (
+        stats := async_get_path_stats(hass)
+    ):
+        stats.async_forget(address)
 
     # Last entry gone: drop the card's Lovelace resource entry, otherwise it
     # would 404 once the integration no longer serves the static path.
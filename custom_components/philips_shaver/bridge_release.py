@@ -0,0 +1,174 @@
+# custom_components/philips_shaver/bridge_release.py
+"""Integration-wide check for new ESP bridge firmware.
+
+Every bridge entry has an update entity, and each of them used to download
+the published VERSION file on its own 24-hour timer and the full changelog
+whenever its release notes were opened. With several bridges that is the
+same two files fetched once per entry.
+
+One fetcher per HA instance now does it for all of them. It keeps the last
+copy of each file with its ``ETag``/``Last-Modified`` and revalidates with
+a conditional request, so an unchanged file costs a 304 instead of the
+download. Concurrent requests for a file share one download. The version
+check runs on a single timer while any update entity listens and fans a
+new version out to all of them. A failed request keeps the last copy.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import re
+import time
+
+from aiohttp import ClientSession, ClientTimeout, hdrs
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import BRIDGE_CHANGELOG_URL, BRIDGE_VERSION_URL
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_BRIDGE_RELEASE = "philips_shaver_bridge_release"
+
+CHECK_INTERVAL = timedelta(hours=24)
+# Release-notes dialogs opened within this many seconds of the last
+# download are served from memory, without even a conditional request.
+CHANGELOG_MAX_AGE = 3600.0
+FETCH_TIMEOUT = ClientTimeout(total=30)
+_VERSION_RE = re.compile(r"\d+\.\d+\.\d+")
+
+
+@dataclass
+class _CachedFile:
+    text: str
+    etag: str | None
+    last_modified: str | None
+    # time.monotonic() of the last download or 304.
+    fetched_at: float
+
+
+class BridgeReleaseFetcher:
+    """Shared, revalidating fetch of the bridge VERSION file and changelog."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: ClientSession | None = None,
+        *,
+        version_url: str = BRIDGE_VERSION_URL,
+        changelog_url: str = BRIDGE_CHANGELOG_URL,
+    ) -> None:
+        self.hass = hass
+        self._session = session
+        self._version_url = version_url
+        self._changelog_url = changelog_url
+        self._files: dict[str, _CachedFile] = {}
+        self._inflight: dict[str, asyncio.Task[str | None]] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self.latest_version: str | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call ``update_callback`` when the published version changes."""
+        self._listeners.append(update_callback)
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self.hass, self._async_scheduled_check, CHECK_INTERVAL
+            )
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+            if not self._listeners and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return _remove
+
+    async def _async_scheduled_check(self, _now) -> None:
+        await self.async_check_version(max_age=0)
+
+    async def async_check_version(
+        self, max_age: float = CHECK_INTERVAL.total_seconds()
+    ) -> str | None:
+        """The latest published bridge version, checked if older than ``max_age``.
+
+        Entities set up within ``max_age`` of each other share one check.
+        """
+        text = await self.async_fetch(self._version_url, max_age)
+        if text is None:
+            return self.latest_version
+        version = text.strip()
+        if not _VERSION_RE.fullmatch(version):
+            _LOGGER.debug("Unexpected bridge VERSION payload: %r", version[:64])
+        elif version != self.latest_version:
+            _LOGGER.debug("Bridge firmware check: latest=%s", version)
+            self.latest_version = version
+            for update_callback in list(self._listeners):
+                update_callback()
+        return self.latest_version
+
+    async def async_fetch_changelog(self) -> str | None:
+        return await self.async_fetch(self._changelog_url, CHANGELOG_MAX_AGE)
+
+    async def async_fetch(self, url: str, max_age: float) -> str | None:
+        """The text at ``url``, downloaded or revalidated if older than ``max_age``.
+
+        Returns the last copy when the request fails, None without one.
+        """
+        cached = self._files.get(url)
+        if cached is not None and time.monotonic() - cached.fetched_at < max_age:
+            return cached.text
+        if (task := self._inflight.get(url)) is None:
+            task = self.hass.async_create_task(
+                self._async_download(url), f"philips_shaver_fetch {url}"
+            )
+            if not task.done():  # may have run to completion eagerly
+                self._inflight[url] = task
+                task.add_done_callback(lambda _task: self._inflight.pop(url, None))
+        # A caller going away must not cancel the download others wait for.
+        return await asyncio.shield(task)
+
+    async def _async_download(self, url: str) -> str | None:
+        cached = self._files.get(url)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+        session = self._session or async_get_clientsession(self.hass)
+        try:
+            async with session.get(
+                url, headers=headers, timeout=FETCH_TIMEOUT
+            ) as resp:
+                if resp.status == 304 and cached is not None:
+                    _LOGGER.debug("%s not modified", url)
+                    cached.fetched_at = time.monotonic()
+                    return cached.text
+                resp.raise_for_status()
+                text = await resp.text()
+                self._files[url] = _CachedFile(
+                    text,
+                    resp.headers.get(hdrs.ETAG),
+                    resp.headers.get(hdrs.LAST_MODIFIED),
+                    time.monotonic(),
+                )
+                return text
+        except Exception as err:  # noqa: BLE001 — keep the last copy on any failure
+            _LOGGER.debug("Failed to fetch %s: %s", url, err)
+            return cached.text if cached is not None else None
+
+
+@callback
+def async_get_bridge_release(hass: HomeAssistant) -> BridgeReleaseFetcher:
+    """The integration-wide fetcher, created on first use."""
+    if (fetcher := hass.data.get(DATA_BRIDGE_RELEASE)) is None:
+        fetcher = hass.data[DATA_BRIDGE_RELEASE] = BridgeReleaseFetcher(hass)
+    return fetcher
@@ -106,37 +106,17 @@ class PhilipsResetCleanReminderButton(PhilipsShaverEntity, ButtonEntity):
         self._attr_unique_id = f"{self._device_id}_reset_clean_reminder"
 
     async def async_press(self) -> None:
-        """Clear bit 1 (clean reminder) in system notifications via read-modify-write."""
-        if not self.coordinator.transport.is_connected:
-            _LOGGER.warning("Shaver not connected – cannot reset clean reminder")
-            return
-
+        """Clear bit 1 (clean reminder) in system notifications."""
         try:
-            raw = await self.coordinator.transport.read_char(CHAR_SYSTEM_NOTIFICATIONS)
-            if raw is None:
-                _LOGGER.warning("Could not read system notifications")
-                return
-            current = int.from_bytes(raw, "little")
-            updated = current & ~0x02  # clear bit 1
-            await self.coordinator.transport.write_char(
-                CHAR_SYSTEM_NOTIFICATIONS, updated.to_bytes(4, "little")
-            )
-            _LOGGER.info("Clean reminder cleared (0x%08X → 0x%08X)", current, updated)
+            if await self.coordinator.writer.async_clear_bits(
+                CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", 0x02
+            ):
+                _LOGGER.info(
+                    "Clean reminder cleared (0x%08X)",
+                    self.coordinator.data["system_notifications"],
+                )
         except Exception as e:
             _LOGGER.error("Failed to reset clean reminder: %s", e)
-            return
-
-        # Re-read to confirm
-        try:
-            raw = await self.coordinator.transport.read_char(CHAR_SYSTEM_NOTIFICATIONS)
-            if raw is not None:
-                updated = int.from_bytes(raw, "little")
-        except Exception:
-            pass
-
-        new_data = self.coordinator.data.copy()
-        new_data["system_notifications"] = updated
-        self.coordinator.async_set_updated_data(new_data)
 
 
 class PhilipsResetAllNotificationsButton(PhilipsShaverEntity, ButtonEntity):
@@ -152,31 +132,10 @@ class PhilipsResetAllNotificationsButton(PhilipsShaverEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Write 0x00000000 to 0x0110 to clear all notification bits."""
-        if not self.coordinator.transport.is_connected:
-            _LOGGER.warning("Shaver not connected – cannot reset notifications")
-            return
-
         try:
-            await self.coordinator.transport.write_char(
-                CHAR_SYSTEM_NOTIFICATIONS, bytes(4)
-            )
-            _LOGGER.info("All system notifications acknowledged")
+            if await self.coordinator.writer.async_clear_bits(
+                CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", 0xFFFFFFFF
+            ):
+                _LOGGER.info("All system notifications acknowledged")
         except Exception as e:
             _LOGGER.error("Failed to reset notifications: %s", e)
-            return
-
-        # Re-read to confirm
-        try:
-            raw = await self.coordinator.transport.read_char(CHAR_SYSTEM_NOTIFICATIONS)
-            if raw is not None:
-                new_data = self.coordinator.data.copy()
-                new_data["system_notifications"] = int.from_bytes(raw, "little")
-                self.coordinator.async_set_updated_data(new_data)
-                return
-        except Exception as e:
-            _LOGGER.debug("Failed to re-read notifications: %s", e)
-
-        # Fallback: assume success
-        new_data = self.coordinator.data.copy()
-        new_data["system_notifications"] = 0
-        self.coordinator.async_set_updated_data(new_data)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 import asyncio
@@ -55,6 +56,7 @@ from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
     SelectOptionDict,
+    TextSelector,
 )
 from .const import (
     DOMAIN,
@@ -89,6 +91,8 @@ from .const import (
     CONF_ESP_BRIDGE_ID,
     CONF_NOTIFY_THROTTLE,
     CONF_PIPELINED_READS,
+    CONF_REPLAY_FIXTURE,
+    CONF_REPLAY_SCRIPT,
     DEFAULT_NOTIFY_THROTTLE,
     DEFAULT_PIPELINED_READS,
     MIN_NOTIFY_THROTTLE,
@@ -103,8 +107,11 @@ from .transport import (
     describe_available_paths,
     describe_connection_path,
     is_local_bluez_connection,
+    note_slot_changed,
     slot_changed_at,
 )
+from .probe_handoff import ProbeHandoff, async_stash_probe
+from .text_blocks import async_text_block_cache
 from .exceptions import (
     DeviceAsleepException,
     DeviceNotFoundException,
@@ -241,20 +248,29 @@ async def _async_text_blocks(hass, category: str = "config") -> dict[str, str]:
     the domain (``error.<name>``), so the same lookup also reaches the
     error strings themselves — which is what makes them usable as notices
     on forms that cannot render ``errors[]`` at all.
+
+    The result is cached per language and category until the integration
+    reloads (``text_blocks.async_clear_text_blocks``): progress steps
+    re-render on every bump, and each render would otherwise go through
+    the translation loader again. Callers must not modify it.
     """
+    language = await _async_user_language(hass)
+    cache = async_text_block_cache(hass)
+    if (blocks := cache.get((language, category))) is not None:
+        return blocks
     prefix = f"component.{DOMAIN}.{category}."
     try:
-        resources = await async_get_translations(
-            hass, await _async_user_language(hass), category, [DOMAIN]
-        )
+        resources = await async_get_translations(hass, language, category, [DOMAIN])
     except Exception:  # noqa: BLE001 — wording is cosmetic, never fatal
         _LOGGER.debug("Could not load flow text blocks", exc_info=True)
+        # Not cached: the next render tries again.
         return {}
-    return {
+    blocks = cache[(language, category)] = {
         key[len(prefix):]: value
         for key, value in resources.items()
         if key.startswith(prefix)
     }
+    return blocks
 
 
 def _is_hassio(hass) -> bool:
@@ -288,6 +304,21 @@ _SHAVER_ADV_UUIDS = {
 # appeared — re-probes instead of showing the state it started with.
 _PROBE_CACHE_MAX_AGE = 30.0
 
+# Slot probes shared by every flow, keyed by (esp, bridge_id) with the
+# time the probe started and its answer (None: no answer on our event
+# channel). Zeroconf starts a flow per ESPHome node and the user's own
+# flow probes the same slots again moments later, and a node that never
+# answers (a Sonicare bridge sharing our service names) costs the full
+# timeout every time. Entries expire after _PROBE_CACHE_MAX_AGE or when
+# note_slot_changed marks the slot.
+_DATA_BRIDGE_PROBES = "philips_shaver_bridge_probes"
+_DATA_PROBE_LIMIT = "philips_shaver_probe_limit"
+# Probes in flight at once, across all flows. Each probe is one ESPHome
+# service call plus a wait, so a busy house still finishes within one
+# probe timeout. The limit only keeps a large fleet from flooding the
+# API connections all at once.
+_PROBE_CONCURRENCY = 16
+
 # Length of the active-scan window requested while pair-mode is armed. Matches
 # the bridge's own 60 s window; habluetooth clamps a single request to its
 # AUTO_WINDOW_MAX_DURATION (35 s), so the caller re-arms until the pair window
@@ -300,6 +331,16 @@ _ACTIVE_SCAN_WINDOW = 60.0
 _ACTIVE_SCAN_RETRY_DELAY = 2.0
 
 
+def _shared_probes(hass) -> dict[tuple[str, str], tuple[float, dict | None]]:
+    return hass.data.setdefault(_DATA_BRIDGE_PROBES, {})
+
+
+def _probe_limit(hass) -> asyncio.Semaphore:
+    if (limit := hass.data.get(_DATA_PROBE_LIMIT)) is None:
+        limit = hass.data[_DATA_PROBE_LIMIT] = asyncio.Semaphore(_PROBE_CONCURRENCY)
+    return limit
+
+
 class PhilipsShaverOptionsFlow(OptionsFlowWithReload):
     """Options flow for Philips Shaver."""
 
@@ -322,16 +363,32 @@ class PhilipsShaverOptionsFlow(OptionsFlowWithReload):
                 entry_data[CONF_PIPELINED_READS] = bool(
                     user_input[CONF_PIPELINED_READS]
                 )
-            # Info: which options a device runs with explains a lot of later
-            # behaviour (throttling, pipelining), and nothing here is
-            # sensitive enough to keep out of the log.
-            _LOGGER.info(
-                "Options saved for %s: %s",
-                self.config_entry.title,
-                ", ".join(f"{k}={v}" for k, v in sorted(entry_data.items()))
-                or "no changes",
-            )
-            return self.async_create_entry(data=entry_data)
+            if not is_esp and (fixture := user_input.get(CONF_REPLAY_FIXTURE)):
+                script = user_input.get(CONF_REPLAY_SCRIPT) or None
+                # Imported here: only needed when a replay fixture is set.
+                from .replay import ReplayDevice
+
+                try:
+                    await self.hass.async_add_executor_job(
+                        partial(ReplayDevice.from_file, fixture, script=script)
+                    )
+                except (OSError, ValueError, KeyError) as err:
+                    _LOGGER.debug("Replay fixture %s rejected: %s", fixture, err)
+                    errors[CONF_REPLAY_FIXTURE] = "replay_fixture_invalid"
+                entry_data[CONF_REPLAY_FIXTURE] = fixture
+                if script:
+                    entry_data[CONF_REPLAY_SCRIPT] = script
+            if not errors:
+                # Info: which options a device runs with explains a lot of
+                # later behaviour (throttling, pipelining), and nothing here
+                # is sensitive enough to keep out of the log.
+                _LOGGER.info(
+                    "Options saved for %s: %s",
+                    self.config_entry.title,
+                    ", ".join(f"{k}={v}" for k, v in sorted(entry_data.items()))
+                    or "no changes",
+                )
+                return self.async_create_entry(data=entry_data)
 
         schema_fields: dict = {}
 
@@ -346,6 +403,10 @@ class PhilipsShaverOptionsFlow(OptionsFlowWithReload):
                 )
             )
             schema_fields[vol.Required(CONF_PIPELINED_READS)] = BooleanSelector()
+        elif self.show_advanced_options:
+            # Developer tooling: replay a capture instead of the shaver.
+            schema_fields[vol.Optional(CONF_REPLAY_FIXTURE)] = TextSelector()
+            schema_fields[vol.Optional(CONF_REPLAY_SCRIPT)] = TextSelector()
 
         if not schema_fields:
             # Direct BLE: no configurable options currently
@@ -363,6 +424,10 @@ class PhilipsShaverOptionsFlow(OptionsFlowWithReload):
                 CONF_PIPELINED_READS,
                 DEFAULT_PIPELINED_READS,
             )
+        else:
+            for key in (CONF_REPLAY_FIXTURE, CONF_REPLAY_SCRIPT):
+                if key in self.config_entry.options:
+                    suggested_values[key] = self.config_entry.options[key]
 
         return self.async_show_form(
             step_id="init",
@@ -651,6 +716,11 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
             raise DeviceNotFoundException("BLE device not found")
 
         client: BleakClient | None = None
+        # Filled while probing and left for the entry's first connect —
+        # including the open link, which the coordinator then adopts
+        # instead of connecting again (see probe_handoff).
+        handoff = ProbeHandoff(address)
+        link_kept = False
         try:
             # Progress milestones: the connect is a single await and by far
             # the longest leg, so the bar sits low until it lands, then
@@ -670,6 +740,7 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 client = await establish_connection(
                     BleakClient, device, "philips_shaver",
                     use_services_cache=True, timeout=30.0,
+                    disconnected_callback=handoff.link_lost,
                 )
             finally:
                 creep.cancel()
@@ -812,6 +883,7 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                     try:
                         raw = await client.read_gatt_char(char_uuid)
                         if raw:
+                            handoff.values[char_uuid] = bytes(raw)
                             capabilities[key] = bytes(raw).decode(
                                 "utf-8", errors="replace"
                             ).strip()
@@ -824,6 +896,7 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                     try:
                         raw = await client.read_gatt_char(CHAR_SOFTWARE_REVISION)
                         if raw:
+                            handoff.values[CHAR_SOFTWARE_REVISION] = bytes(raw)
                             capabilities["firmware"] = bytes(raw).decode(
                                 "utf-8", errors="replace"
                             ).strip()
@@ -854,6 +927,10 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 except Exception:
                     pass
 
+            if client.is_connected:
+                handoff.client = client
+                link_kept = async_stash_probe(self.hass, handoff)
+
         except (BleakConnectionError, TimeoutError) as err:
             err_msg = str(err).lower()
             # "failed to discover services, device disconnected" is the
@@ -870,7 +947,7 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
             _LOGGER.error("Connection error during capabilities fetch: %s", err)
             raise CannotConnectException from err
         finally:
-            if client and client.is_connected:
+            if client and client.is_connected and not link_kept:
                 await client.disconnect()
 
         return capabilities
@@ -1101,8 +1178,9 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         fails outright, so the warning is unconditional and hard.
 
         habluetooth routes by signal strength, so the strongest scanner
-        is only the *likely* carrier; recomputed each render so the
-        ranking stays current.
+        is only the *likely* carrier (or the path the learned connect
+        history pins); recomputed each render so the ranking stays
+        current. With history, the expected time to connect is shown.
         """
         address = self.discovery_info.address if self.discovery_info else ""
         paths = describe_available_paths(self.hass, address)
@@ -1117,6 +1195,8 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         best = paths[0]
         best_name = self._short_scanner(best)
         best_rssi = f", {best['rssi']} dBm" if best["rssi"] is not None else ""
+        if isinstance(expected := best.get("expected_s"), float):
+            best_rssi += f", ~{expected:.1f} s to connect"
 
         if best["is_local"]:
             via = f" via **Direct Bluetooth** ({best_name}{best_rssi})"
@@ -1362,7 +1442,7 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         """Locate an ESP bridge slot that already holds this shaver.
 
         Probes candidate slots via the lightweight ``ble_get_info`` event
-        round-trip (3 s, parallel per ESP) instead of a full transport
+        round-trip (3 s, all ESPs and slots in parallel) instead of a full transport
         connect (10 s per slot) — and only slots answering on the
         *shaver* event channel count, so a Sonicare bridge sharing the
         same service-name pattern is no longer probed as a candidate.
@@ -1371,6 +1451,7 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         its bridge.
         """
         target = mac.upper()
+        candidates: list[tuple[str, list[str]]] = []
         for entry in self.hass.config_entries.async_entries("esphome"):
             if self._esp_entry_unreachable(entry, mac):
                 continue
@@ -1379,11 +1460,14 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 continue
             esp_name = device_name.replace("-", "_")
             device_ids = self._detect_esp_bridge_ids(esp_name)
-            if not device_ids:
-                continue
-            for did, info in await self._probe_shaver_bridges(
-                esp_name, device_ids
-            ):
+            if device_ids:
+                candidates.append((esp_name, device_ids))
+        # All ESPs at once — one probe timeout in total, not one per ESP.
+        probed = await asyncio.gather(
+            *(self._probe_shaver_bridges(esp, dids) for esp, dids in candidates)
+        )
+        for (esp_name, _), results in zip(candidates, probed):
+            for did, info in results:
                 if info is None:
                     continue
                 identity = info.get("identity_address", "").upper()
@@ -1492,6 +1576,8 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 label_parts.append(
                     f"via {via}" + ("" if best["is_local"] else " (proxy)")
                 )
+                if isinstance(expected := best.get("expected_s"), float):
+                    label_parts.append(f"~{expected:.1f} s to connect")
             label = label_parts[0] + (
                 " — " + ", ".join(label_parts[1:]) if len(label_parts) > 1 else ""
             )
@@ -1591,10 +1677,12 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
             firmware: str | None = None
             raw_fw = await transport.read_char(CHAR_FIRMWARE_REVISION)
             if raw_fw:
+                probe_results[CHAR_FIRMWARE_REVISION] = raw_fw
                 firmware = raw_fw.decode("utf-8", errors="replace").strip()
             if not firmware:
                 raw_sw = await transport.read_char(CHAR_SOFTWARE_REVISION)
                 if raw_sw:
+                    probe_results[CHAR_SOFTWARE_REVISION] = raw_sw
                     firmware = raw_sw.decode("utf-8", errors="replace").strip()
 
             self._bump_progress(0.92)
@@ -1622,6 +1710,12 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                 result["device_type"] = device_type
             if groomer_cap is not None:
                 result["groomer_capabilities"] = groomer_cap
+            # Static values for the entry's first read batch. The bridge
+            # link itself belongs to the ESP, nothing to hand over there.
+            async_stash_probe(
+                self.hass,
+                ProbeHandoff(address or transport.detected_mac or "", probe_results),
+            )
             return result
 
         except TransportError as err:
@@ -1640,9 +1734,11 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         (``atom-lite``) while HA service names use underscores
         (``atom_lite_ble_get_info``), so we substitute before the lookup.
 
-        Probes each candidate ESP via ``ble_get_info`` to count paired vs
-        free bridge slots; falls back to a plain bridge count if the
-        probe times out or the ESP is offline.
+        Probes every slot of every candidate ESP at once via
+        ``ble_get_info`` to count paired vs free bridge slots; falls back
+        to a plain bridge count if the probe times out or the ESP is
+        offline. Opening the picker thus costs one probe timeout, however
+        many ESPHome nodes the house has.
         """
         # Slot-occupation counts use unicode markers (🔗 = paired slot,
         # 🟢 = empty slot) instead of English words so the picker reads
@@ -1675,6 +1771,8 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
             if (name := entry.data.get(CONF_ESP_DEVICE_NAME))
         }
 
+        # First pass: candidates and which of them can be probed at all.
+        candidates: list[tuple[Any, str, str, list[str], bool]] = []
         for entry in esphome_entries:
             # A disabled entry cannot serve as a bridge — offering it would
             # only fail later with a generic cannot_connect.
@@ -1695,7 +1793,10 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
             # probe timeout — fall through to the offline branch directly
             # (the ESP stays visible with the ⚪ marker by design).
             runtime = getattr(entry, "runtime_data", None)
-            if runtime is not None and getattr(runtime, "available", True) is False:
+            offline = (
+                runtime is not None and getattr(runtime, "available", True) is False
+            )
+            if offline:
                 if esp_service_id not in ours:
                     _LOGGER.debug(
                         "esp_select: skipping offline ESPHome entry '%s' "
@@ -1707,11 +1808,25 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
                     "esp_select: ESPHome entry '%s' is offline — skipping probe",
                     entry.title,
                 )
+            candidates.append(
+                (entry, device_name, esp_service_id, bridge_ids, offline)
+            )
+
+        # Probe all reachable ESPs concurrently (bounded per slot in
+        # _probe_bridge_info), then build the options in entry order.
+        probed = await asyncio.gather(
+            *(
+                self._probe_shaver_bridges(esp_service_id, bridge_ids)
+                for _, _, esp_service_id, bridge_ids, offline in candidates
+                if not offline
+            )
+        )
+        probed_iter = iter(probed)
+        for entry, device_name, esp_service_id, bridge_ids, offline in candidates:
+            if offline:
                 results = [(did, None) for did in bridge_ids]
             else:
-                results = await self._probe_shaver_bridges(
-                    esp_service_id, bridge_ids
-                )
+                results = next(probed_iter)
             self._probed_bridges[esp_service_id] = results
             self._probed_at[esp_service_id] = time.monotonic()
             infos = [info for _, info in results if info is not None]
@@ -1775,6 +1890,10 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         or no shaver-bridge response was received. Listening on
         ``esphome.philips_shaver_ble_status`` is the disambiguator versus
         a philips_sonicare bridge that happens to share service names.
+
+        Answers are shared between flows for _PROBE_CACHE_MAX_AGE unless
+        the slot changed since (see note_slot_changed). Probes run under
+        an integration-wide concurrency limit.
         """
         svc_name = f"{esp_device_name}_ble_get_info"
         if bridge_id:
@@ -1782,6 +1901,29 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         if not self.hass.services.has_service("esphome", svc_name):
             return None
 
+        key = (esp_device_name.lower(), bridge_id.lower())
+        probes = _shared_probes(self.hass)
+        if (hit := probes.get(key)) is not None:
+            probed_at, info = hit
+            if (
+                time.monotonic() - probed_at <= _PROBE_CACHE_MAX_AGE
+                and slot_changed_at(self.hass, esp_device_name, bridge_id)
+                <= probed_at
+            ):
+                return dict(info) if info is not None else None
+
+        async with _probe_limit(self.hass):
+            # Stamp the start: a slot change landing while we wait for the
+            # answer must still invalidate it.
+            started = time.monotonic()
+            info = await self._request_bridge_info(svc_name, bridge_id, timeout)
+        probes[key] = (started, info)
+        return dict(info) if info is not None else None
+
+    async def _request_bridge_info(
+        self, svc_name: str, bridge_id: str, timeout: float
+    ) -> dict[str, str] | None:
+        """One ble_get_info round-trip, uncached (see _probe_bridge_info)."""
         info_future: asyncio.Future[dict[str, str]] = self.hass.loop.create_future()
 
         @callback
@@ -2783,6 +2925,10 @@ class PhilipsShaverConfigFlow(ConfigFlow, domain=DOMAIN):
         identity_address = (
             result.get("identity_address") or result.get("mac") or ""
         )
+        # Shared slot probes taken before the bond are stale now.
+        note_slot_changed(
+            self.hass, self.fetched_esp_device_name, self.fetched_esp_bridge_id or ""
+        )
         _LOGGER.info(
             "Pairing succeeded on %s (slot %s): shaver %s is now bonded",
             self.fetched_esp_device_name,
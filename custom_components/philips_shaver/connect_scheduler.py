@@ -0,0 +1,181 @@
+# custom_components/philips_shaver/connect_scheduler.py
+"""Integration-wide admission of direct-BLE connects to adapter slots.
+
+Every BlueZ adapter and bluetooth_proxy can hold only a few connections
+at once (ESPHome proxies default to three). Each coordinator connects on
+its own wake, so several shavers waking together — a family's shavers
+coming off one charging shelf, or HA starting while all of them
+advertise — race for the same slots: the losers fail with "connection
+slot" errors and fall into the quick-retry loop, which takes slots from
+the winners' retries in turn.
+
+The scheduler queues connects per adapter instead. A connect is admitted
+while the adapter has a free slot, by priority (a shaver that was
+shaving goes before one on the charger) and first-come within one
+priority. An admitted connect holds its slot until its link ends, and
+releasing it admits the next one in line. Slots used by other devices
+are taken into account where habluetooth reports the adapter's
+allocations. Without that information the scheduler falls back to a
+fixed budget.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .exceptions import ConnectSlotUnavailable
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CONNECT_SCHEDULER = "philips_shaver_connect_scheduler"
+
+# Lower value = admitted first.
+PRIORITY_SHAVING = 0
+PRIORITY_WAKE = 1
+PRIORITY_CHARGING = 2
+
+# Slots assumed for an adapter that reports no allocations: the ESPHome
+# bluetooth_proxy default, and a safe floor for BlueZ adapters.
+DEFAULT_SLOT_BUDGET = 3
+# Slots may be freed by devices outside this integration, which release
+# nothing here — queued connects re-check the adapter this often.
+ADMIT_RECHECK_INTERVAL = 2.0
+# Give up waiting after this long. The coordinator then waits for the
+# next advertisement rather than retrying blind.
+ADMIT_TIMEOUT = 30.0
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    address: str = field(compare=False)
+    scanner: Any = field(compare=False)
+    admitted: asyncio.Event = field(compare=False, default_factory=asyncio.Event)
+
+
+class ConnectScheduler:
+    """Per-adapter slot budget and priority queue for connects."""
+
+    def __init__(self) -> None:
+        # adapter -> addresses holding a slot (connecting or connected)
+        self._holders: dict[str, set[str]] = {}
+        # address -> adapter of its slot
+        self._leases: dict[str, str] = {}
+        self._queues: dict[str, list[_Waiter]] = {}
+        self._seq = itertools.count()
+
+    def free_slots(self, adapter: str, scanner: Any = None) -> int:
+        """Slots on ``adapter`` a new connect may take right now."""
+        holders = self._holders.get(adapter, set())
+        try:
+            allocations = scanner.get_allocations() if scanner is not None else None
+        except Exception:  # noqa: BLE001 — treat as "not reported"
+            allocations = None
+        if allocations is None:
+            return DEFAULT_SLOT_BUDGET - len(holders)
+        # Admitted connects that are still being established are not in
+        # the adapter's allocation list yet, but will be shortly.
+        allocated = {a.upper() for a in allocations.allocated}
+        pending = sum(1 for a in holders if a not in allocated)
+        return allocations.free - pending
+
+    @callback
+    def _admit(self, adapter: str) -> None:
+        queue = self._queues.get(adapter)
+        while queue and self.free_slots(adapter, queue[0].scanner) > 0:
+            waiter = heapq.heappop(queue)
+            self._holders.setdefault(adapter, set()).add(waiter.address)
+            self._leases[waiter.address] = adapter
+            waiter.admitted.set()
+
+    async def async_acquire(
+        self, address: str, adapter: str, scanner: Any, priority: int
+    ) -> None:
+        """Wait for a slot on ``adapter``; raise ConnectSlotUnavailable on timeout.
+
+        The slot is held until :meth:`release` is called for ``address``.
+        """
+        address = address.upper()
+        # A new connect of the same shaver supersedes an old lease (e.g.
+        # a link that ended without its release).
+        self.release(address)
+        waiter = _Waiter(priority, next(self._seq), address, scanner)
+        queue = self._queues.setdefault(adapter, [])
+        heapq.heappush(queue, waiter)
+        self._admit(adapter)
+        if waiter.admitted.is_set():
+            return
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        _LOGGER.debug(
+            "%s: waiting for a connection slot on %s (%d queued)",
+            address, adapter, len(queue),
+        )
+        try:
+            while not waiter.admitted.is_set():
+                remaining = start + ADMIT_TIMEOUT - loop.time()
+                if remaining <= 0:
+                    raise ConnectSlotUnavailable(
+                        f"No free connection slot on {adapter} "
+                        f"after {ADMIT_TIMEOUT:.0f}s"
+                    )
+                try:
+                    await asyncio.wait_for(
+                        waiter.admitted.wait(),
+                        min(ADMIT_RECHECK_INTERVAL, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    self._admit(adapter)
+        except BaseException:
+            if waiter.admitted.is_set():
+                self.release(address)
+            else:
+                queue.remove(waiter)
+                heapq.heapify(queue)
+            raise
+        _LOGGER.debug(
+            "%s: connection slot on %s after %.1fs",
+            address, adapter, loop.time() - start,
+        )
+
+    @callback
+    def adopt(self, address: str, adapter: str) -> None:
+        """Count a link that was established outside the queue as holding a slot.
+
+        The config flow's probe connects on its own. Its link is handed to
+        the entry's transport (see probe_handoff) and holds its slot from
+        then on like an admitted connect.
+        """
+        address = address.upper()
+        self.release(address)
+        self._holders.setdefault(adapter, set()).add(address)
+        self._leases[address] = adapter
+
+    @callback
+    def release(self, address: str) -> None:
+        """Return the slot held by ``address`` and admit the next in line."""
+        address = address.upper()
+        if (adapter := self._leases.pop(address, None)) is None:
+            return
+        self._holders.get(adapter, set()).discard(address)
+        self._admit(adapter)
+
+    @callback
+    def holders(self, adapter: str) -> set[str]:
+        return set(self._holders.get(adapter, set()))
+
+
+@callback
+def async_get_connect_scheduler(hass: HomeAssistant) -> ConnectScheduler:
+    """The integration-wide scheduler, created on first use."""
+    if (scheduler := hass.data.get(DATA_CONNECT_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_CONNECT_SCHEDULER] = ConnectScheduler()
+    return scheduler
@@ -377,6 +377,16 @@ CHAR_CUSTOM_SHAVING_MODE_SETTINGS = "8d560330-3cb9-4387-a7e8-b79d826a7025"
 	Client Characteristic Configuration UUID: 0x2902
 """
 CHAR_PRESSURE = "8d56030c-3cb9-4387-a7e8-b79d826a7025"
+"""
+	Unknown Characteristic => pressure history
+	UUID: 8d560317-3cb9-4387-a7e8-b79d826a7025
+	Properties: READ
+	Value: 20 x 15-byte records (ring buffer, one per session):
+	verdict (UINT8), seconds at no/low/ok/high pressure (4 x UINT16),
+	average pressure (UINT16), timestamp (UINT32, device age)
+	Parsed by utils.iter_pressure_history.
+"""
+CHAR_HISTORY_PRESSURE_DATA = "8d560317-3cb9-4387-a7e8-b79d826a7025"
 
 # Motion type
 """
@@ -562,6 +572,15 @@ MIN_BRIDGE_VERSION = "1.8.0"
 # against those.
 BRIDGE_PIPELINED_READS_VERSION = "1.10.0"
 
+# Connection-parameter profiles of the bridge's ble_set_conn_profile service
+# (firmware >= 1.18.0). The coordinator picks one from what it is doing:
+# bulk for read batches and history sync, realtime while shaving, idle on
+# the charger, auto (the bridge's own burst boost) otherwise.
+CONN_PROFILE_AUTO = "auto"
+CONN_PROFILE_BULK = "bulk"
+CONN_PROFILE_REALTIME = "realtime"
+CONN_PROFILE_IDLE = "idle"
+
 # ── ESP bridge firmware update entity ────────────────────────────────────────
 # The latest available bridge firmware version is read straight from the repo
 # (same VERSION file the firmware bakes in at build time) so users are notified
@@ -585,6 +604,12 @@ MAX_NOTIFY_THROTTLE = 5000
 CONF_PIPELINED_READS = "pipelined_reads"
 DEFAULT_PIPELINED_READS = True
 
+# Developer option (advanced mode, direct BLE only): serve a capture from
+# scripts/shaver_scan.py --json/--fixture instead of the real shaver, with
+# an optional notification script (a JSON file, or "session").
+CONF_REPLAY_FIXTURE = "replay_fixture"
+CONF_REPLAY_SCRIPT = "replay_script"
+
 # Service UUID for each BLE service
 SVC_BATTERY = "0000180f-0000-1000-8000-00805f9b34fb"
 SVC_DEVICE_INFO = "0000180a-0000-1000-8000-00805f9b34fb"
@@ -633,6 +658,7 @@ CHAR_SERVICE_MAP: dict[str, str] = {
     CHAR_CAPABILITIES: SVC_CONTROL,
     CHAR_MOTION_TYPE: SVC_CONTROL,
     CHAR_PRESSURE: SVC_CONTROL,
+    CHAR_HISTORY_PRESSURE_DATA: SVC_CONTROL,
     CHAR_LIGHTRING_COLOR_LOW: SVC_CONTROL,
     CHAR_LIGHTRING_COLOR_OK: SVC_CONTROL,
     CHAR_LIGHTRING_COLOR_HIGH: SVC_CONTROL,
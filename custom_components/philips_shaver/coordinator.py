@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
@@ -20,15 +21,12 @@ from homeassistant.components.bluetooth import (
     async_register_callback,
 )
 
-try:
-    from dbus_fast.aio import MessageBus
-    from dbus_fast import BusType, Message, MessageType
-    HAS_DBUS_FAST = True
-except ImportError:
-    HAS_DBUS_FAST = False
-
 from .transport import BleakTransport, EspBridgeTransport, ShaverTransport
-from .exceptions import TransportError
+from .exceptions import ConnectSlotUnavailable, TransportError
+from .connect_scheduler import PRIORITY_CHARGING, PRIORITY_SHAVING, PRIORITY_WAKE
+from .probe_handoff import async_pop_probe
+from .session_stats import STORE_KEY as SESSION_STATS_STORE_KEY, SessionStatistics
+from .write_queue import STORE_KEY as WRITE_QUEUE_STORE_KEY, CharWriteQueue
 from .const import (
     DOMAIN,
     MIN_BRIDGE_VERSION,
@@ -49,6 +47,7 @@ from .const import (
     CHAR_HEAD_REMAINING_MINUTES,
     CHAR_HISTORY_AVG_CURRENT,
     CHAR_HISTORY_DURATION,
+    CHAR_HISTORY_PRESSURE_DATA,
     CHAR_HISTORY_RPM,
     CHAR_HISTORY_SYNC_STATUS,
     CHAR_HISTORY_TIMESTAMP,
@@ -86,6 +85,10 @@ from .const import (
     CONF_TRANSPORT_TYPE,
     TRANSPORT_ESP_BRIDGE,
     CONF_NOTIFY_THROTTLE,
+    CONN_PROFILE_AUTO,
+    CONN_PROFILE_BULK,
+    CONN_PROFILE_IDLE,
+    CONN_PROFILE_REALTIME,
     DEFAULT_NOTIFY_THROTTLE,
     POLL_READ_CHARS,
     LIVE_READ_CHARS,
@@ -93,11 +96,15 @@ from .const import (
     SHAVING_MODES,
 )
 from .utils import (
+    iter_pressure_history,
     parse_color,
     parse_shaving_settings_to_dict,
     parse_capabilities,
 )
 
+if TYPE_CHECKING:
+    from dbus_fast.aio import MessageBus
+
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 1
@@ -125,6 +132,18 @@ UNPERSISTED_KEYS = {
     "app_handle_settings_raw",
 }
 
+# Fast resume after a short link drop. The shaver drops its link about
+# once an hour and is back within ~0.3 s; re-running the full live read
+# batch (~35 reads) for that refreshes nothing the subscriptions haven't
+# already kept current. When the link was gone for at most
+# FAST_RESUME_MAX_GAP seconds and the last read batch is younger than
+# FAST_RESUME_MAX_DATA_AGE, live setup only restores the subscriptions
+# and re-reads the device state (the drop itself reset it to "off").
+# The data-age cap still lets every third hourly drop or so run the full
+# batch, refreshing the characteristics that are never notified.
+FAST_RESUME_MAX_GAP = 15.0
+FAST_RESUME_MAX_DATA_AGE = 3 * 3600
+
 # RGB tuples — JSON round-trips them as lists, so restore converts back.
 _COLOR_KEYS = ("color_low", "color_ok", "color_high", "color_motion")
 
@@ -147,6 +166,21 @@ def _has_reported_value(value: str | None) -> bool:
     return bool(cleaned) and any(c not in "0:" for c in cleaned)
 
 
+def _conn_profile_for(data: dict[str, Any] | None) -> str:
+    """Bridge connection profile for the shaver's state outside a transfer.
+
+    Shaving streams motor/pressure notifications that should reach HA
+    without a 245 ms interval in between; on the charger nothing happens
+    that needs a fast link. Anything else is left to the bridge.
+    """
+    state = (data or {}).get("device_state")
+    if state == "shaving":
+        return CONN_PROFILE_REALTIME
+    if state == "charging":
+        return CONN_PROFILE_IDLE
+    return CONN_PROFILE_AUTO
+
+
 def _storage_key(entry_id: str) -> str:
     return f"{DOMAIN}.{entry_id}"
 
@@ -197,6 +231,10 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self.address = entry.data.get("address") or entry.data.get(CONF_ESP_DEVICE_NAME, "unknown")
         self.transport = transport
+        # Settings writes from the entities (see write_queue).
+        self.writer = CharWriteQueue(self)
+        # Long-term statistics per shaving session (see session_stats).
+        self.session_stats = SessionStatistics(self)
 
         # reading capabilities
         cap_int = entry.data.get(CONF_CAPABILITIES, 0)
@@ -230,10 +268,30 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._live_task: asyncio.Task | None = None
         self._live_setup_done = False
         self._full_read_done = False
+        # Characteristics whose value in ``data`` came from the shaver on
+        # the current link (read or notified). Anything else may be a
+        # default or a value from before the shaver last slept.
+        self.received_chars: set[str] = set()
+        # Static characteristics the config flow's probe already read —
+        # left out of the first full read (see async_apply_probe_handoff).
+        self._probed_chars: set[str] = set()
         # transport.disconnect_count as of the last live setup — a later
         # mismatch means a disconnect/reconnect happened that the monitor
         # loop never observed (see _start_live_monitoring wait loop).
         self._setup_disconnect_count = 0
+        # Fast-resume bookkeeping (monotonic): when the link last dropped
+        # and when the last live read batch completed.
+        self._link_lost_at: float | None = None
+        self._last_read_batch_at: float | None = None
+        # device_state just before the link last dropped — the live value
+        # is reset to "off" on disconnect, but decides the queue position
+        # of the reconnect (see _connect_priority).
+        self._state_at_link_loss: str | None = None
+        # ESP bridge: repopulate from the bridge's last-value cache (see
+        # _async_restore_bridge_snapshot) on the first bridge connect of
+        # this HA run and again whenever the bridge comes back after
+        # having gone silent (API reconnect, ESP reboot).
+        self._snapshot_pending = self._is_esp_bridge
         self._dbus_bus: MessageBus | None = None
         # HA >= 2026.5 exposes async_clear_advertisement_history — preferred over
         # the BlueZ D-Bus RSSI listener for waking on static-ADV devices.
@@ -326,6 +384,8 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         stored = await self._store.async_load()
         if not stored:
             return
+        self.writer.restore_deferred(stored.pop(WRITE_QUEUE_STORE_KEY, None))
+        self.session_stats.restore(stored.pop(SESSION_STATS_STORE_KEY, None))
         restored = {k: v for k, v in stored.items() if k not in UNPERSISTED_KEYS}
         last_seen = restored.get("last_seen")
         if isinstance(last_seen, str):
@@ -341,6 +401,29 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "Restored %d stored values for %s", len(restored), self.address
         )
 
+    @callback
+    def async_apply_probe_handoff(self) -> None:
+        """Take over what the config flow's probe left for this entry.
+
+        Only the first setup after the flow finds anything. The probe's
+        static values go into the dataset (and with it the store) and are
+        skipped by the first full read. A direct-BLE probe link that is
+        still open becomes the transport's link, so the first live
+        connect needs no new connection.
+        """
+        handoff = async_pop_probe(self.hass, self.address)
+        if handoff is None:
+            return
+        if handoff.values:
+            self.data = self._process_results(handoff.values)
+            self._probed_chars = set(handoff.values)
+        adopted = self.transport.adopt_probe_link(handoff)
+        _LOGGER.debug(
+            "%s: setup probe handed over %d values%s",
+            self.address, len(handoff.values),
+            " and its open link" if adopted else "",
+        )
+
     @callback
     def async_set_updated_data(self, data: dict[str, Any]) -> None:
         """Publish new data and schedule a debounced save to disk."""
@@ -358,6 +441,10 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         }
         if isinstance(out.get("last_seen"), datetime):
             out["last_seen"] = out["last_seen"].isoformat()
+        if deferred := self.writer.deferred_for_store():
+            out[WRITE_QUEUE_STORE_KEY] = deferred
+        if sessions := self.session_stats.for_store():
+            out[SESSION_STATS_STORE_KEY] = sessions
         return out
 
     async def async_start(self) -> None:
@@ -371,8 +458,10 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # trigger wake immediately — the ADV callback may have fired with stale
             # cached RSSI (-127) which we filter, and habluetooth deduplicates
             # subsequent identical advertisements.
+            # A replayed capture never advertises; it is "awake" from the
+            # start.
             service_info = async_last_service_info(self.hass, self.address)
-            if service_info:
+            if service_info or self.transport.is_replay:
                 _LOGGER.info("Device already known at startup — triggering wake")
                 self._handle_wake()
         self._live_task = self.entry.async_create_background_task(
@@ -463,7 +552,12 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         RSSI changes with every packet due to signal fluctuation,
         so BlueZ emits PropertiesChanged even when the ADV payload is identical.
         """
-        if not HAS_DBUS_FAST:
+        # Imported here: only direct-BLE entries on a local BlueZ adapter
+        # (and HA < 2026.5) get this far.
+        try:
+            from dbus_fast import BusType, Message, MessageType
+            from dbus_fast.aio import MessageBus
+        except ImportError:
             _LOGGER.debug("dbus-fast not available — D-Bus RSSI listener disabled")
             return
 
@@ -711,6 +805,42 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return new_data
 
+    async def _async_restore_bridge_snapshot(self) -> None:
+        """Repopulate from the ESP bridge's last-value cache.
+
+        The bridge keeps the newest value of every characteristic it saw
+        (firmware >= 1.16.0), so after an HA restart or an API reconnect
+        the entities can be brought up to date with one service call
+        instead of waiting for the shaver to wake for a full read batch.
+        While the shaver is not connected the cached live-session values
+        are stale by definition (see UNPERSISTED_KEYS) and are left out.
+        """
+        self._snapshot_pending = False
+        snapshot = await self.transport.get_snapshot()
+        if not snapshot:
+            return
+        shaver_connected = self.transport.is_connected
+        old = self.data or {}
+        new_data = self._process_results(
+            {uuid: value for uuid, (value, _age) in snapshot.items()}
+        )
+        if not shaver_connected:
+            for key in UNPERSISTED_KEYS:
+                if key in old:
+                    new_data[key] = old[key]
+                else:
+                    new_data.pop(key, None)
+        # The values are as old as the newest of them, not "now".
+        newest = min(age for _value, age in snapshot.values())
+        seen = datetime.now(timezone.utc) - timedelta(seconds=newest)
+        last = old.get("last_seen")
+        new_data["last_seen"] = seen if last is None or seen > last else last
+        _LOGGER.debug(
+            "%s: restored %d values from the bridge cache (newest %.0fs old)",
+            self.address, len(snapshot), newest,
+        )
+        self.async_set_updated_data(new_data)
+
     def _update_device_registry(self, data: dict[str, Any]) -> None:
         """Update device registry when model, firmware, serial or hardware changed."""
         model = data.get("model_number")
@@ -808,12 +938,27 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             _LOGGER.info("%s: disconnected", self.address)
                             # Clear state so Activity shows "off"
                             if self.data:
+                                self._state_at_link_loss = self.data.get(
+                                    "device_state"
+                                )
                                 self.data["device_state"] = "off"
                                 self.data.pop("_connecting", None)
                             # ADVs seen before the drop no longer prove the
                             # device is awake — require a fresh ADV to
                             # reconnect (see _adv_wake).
                             self._adv_wake = False
+                            self.received_chars.clear()
+                            self._link_lost_at = time.monotonic()
+                            if self._is_esp_bridge:
+                                if not self.transport.is_bridge_alive:
+                                    self._snapshot_pending = True
+                                elif self._snapshot_pending:
+                                    # Bridge back, shaver still asleep.
+                                    self.entry.async_create_background_task(
+                                        self.hass,
+                                        self._async_restore_bridge_snapshot(),
+                                        f"{DOMAIN}_snapshot_{self.address}",
+                                    )
                             # Wake the loop so it observes the disconnect
                             # before the device reconnects (~0.3 s on the
                             # shaver's hourly link drop) — otherwise the
@@ -825,7 +970,10 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self.transport.set_disconnect_callback(_on_state_change)
 
                     _LOGGER.info("Establishing live connection to %s...", self.address)
+                    self.transport.set_connect_priority(self._connect_priority())
                     await self.transport.connect()
+                    if self._is_esp_bridge and self._snapshot_pending:
+                        await self._async_restore_bridge_snapshot()
 
                     # ESP bridge: wait for BLE device to actually connect
                     if self._is_esp_bridge and not self.transport.is_connected:
@@ -853,14 +1001,41 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             self.transport.disconnect_count
                         )
 
+                    # Settings changed while the shaver slept go out
+                    # first. The flush reads what it writes, so those
+                    # characteristics drop out of the read batch.
+                    flushed: dict[str, bytes] = {}
+                    if self.writer.has_deferred:
+                        flushed = await self.writer.async_flush_deferred()
+
                     # Read characteristics first, then subscribe.
                     # First connect: read ALL chars (incl. static data like
-                    # model, firmware). Subsequent: dynamic only.
-                    chars_to_read = (
-                        self._poll_chars
-                        if not self._full_read_done
-                        else self._live_chars
-                    )
+                    # model, firmware). Subsequent: dynamic only — or just
+                    # the device state when fast-resuming a short drop.
+                    fast_resume = self._can_fast_resume()
+                    if not self._full_read_done:
+                        chars_to_read = [
+                            c for c in self._poll_chars
+                            if c not in self._probed_chars
+                        ]
+                        self._probed_chars = set()
+                    elif fast_resume:
+                        chars_to_read = [
+                            c for c in self._live_chars if c == CHAR_DEVICE_STATE
+                        ]
+                        _LOGGER.info(
+                            "%s: link back after a short drop — fast resume, "
+                            "skipping the read batch",
+                            self.address,
+                        )
+                    else:
+                        chars_to_read = self._live_chars
+                    chars_to_read = [c for c in chars_to_read if c not in flushed]
+
+                    if not fast_resume:
+                        # Read batch and subscribe burst: ask for a fast
+                        # link until live monitoring is up (see below).
+                        await self.transport.set_conn_profile(CONN_PROFILE_BULK)
 
                     if self._is_esp_bridge:
                         # Batch through read_chars: pipelined via
@@ -883,12 +1058,16 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                                 )
 
                     # For ESP bridge: if ALL reads failed, bridge is not ready
-                    if self._is_esp_bridge:
+                    if self._is_esp_bridge and chars_to_read:
                         if not any(v is not None for v in results.values()):
                             raise TransportError(
                                 "No characteristics could be read – bridge may not be ready"
                             )
 
+                    results = {**flushed, **results}
+                    self.received_chars.update(
+                        uuid for uuid, value in results.items() if value is not None
+                    )
                     if any(v is not None for v in results.values()):
                         new_data = self._process_results(results)
                         new_data.pop("_connecting", None)
@@ -900,16 +1079,27 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                                 "%s: full initial data read complete (%d chars)",
                                 self.address, len(results),
                             )
-                        else:
+                        elif not fast_resume:
                             _LOGGER.info("%s: initial data read complete", self.address)
-
-                    # Subscribe to notifications after reads
-                    sub_count = await self._start_all_notifications()
+                        if not fast_resume:
+                            self._last_read_batch_at = time.monotonic()
+
+                    # Subscribe to notifications after reads. A fast-resumed
+                    # bridge link needs no calls at all: the bridge restores
+                    # its own subscriptions on reconnect, and our callbacks
+                    # were kept across the drop (see the finally below).
+                    if fast_resume and self._is_esp_bridge:
+                        sub_count = len(self._notify_chars)
+                    else:
+                        sub_count = await self._start_all_notifications()
                     if sub_count == 0:
                         raise TransportError("No notifications could be subscribed")
                     self._live_setup_done = True
                     if self.data:
                         self.data.pop("_connecting", None)
+                    await self.transport.set_conn_profile(
+                        _conn_profile_for(self.data)
+                    )
                     _LOGGER.info("%s: live monitoring active (%d subscriptions)", self.address, sub_count)
 
                     if self._is_esp_bridge:
@@ -938,7 +1128,12 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     except Exception:
                         pass
 
-                    if not self._is_esp_bridge:
+                    if isinstance(err, ConnectSlotUnavailable):
+                        # Already queued for a slot for ADMIT_TIMEOUT —
+                        # retrying now would only queue again. Wait for
+                        # the next advertisement instead.
+                        pass
+                    elif not self._is_esp_bridge:
                         # Direct BLE: quick retries, then wait for ADV
                         for attempt in range(MAX_QUICK_RETRIES):
                             await asyncio.sleep(5)
@@ -976,6 +1171,9 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     ):
                         self.transport.acknowledge_resubscribe()
                         _LOGGER.info("ESP bridge rebooted — forcing re-setup")
+                        # The reboot took the bridge's subscriptions with
+                        # it — never fast-resume from here.
+                        self._link_lost_at = None
                         break
                     # A disconnect we never saw as is_connected == False:
                     # the device dropped and reconnected between two wakes
@@ -1004,9 +1202,51 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.error("Unexpected error in live monitoring: %s", err)
             finally:
                 self._live_setup_done = False
-                await self.transport.unsubscribe_all()
+                # Keep the subscriptions when the next setup may fast-resume:
+                # the bridge restores them by itself on reconnect, and an
+                # unsubscribe here would undo that (direct BLE has nothing
+                # to clean up either way).
+                if not self._fast_resume_possible():
+                    await self.transport.unsubscribe_all()
                 _LOGGER.info("%s: live connection ended", self.address)
 
+    def _connect_priority(self) -> int:
+        """Queue position of the next connect when adapter slots are short.
+
+        A shaver that dropped out of a shave goes first, one on the
+        charger last; a plain wake (state unknown) sits in between.
+        """
+        state = self._state_at_link_loss or (self.data or {}).get("device_state")
+        if state == "shaving":
+            return PRIORITY_SHAVING
+        if state == "charging":
+            return PRIORITY_CHARGING
+        return PRIORITY_WAKE
+
+    def _fast_resume_possible(self) -> bool:
+        """Whether a recent link drop may still be resumed without reads."""
+        return (
+            self._full_read_done
+            and self._link_lost_at is not None
+            and self._last_read_batch_at is not None
+            and time.monotonic() - self._last_read_batch_at
+            <= FAST_RESUME_MAX_DATA_AGE
+        )
+
+    def _can_fast_resume(self) -> bool:
+        """Decide (once per drop) whether live setup may skip the read batch.
+
+        True when the link was back within FAST_RESUME_MAX_GAP and the
+        last read batch is recent enough. A bridge that lost its
+        subscriptions (reboot, or our callbacks are gone) always gets the
+        full setup.
+        """
+        possible = self._fast_resume_possible()
+        lost_at, self._link_lost_at = self._link_lost_at, None
+        if not possible or time.monotonic() - lost_at > FAST_RESUME_MAX_GAP:
+            return False
+        return not (self._is_esp_bridge and self.transport.needs_resubscribe)
+
     def _make_live_callback(self):
         """Create a single notification callback for all subscribed characteristics."""
 
@@ -1015,6 +1255,8 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not data:
                 return
 
+            self.received_chars.add(char_uuid)
+            old_state = (self.data or {}).get("device_state")
             new_data = self._process_results({char_uuid: data})
             new_data.pop("_connecting", None)
             self._update_device_registry(new_data)
@@ -1022,6 +1264,15 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if new_data == self.data:
                 return  # nothing changed
 
+            if self._live_setup_done and new_data.get("device_state") != old_state:
+                # Shaving started/stopped, or the shaver went on or off the
+                # charger — follow with the connection profile.
+                self.entry.async_create_background_task(
+                    self.hass,
+                    self.transport.set_conn_profile(_conn_profile_for(new_data)),
+                    f"{DOMAIN}_conn_profile_{self.address}",
+                )
+
             self.async_set_updated_data(new_data)
 
         return _callback
@@ -1060,8 +1311,11 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
            c. Read avg current (UINT16)
            d. Read RPM (UINT16)
            e. Write 0 to sync status → advance to next record
+        3. Pressure-capable handles: read the pressure history (0x0317)
+           on the same connection, see _read_pressure_history
         """
         sessions: list[dict[str, Any]] = []
+        pressure_history: list[dict[str, Any]] | None = None
 
         async with self._connection_lock:
             was_connected = self.transport.is_connected
@@ -1069,13 +1323,22 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             try:
                 if not was_connected:
                     await self.transport.connect()
+                # One read per field and record — several dozen round-trips.
+                await self.transport.set_conn_profile(CONN_PROFILE_BULK)
 
                 # Step 1: Read sync status → number of sessions available
                 raw = await self.transport.read_char(CHAR_HISTORY_SYNC_STATUS)
                 session_count = raw[0] if raw else 0
                 _LOGGER.info("History: %d sessions available", session_count)
 
+                # Before the cursor walk: an empty session list must not
+                # skip it, and a failed advance below breaks out early.
+                pressure_history = await self._read_pressure_history()
+
                 if session_count == 0:
+                    if pressure_history is not None:
+                        self.data["pressure_history"] = pressure_history
+                        self.async_set_updated_data(self.data)
                     return sessions
 
                 # Step 2: Read each session
@@ -1132,6 +1395,7 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except Exception as err:
                 _LOGGER.error("History fetch error: %s", err)
             finally:
+                await self.transport.set_conn_profile(_conn_profile_for(self.data))
                 if not was_connected:
                     try:
                         await self.transport.disconnect()
@@ -1140,10 +1404,43 @@ class PhilipsShaverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Store in coordinator data for access by sensors/frontend
         self.data["history_sessions"] = sessions
+        if pressure_history is not None:
+            self.data["pressure_history"] = pressure_history
         self.async_set_updated_data(self.data)
 
         return sessions
 
+    async def _read_pressure_history(self) -> list[dict[str, Any]] | None:
+        """Read and decode the pressure history blob (0x0317).
+
+        One long read returns the whole 20-slot ring buffer (300 bytes); it
+        is decoded in a single pass straight off the transport's buffer.
+        Slots the handle never wrote carry a zero timestamp and are
+        dropped; the rest are returned oldest first, since the ring's
+        write position says nothing about age. ``None`` when the device
+        has no pressure sensor or the read failed — the caller then keeps
+        the previously downloaded history.
+        """
+        if not self.capabilities.pressure or (
+            self.available_services
+            and CHAR_SERVICE_MAP[CHAR_HISTORY_PRESSURE_DATA].lower()
+            not in self.available_services
+        ):
+            return None
+        try:
+            raw = await self.transport.read_char(CHAR_HISTORY_PRESSURE_DATA)
+        except Exception as e:
+            _LOGGER.debug("History: failed to read pressure history: %s", e)
+            return None
+        if not raw:
+            return None
+        records = sorted(
+            (r for r in iter_pressure_history(raw) if r["timestamp"]),
+            key=lambda r: r["timestamp"],
+        )
+        _LOGGER.info("History: %d pressure records", len(records))
+        return records
+
     @property
     def adapter_type(self) -> str:
         """Classify the active BLE transport.
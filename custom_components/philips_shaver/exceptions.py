@@ -23,3 +23,7 @@ class DeviceAsleepException(PhilipsShaverException):
 
 class TransportError(PhilipsShaverException):
     """Transport-level communication error."""
+
+
+class ConnectSlotUnavailable(TransportError):
+    """No connection slot on the adapter became free in time."""
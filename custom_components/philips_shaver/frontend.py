@@ -12,34 +12,162 @@ If a leftover standalone installation of the card is still registered as a
 Lovelace resource, a repair issue asks the user to remove it: both copies
 register the same custom element and the first one to load wins, so a stale
 standalone copy would silently shadow the bundled card.
+
+The resource points at a content-hashed URL (``CardView``): a new card gets
+a new URL, so the response can be cached as immutable and clients never
+revalidate. The card is about 95 KB, which matters on slow links and Cast
+devices; it is served from memory in the best encoding the client accepts.
+``scripts/sync_card.sh`` builds the gzip (and, with the brotli CLI, brotli)
+variant next to the bundle. A variant that does not decode to the bundle is
+ignored, and without a gzip variant one is made at startup.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
+import gzip
+import hashlib
 import logging
 from pathlib import Path
 
+from aiohttp import hdrs, web
+
 from homeassistant.components.frontend import add_extra_js_url
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.components.http import HomeAssistantView, StaticPathConfig
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import issue_registry as ir
-from homeassistant.loader import async_get_integration
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 CARD_FILENAME = "philips_shaver_card.js"
+WWW_DIR = Path(__file__).parent / "www"
 STATIC_PATH = "/philips_shaver_static"
+# The unhashed URL, still served for hand-made resources and old caches.
 CARD_URL = f"{STATIC_PATH}/{CARD_FILENAME}"
+# Prefix of the hashed URLs; kept apart from STATIC_PATH, whose static
+# resource would otherwise answer them with a 404.
+CARD_ASSET_PATH = "/philips_shaver_card"
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
 ISSUE_STANDALONE_CARD = "standalone_card_installed"
 DATA_EXTRA_JS_ADDED = f"{DOMAIN}_extra_js_added"
+DATA_CARD_ASSET = f"{DOMAIN}_card_asset"
+
+
+@dataclass(frozen=True)
+class CardAsset:
+    """The card bundle as served: its content hash and encoded bodies."""
+
+    digest: str
+    # Body per Content-Encoding; "identity" is always present.
+    bodies: dict[str, bytes]
+
+    @property
+    def url(self) -> str:
+        return f"{CARD_ASSET_PATH}/{self.digest}/{CARD_FILENAME}"
+
+
+def _brotli_decompress(data: bytes) -> bytes | None:
+    try:
+        import brotli  # noqa: PLC0415 — optional, only aiohttp[speedups] has it
+    except ImportError:
+        return None
+    return brotli.decompress(data)
+
+
+def _prebuilt_variant(path: Path, raw: bytes, decompress) -> bytes | None:
+    """A build-time variant of the bundle, if it still matches the bundle."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        decoded = decompress(data)
+    except Exception:  # noqa: BLE001 — a corrupt variant is just skipped
+        decoded = b""
+    if decoded is None:  # no decoder installed
+        return None
+    if decoded != raw:
+        _LOGGER.warning(
+            "%s does not match %s — rebuild it with scripts/sync_card.sh",
+            path.name, CARD_FILENAME,
+        )
+        return None
+    return data
+
+
+def load_card_asset(www_dir: Path = WWW_DIR) -> CardAsset:
+    """Read and hash the bundle with its compressed variants (blocking)."""
+    raw = (www_dir / CARD_FILENAME).read_bytes()
+    bodies: dict[str, bytes] = {}
+    if br := _prebuilt_variant(
+        www_dir / f"{CARD_FILENAME}.br", raw, _brotli_decompress
+    ):
+        bodies["br"] = br
+    bodies["gzip"] = _prebuilt_variant(
+        www_dir / f"{CARD_FILENAME}.gz", raw, gzip.decompress
+    ) or gzip.compress(raw, compresslevel=9, mtime=0)
+    bodies["identity"] = raw
+    return CardAsset(hashlib.sha256(raw).hexdigest()[:16], bodies)
+
+
+async def _async_get_card_asset(hass: HomeAssistant) -> CardAsset:
+    if (asset := hass.data.get(DATA_CARD_ASSET)) is None:
+        asset = hass.data[DATA_CARD_ASSET] = await hass.async_add_executor_job(
+            load_card_asset
+        )
+    return asset
+
+
+class CardView(HomeAssistantView):
+    """Serve the card under its content hash, precompressed and immutable."""
+
+    url = f"{CARD_ASSET_PATH}/{{digest}}/{CARD_FILENAME}"
+    name = f"{DOMAIN}:card"
+    requires_auth = False
+
+    def __init__(self, asset: CardAsset) -> None:
+        self._asset = asset
+
+    async def get(self, request: web.Request, digest: str) -> web.Response:
+        asset = self._asset
+        accepted = {
+            part.split(";")[0].strip().lower()
+            for part in request.headers.get(hdrs.ACCEPT_ENCODING, "").split(",")
+        }
+        encoding = next(
+            (enc for enc in asset.bodies if enc in accepted), "identity"
+        )
+        headers = {
+            # A stale hash (a dashboard loaded before an update) gets the
+            # current card, but must not pin it under the old URL.
+            hdrs.CACHE_CONTROL: (
+                IMMUTABLE_CACHE if digest == asset.digest else "no-cache"
+            ),
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        if encoding != "identity":
+            headers[hdrs.CONTENT_ENCODING] = encoding
+        return web.Response(
+            body=asset.bodies[encoding],
+            content_type="text/javascript",
+            headers=headers,
+        )
+
+
+def _is_card_url(url: str | None) -> bool:
+    """Our card under either URL (hashed or not), any query string."""
+    path = (url or "").split("?")[0]
+    return path == CARD_URL or (
+        path.startswith(f"{CARD_ASSET_PATH}/") and path.endswith(f"/{CARD_FILENAME}")
+    )
 
 
 async def async_register_card(hass: HomeAssistant) -> None:
     """Serve the bundled card and load it on every dashboard."""
-    www_dir = Path(__file__).parent / "www"
+    hass.http.register_view(CardView(await _async_get_card_asset(hass)))
     await hass.http.async_register_static_paths(
-        [StaticPathConfig(STATIC_PATH, str(www_dir), cache_headers=True)]
+        [StaticPathConfig(STATIC_PATH, str(WWW_DIR), cache_headers=True)]
     )
     await async_ensure_card_resource(hass)
     await _async_check_standalone_card(hass)
@@ -52,17 +180,16 @@ async def async_ensure_card_resource(hass: HomeAssistant) -> None:
     last entry deletes the resource, and re-adding one later must bring it
     back without a restart (``async_setup`` only runs once per HA run).
     """
-    integration = await async_get_integration(hass, DOMAIN)
-    # Version query defeats the browser cache when the integration updates.
-    versioned_url = f"{CARD_URL}?v={integration.version}"
+    # The content hash changes the URL whenever the card does.
+    card_url = (await _async_get_card_asset(hass)).url
 
-    if await _async_register_resource(hass, versioned_url):
+    if await _async_register_resource(hass, card_url):
         return
 
     # YAML-mode resources (read-only) or no Lovelace resource registry —
     # inject the module into the app shell instead (once per HA run).
     if not hass.data.get(DATA_EXTRA_JS_ADDED):
-        add_extra_js_url(hass, versioned_url)
+        add_extra_js_url(hass, card_url)
         hass.data[DATA_EXTRA_JS_ADDED] = True
 
 
@@ -73,7 +200,7 @@ async def async_remove_card_resource(hass: HomeAssistant) -> None:
         return
     try:
         for item in list(resources.async_items()):
-            if (item.get("url") or "").split("?")[0] == CARD_URL:
+            if _is_card_url(item.get("url")):
                 await resources.async_delete_item(item["id"])
                 _LOGGER.info("Removed Lovelace resource %s", item["url"])
     except Exception:  # noqa: BLE001 - cleanup must never block removal
@@ -100,7 +227,7 @@ async def _async_get_resources(hass: HomeAssistant):
     return resources
 
 
-async def _async_register_resource(hass: HomeAssistant, versioned_url: str) -> bool:
+async def _async_register_resource(hass: HomeAssistant, card_url: str) -> bool:
     """Upsert the card into the Lovelace resource registry (storage mode).
 
     Returns True when the resource is registered (created, updated, or
@@ -113,24 +240,22 @@ async def _async_register_resource(hass: HomeAssistant, versioned_url: str) -> b
 
     try:
         ours = [
-            item
-            for item in resources.async_items()
-            if (item.get("url") or "").split("?")[0] == CARD_URL
+            item for item in resources.async_items() if _is_card_url(item.get("url"))
         ]
         if not ours:
             await resources.async_create_item(
-                {"res_type": "module", "url": versioned_url}
+                {"res_type": "module", "url": card_url}
             )
-            _LOGGER.info("Registered Lovelace resource %s", versioned_url)
+            _LOGGER.info("Registered Lovelace resource %s", card_url)
             return True
 
         first, *duplicates = ours
-        if first["url"] != versioned_url:
+        if first["url"] != card_url:
             await resources.async_update_item(
-                first["id"], {"res_type": "module", "url": versioned_url}
+                first["id"], {"res_type": "module", "url": card_url}
             )
             _LOGGER.info(
-                "Updated Lovelace resource %s -> %s", first["url"], versioned_url
+                "Updated Lovelace resource %s -> %s", first["url"], card_url
             )
         # A manually added workaround entry plus ours, or repeated manual
         # adds: the card only needs to load once.
@@ -155,7 +280,7 @@ async def _async_check_standalone_card(hass: HomeAssistant) -> None:
         item.get("url")
         for item in resources.async_items()
         if CARD_FILENAME in (item.get("url") or "")
-        and STATIC_PATH not in item["url"]
+        and not _is_card_url(item["url"])
     ]
 
     if standalone_urls:
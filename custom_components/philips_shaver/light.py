@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -107,37 +106,25 @@ class PhilipsColorConfigLight(PhilipsShaverEntity, LightEntity):
         # Unique ID keeps HA happy
         self._attr_unique_id = f"{self._device_id}_{uuid}"
 
-        # Default color until read (future improvement)
-        key = {
+        self._key = {
             CHAR_LIGHTRING_COLOR_LOW: "color_low",
             CHAR_LIGHTRING_COLOR_OK: "color_ok",
             CHAR_LIGHTRING_COLOR_HIGH: "color_high",
             CHAR_LIGHTRING_COLOR_MOTION: "color_motion",
         }[uuid]
-        self._rgb = self.coordinator.data.get(key) or LIGHTRING_DEFAULT_COLORS[uuid]
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Called automatically on every coordinator update."""
-        key_map = {
-            CHAR_LIGHTRING_COLOR_LOW: "color_low",
-            CHAR_LIGHTRING_COLOR_OK: "color_ok",
-            CHAR_LIGHTRING_COLOR_HIGH: "color_high",
-            CHAR_LIGHTRING_COLOR_MOTION: "color_motion",
-        }
-        key = key_map.get(self._uuid)
-        if key:
-            rgb = self.coordinator.data.get(key)
-            if rgb and rgb != self._rgb:
-                self._rgb = rgb
-        self.async_write_ha_state()
 
     # ------------------------------------------------------------------
     # Current RGB value shown in the UI
     # ------------------------------------------------------------------
     @property
     def rgb_color(self) -> tuple[int, int, int]:
-        return self._rgb
+        # Straight from the coordinator data, which carries the optimistic
+        # color during a write and the confirmed one after a failed write.
+        # The default shows until the color was read.
+        return (
+            self.coordinator.data.get(self._key)
+            or LIGHTRING_DEFAULT_COLORS[self._uuid]
+        )
 
     @property
     def is_on(self):
@@ -152,14 +139,6 @@ class PhilipsColorConfigLight(PhilipsShaverEntity, LightEntity):
     # ------------------------------------------------------------------
     async def async_turn_on(self, **kwargs) -> None:
         """Set new RGB color on the shaver."""
-        if not self.coordinator.transport.is_connected:
-            _LOGGER.warning(
-                "Shaver not connected – cannot write color %s (%s)",
-                self._attr_translation_key,
-                self._uuid,
-            )
-            return
-
         if "rgb_color" not in kwargs:
             return
 
@@ -168,37 +147,24 @@ class PhilipsColorConfigLight(PhilipsShaverEntity, LightEntity):
         # Philips expects RGBA with last byte = 0xFF
         payload = bytes([r, g, b, 0xFF])
 
+        # A color picker drag fires a call per step: the writer shows each
+        # color at once and only puts the latest one on the air. While the
+        # shaver sleeps the color waits for the next connect. No base: the
+        # stored color may still be the default, never read from the shaver.
         try:
-            await self.coordinator.transport.write_char(self._uuid, payload)
-            _LOGGER.info(
-                "Color %s set to (%d, %d, %d) → characteristic %s",
-                self._attr_translation_key,
-                r,
-                g,
-                b,
-                self._uuid,
-            )
+            if await self.coordinator.writer.async_write(
+                self._uuid, payload, optimistic={self._key: (r, g, b)}
+            ):
+                _LOGGER.info(
+                    "Color %s set to (%d, %d, %d) → characteristic %s",
+                    self._attr_translation_key,
+                    r,
+                    g,
+                    b,
+                    self._uuid,
+                )
         except Exception as e:
             _LOGGER.error("Failed to write color %s: %s", self._attr_translation_key, e)
-            return
-
-        # Update coordinator data immediately after successful write
-        key_map = {
-            CHAR_LIGHTRING_COLOR_LOW: "color_low",
-            CHAR_LIGHTRING_COLOR_OK: "color_ok",
-            CHAR_LIGHTRING_COLOR_HIGH: "color_high",
-            CHAR_LIGHTRING_COLOR_MOTION: "color_motion",
-        }
-        key = key_map[self._uuid]
-
-        new_data = self.coordinator.data.copy()
-        new_data[key] = (r, g, b)
-        new_data["last_seen"] = datetime.now(timezone.utc)
-
-        self.coordinator.async_set_updated_data(new_data)
-
-        # Update local cache for rgb_color property
-        self._rgb = (r, g, b)
 
     # ------------------------------------------------------------------
     # Turning off has no meaning for this type of configuration light
@@ -0,0 +1,221 @@
+# custom_components/philips_shaver/path_stats.py
+"""Learned connect performance per connection path.
+
+habluetooth routes every connect through the scanner with the best
+RSSI-based score. Signal strength says nothing about how busy a scanner
+is, though: a bluetooth_proxy that is also serving a dozen other devices
+can be the strongest path and still take several seconds per connect, or
+time out outright, while a slightly weaker local adapter connects in
+about one second.
+
+This module records, per shaver address and scanner source, how connects
+over that path went: attempts, successes, and a moving average of the time
+it took. From that it derives an expected time-to-connection that also
+prices in failed attempts, and decides when the learned figures justify
+overriding habluetooth's choice. The history is persisted integration-wide
+(one Store for all entries), because scanners are shared between shavers
+and a restart should not wipe what was learned.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PATH_STATS = "philips_shaver_path_stats"
+DATA_PATH_STATS_LOAD = "philips_shaver_path_stats_load"
+
+STORAGE_KEY = f"{DOMAIN}.path_stats"
+STORAGE_VERSION = 1
+# Connects are rare (a handful per hour at most); a debounced write is
+# only there to coalesce the retries of one establish_connection.
+STORAGE_SAVE_DELAY = 30
+
+# Weight of the newest sample in the latency averages.
+EWMA_ALPHA = 0.3
+# Time charged for a failed attempt before one has been measured:
+# BleakTransport's establish_connection timeout.
+DEFAULT_FAILURE_COST = 15.0
+# Counters are halved past this many attempts so old behaviour fades out
+# (a proxy that was busy last month may be idle now).
+MAX_ATTEMPTS_WINDOW = 20
+# Attempts a path needs before its figures may override habluetooth.
+MIN_ATTEMPTS_TO_PIN = 3
+# A learned path only displaces habluetooth's pick when it is expected to
+# be this much faster — small differences are noise, and the RSSI choice
+# has the better view of the current radio conditions.
+PIN_MARGIN = 1.5
+# Paths not used for this long are dropped on load.
+MAX_RECORD_AGE = 30 * 86400
+
+
+@dataclass
+class PathRecord:
+    """Connect history of one scanner for one shaver."""
+
+    attempts: int = 0
+    successes: int = 0
+    # Moving averages in seconds; None until a sample of that kind exists.
+    connect_s: float | None = None
+    failure_s: float | None = None
+    # Wall-clock time of the last attempt (for ageing out).
+    last_attempt: float = 0.0
+
+    def record(self, ok: bool, elapsed: float) -> None:
+        """Fold one connect attempt into the history."""
+        if self.attempts >= MAX_ATTEMPTS_WINDOW:
+            self.attempts //= 2
+            self.successes //= 2
+        self.attempts += 1
+        if ok:
+            self.successes += 1
+            self.connect_s = _ewma(self.connect_s, elapsed)
+        else:
+            self.failure_s = _ewma(self.failure_s, elapsed)
+        self.last_attempt = time.time()
+
+    @property
+    def success_rate(self) -> float | None:
+        return self.successes / self.attempts if self.attempts else None
+
+    @property
+    def expected_s(self) -> float | None:
+        """Expected seconds until a connection stands on this path.
+
+        Retries until success are geometric: with success probability p,
+        1/p - 1 failed attempts precede the successful one on average.
+        p is Laplace-smoothed so a single failure does not make a path
+        look infinitely slow; a path that never connected is priced at
+        its failure cost.
+        """
+        if not self.attempts:
+            return None
+        p = (self.successes + 1) / (self.attempts + 2)
+        failure = self.failure_s if self.failure_s is not None else DEFAULT_FAILURE_COST
+        success = self.connect_s if self.connect_s is not None else failure
+        return success + failure * (1 - p) / p
+
+
+def _ewma(previous: float | None, sample: float) -> float:
+    if previous is None:
+        return sample
+    return previous + EWMA_ALPHA * (sample - previous)
+
+
+class ConnectPathStats:
+    """Integration-wide connect history, keyed by shaver address and scanner source."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._paths: dict[str, dict[str, PathRecord]] = {}
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load() or {}
+        cutoff = time.time() - MAX_RECORD_AGE
+        for address, sources in stored.get("paths", {}).items():
+            for source, raw in sources.items():
+                try:
+                    record = PathRecord(**raw)
+                except TypeError:
+                    continue  # written by a different layout — relearn
+                if record.last_attempt >= cutoff:
+                    self._paths.setdefault(address, {})[source] = record
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "paths": {
+                address: {source: asdict(r) for source, r in sources.items()}
+                for address, sources in self._paths.items()
+            }
+        }
+
+    @callback
+    def record(self, address: str, source: str, ok: bool, elapsed: float) -> None:
+        """Record one connect attempt over ``source``."""
+        address = address.upper()
+        record = self._paths.setdefault(address, {}).setdefault(source, PathRecord())
+        record.record(ok, elapsed)
+        _LOGGER.debug(
+            "%s: connect via %s %s after %.1fs (%d/%d ok, expected %.1fs)",
+            address, source, "succeeded" if ok else "failed", elapsed,
+            record.successes, record.attempts, record.expected_s or 0.0,
+        )
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def get(self, address: str, source: str) -> PathRecord | None:
+        return self._paths.get(address.upper(), {}).get(source)
+
+    @callback
+    def preferred_source(
+        self, address: str, candidates: list[str], default: str | None
+    ) -> str | None:
+        """Source to pin the next connect to, or None to let habluetooth pick.
+
+        ``candidates`` are the connectable scanners currently seeing the
+        shaver, ``default`` the one habluetooth would choose. A candidate
+        is pinned only when it has enough history and beats the default's
+        expected time by PIN_MARGIN — or the default has never been tried
+        while the candidate has a good record.
+        """
+        best: tuple[float, str] | None = None
+        for source in candidates:
+            record = self.get(address, source)
+            if record is None or record.attempts < MIN_ATTEMPTS_TO_PIN:
+                continue
+            expected = record.expected_s
+            if expected is not None and (best is None or expected < best[0]):
+                best = (expected, source)
+        if best is None or best[1] == default:
+            return None
+        default_record = self.get(address, default) if default else None
+        default_expected = default_record.expected_s if default_record else None
+        if default_expected is None or best[0] * PIN_MARGIN <= default_expected:
+            return best[1]
+        return None
+
+    @callback
+    def async_forget(self, address: str) -> None:
+        """Drop the history of a shaver (entry removed)."""
+        if self._paths.pop(address.upper(), None) is not None:
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+
+async def async_setup_path_stats(hass: HomeAssistant) -> ConnectPathStats:
+    """Load the shared connect history once per HA run."""
+    if (stats := hass.data.get(DATA_PATH_STATS)) is not None:
+        return stats
+    # Entries set up side by side share the first one's load instead of
+    # each loading (and the last replacing) its own copy.
+    if (loading := hass.data.get(DATA_PATH_STATS_LOAD)) is None:
+        loading = hass.data[DATA_PATH_STATS_LOAD] = hass.async_create_task(
+            _async_load_path_stats(hass), "philips_shaver_path_stats_load"
+        )
+    # An entry's setup being cancelled must not cancel the others' load.
+    return await asyncio.shield(loading)
+
+
+async def _async_load_path_stats(hass: HomeAssistant) -> ConnectPathStats:
+    try:
+        stats = ConnectPathStats(hass)
+        await stats.async_load()
+        hass.data[DATA_PATH_STATS] = stats
+        return stats
+    finally:
+        # A failed load is retried by the next setup.
+        hass.data.pop(DATA_PATH_STATS_LOAD, None)
+
+
+@callback
+def async_get_path_stats(hass: HomeAssistant) -> ConnectPathStats | None:
+    """The loaded connect history, or None before setup."""
+    return hass.data.get(DATA_PATH_STATS)
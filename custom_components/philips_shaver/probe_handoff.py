@@ -0,0 +1,148 @@
+# custom_components/philips_shaver/probe_handoff.py
+"""Hand the config-flow probe over to the entry it creates.
+
+Adding a shaver connects twice within a minute. The config flow's
+capabilities probe connects and reads identity and capability values to
+build the entry. Then, once the entry is set up, the coordinator connects
+again and reads everything once more. The second connect is the expensive
+part for a direct-BLE shaver. It needs another adapter slot and another
+establish_connection, often a few seconds over a busy proxy, and the
+shaver may already be on its way back to sleep.
+
+The flow therefore leaves what it learned here, keyed by shaver address:
+
+* the raw values of the static characteristics it read (model, firmware).
+  These cannot change between the probe and the setup, so the coordinator
+  applies them before its first connect and leaves them out of its first
+  read batch;
+* for direct BLE, the probe's still-open BleakClient. BleakTransport
+  adopts it in place of a fresh connect.
+
+Nothing here outlives a flow that goes nowhere. The link is closed after
+PROBE_LINK_HOLD, and values older than PROBE_MAX_AGE are dropped.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CHAR_FIRMWARE_REVISION, CHAR_MODEL_NUMBER, CHAR_SOFTWARE_REVISION
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROBE_HANDOFF = "philips_shaver_probe_handoff"
+
+# Values that stay valid from the probe to the first live read. Dynamic
+# ones (battery, device state) are read again on that first connect.
+PROBE_REUSABLE_CHARS = frozenset(
+    {CHAR_MODEL_NUMBER, CHAR_FIRMWARE_REVISION, CHAR_SOFTWARE_REVISION}
+)
+# The probe's link holds an adapter slot, so it is closed if no entry
+# takes it over. The user has to confirm a name first, but that is
+# usually quick.
+PROBE_LINK_HOLD = 120.0
+# Probe values are still good after the link has gone. This limit only
+# stops entries of abandoned flows from piling up.
+PROBE_MAX_AGE = 600.0
+
+
+@dataclass
+class ProbeHandoff:
+    """What one capabilities probe leaves for the entry it creates."""
+
+    address: str
+    values: dict[str, bytes] = field(default_factory=dict)
+    client: Any = None
+    taken_at: float = field(default_factory=time.monotonic)
+    # Set by the transport that adopts the link. Until then a drop only
+    # clears ``client``.
+    on_link_lost: Callable[[Any], None] | None = None
+    # Closes an unclaimed link after PROBE_LINK_HOLD.
+    link_timer: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+    @callback
+    def link_lost(self, client: Any) -> None:
+        """Disconnected callback of the probe's client.
+
+        The flow passes this method to establish_connection before the
+        transport exists, so it forwards to whichever transport adopts
+        the link later.
+        """
+        if client is not self.client:
+            return
+        if self.on_link_lost is None:
+            self.client = None
+            return
+        self.on_link_lost(client)
+
+    @callback
+    def claim_link(self, on_link_lost: Callable[[Any], None]) -> Any:
+        """Take over the open link; its drops go to ``on_link_lost`` from now on."""
+        if self.link_timer is not None:
+            self.link_timer.cancel()
+            self.link_timer = None
+        self.on_link_lost = on_link_lost
+        return self.client
+
+    @property
+    def link_open(self) -> bool:
+        return self.client is not None and bool(self.client.is_connected)
+
+
+def _handoffs(hass: HomeAssistant) -> dict[str, ProbeHandoff]:
+    return hass.data.setdefault(DATA_PROBE_HANDOFF, {})
+
+
+def _close_link(hass: HomeAssistant, handoff: ProbeHandoff) -> None:
+    if not handoff.link_open or handoff.on_link_lost is not None:
+        return
+    client, handoff.client = handoff.client, None
+    _LOGGER.debug("%s: closing the unclaimed probe link", handoff.address)
+    hass.async_create_task(client.disconnect())
+
+
+@callback
+def async_stash_probe(hass: HomeAssistant, handoff: ProbeHandoff) -> bool:
+    """Leave a probe's results for the entry setup.
+
+    Returns whether the caller may leave ``handoff.client`` connected. When
+    it returns False (a probe without an address), the caller closes the
+    link itself.
+    """
+    if not handoff.address:
+        return False
+    handoffs = _handoffs(hass)
+    handoff.address = handoff.address.upper()
+    handoff.values = {
+        u: v for u, v in handoff.values.items() if u in PROBE_REUSABLE_CHARS and v
+    }
+    handoff.taken_at = time.monotonic()
+    for key, old in list(handoffs.items()):
+        if key == handoff.address or handoff.taken_at - old.taken_at > PROBE_MAX_AGE:
+            if old.client is not handoff.client:
+                _close_link(hass, old)
+            del handoffs[key]
+    handoffs[handoff.address] = handoff
+    if handoff.link_open:
+        handoff.link_timer = hass.loop.call_later(
+            PROBE_LINK_HOLD, _close_link, hass, handoff
+        )
+    return True
+
+
+@callback
+def async_pop_probe(hass: HomeAssistant, address: str) -> ProbeHandoff | None:
+    """Take the probe results left for ``address``, if still fresh."""
+    handoff = _handoffs(hass).pop(address.upper(), None)
+    if handoff is None:
+        return None
+    if time.monotonic() - handoff.taken_at > PROBE_MAX_AGE:
+        _close_link(hass, handoff)
+        return None
+    return handoff
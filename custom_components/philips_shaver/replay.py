@@ -0,0 +1,513 @@
+# custom_components/philips_shaver/replay.py
+"""A captured snapshot, replayed as a live shaver.
+
+``scripts/shaver_scan.py --fixture`` writes a snapshot: every service and
+characteristic, with the value it held at capture time. A
+:class:`ReplayDevice` serves that snapshot back through a
+``BleakClient``-compatible :class:`ReplayClient`. Reads answer from the
+captured values, writes replace them, and a notification script plays
+value changes on a timeline (a shaving session, a charger plug-in) to
+whoever subscribed. ATT operations are charged a :class:`LatencyModel`
+cost and serialised per link like on a real one, so a replayed poll takes
+roughly as long as the real one would. ``time_scale`` stretches or
+shrinks every delay, and 0 runs everything back to back.
+
+Decoder and protocol work then runs against a recorded device in
+milliseconds instead of waking a real shaver for every change. The scan
+script replays with ``--replay``. The integration replays when a
+direct-BLE entry has a replay fixture set in its (advanced) options, and
+the test fake in ``tests/fake_ble.py`` builds on the same GATT table.
+
+This module only depends on bleak, so the scan script can load it
+outside Home Assistant.
+
+Script format (JSON, or the same structure in Python)::
+
+    {
+      "loop": false,
+      "steps": [
+        {"after": 1.0, "char": "Device State", "hex": "02"},
+        {"after": 1.0, "char": "8d56010f-3cb9-4387-a7e8-b79d826a7025", "hex": "0100"},
+        {"after": 5.0, "drop": true}
+      ]
+    }
+
+The script starts with the first subscription on a link, and ``after``
+is the delay in seconds since the previous step. ``char`` is a
+UUID or the characteristic's name in the capture. A ``drop`` step ends
+the link from the shaver's side, the way a shaver going back to sleep
+does. A bare list is read as the steps without looping. The built-in
+script ``"session"`` plays a short shaving session.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+import json
+import logging
+from pathlib import Path
+import random
+from types import SimpleNamespace
+from typing import Any
+import warnings
+
+from bleak.exc import BleakError
+
+try:
+    from .const import (
+        CHAR_DEVICE_STATE,
+        CHAR_MOTOR_CURRENT,
+        CHAR_MOTOR_RPM,
+        CHAR_PRESSURE,
+        CHAR_SHAVING_TIME,
+    )
+except ImportError:  # loaded stand-alone by scripts/shaver_scan.py
+    from const import (  # type: ignore[no-redef]
+        CHAR_DEVICE_STATE,
+        CHAR_MOTOR_CURRENT,
+        CHAR_MOTOR_RPM,
+        CHAR_PRESSURE,
+        CHAR_SHAVING_TIME,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+# Used when a snapshot carries no address (older hand-written fixtures).
+DEFAULT_REPLAY_ADDRESS = "24:E5:AA:00:00:01"
+# Name of the scanner a replayed link reports in place of an adapter.
+REPLAY_SOURCE = "replay"
+
+
+@dataclass
+class LatencyModel:
+    """Per-operation cost of the simulated link, in seconds.
+
+    The defaults are zero so correctness tests stay instant. ``per_byte``
+    is charged on top of read/write for every payload byte. Values longer
+    than one ATT PDU (MTU-1 bytes) take several round-trips (Read Blob) on
+    a real link; the client charges the base cost once per PDU.
+    ``jitter`` adds up to that fraction of the base cost, drawn from a
+    seeded RNG so two runs of a benchmark see the same sequence.
+    """
+
+    connect: float = 0.0
+    read: float = 0.0
+    write: float = 0.0
+    notify: float = 0.0
+    disconnect: float = 0.0
+    per_byte: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    @classmethod
+    def typical(cls) -> LatencyModel:
+        """Rough figures for a BlueZ link to an i9000 at a 30 ms interval.
+
+        A GATT read costs one request/response pair, i.e. about two
+        connection events; the connect includes the service discovery
+        that ``use_services_cache`` usually skips on a warm adapter.
+        """
+        return cls(
+            connect=1.2,
+            read=0.06,
+            write=0.06,
+            notify=0.06,
+            disconnect=0.03,
+            per_byte=0.0004,
+            jitter=0.2,
+        )
+
+    def cost(self, op: str, size: int = 0, pdus: int = 1) -> float:
+        """Simulated duration of one ``op`` moving ``size`` bytes in ``pdus``."""
+        base = getattr(self, op) * pdus + self.per_byte * size
+        if self.jitter and base:
+            base += base * self.jitter * self._rng.random()
+        return base
+
+
+class ReplayCharacteristic:
+    """The subset of ``BleakGATTCharacteristic`` the integration touches."""
+
+    def __init__(self, uuid: str, service_uuid: str, entry: dict[str, Any]) -> None:
+        self.uuid = uuid
+        self.service_uuid = service_uuid
+        self.handle = entry.get("handle", 0)
+        self.properties = list(entry.get("properties") or [])
+        self.description = entry.get("name") or ""
+        self.descriptors: list[Any] = []
+
+
+class ReplayService:
+    """The subset of ``BleakGATTService`` the integration touches."""
+
+    def __init__(self, uuid: str) -> None:
+        self.uuid = uuid
+        self.description = ""
+        self.characteristics: list[ReplayCharacteristic] = []
+
+
+class ReplayServiceCollection:
+    """Iterable of services with ``get_characteristic`` lookup by UUID."""
+
+    def __init__(self, services: list[ReplayService]) -> None:
+        self._services = services
+        self._chars = {
+            char.uuid: char for svc in services for char in svc.characteristics
+        }
+
+    def __iter__(self):
+        return iter(self._services)
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+    def get_characteristic(self, uuid: str) -> ReplayCharacteristic | None:
+        return self._chars.get(str(uuid).lower())
+
+
+def services_from_snapshot(snapshot: dict[str, Any]) -> ReplayServiceCollection:
+    """The GATT table of a capture: services, handles and properties."""
+    services: list[ReplayService] = []
+    for svc in snapshot["gatt_services"]:
+        service = ReplayService(svc["uuid"].lower())
+        for char in svc["characteristics"]:
+            service.characteristics.append(
+                ReplayCharacteristic(char["uuid"].lower(), service.uuid, char)
+            )
+        services.append(service)
+    return ReplayServiceCollection(services)
+
+
+def session_script(
+    seconds: int = 30, available: Collection[str] | None = None
+) -> dict[str, Any]:
+    """A shaving session: switch-on, ``seconds`` of shaving, switch-off.
+
+    Shaving time ticks every second, with motor and pressure values
+    moving alongside it like on a real session. With ``available``, the
+    steps of characteristics a capture does not have are left out: not
+    every model reports pressure or the motor values.
+    """
+    def _u16(after: float, char: str, value: int) -> dict[str, Any]:
+        return {"after": after, "char": char, "hex": value.to_bytes(2, "little").hex()}
+
+    steps: list[dict[str, Any]] = [
+        {"after": 1.0, "char": CHAR_DEVICE_STATE, "hex": "02"},
+        _u16(0.0, CHAR_SHAVING_TIME, 0),
+    ]
+    for second in range(1, seconds + 1):
+        steps += [
+            _u16(1.0, CHAR_SHAVING_TIME, second),
+            _u16(0.0, CHAR_MOTOR_RPM, 6200 + 40 * (second % 5)),
+            _u16(0.0, CHAR_MOTOR_CURRENT, 1000 + 25 * (second % 7)),
+            _u16(0.0, CHAR_PRESSURE, 900 + 150 * (second % 4)),
+        ]
+    steps += [
+        _u16(1.0, CHAR_PRESSURE, 0),
+        {"after": 0.0, "char": CHAR_DEVICE_STATE, "hex": "01"},
+    ]
+    if available is not None:
+        steps = _without_missing(steps, available)
+    return {"loop": False, "steps": steps}
+
+
+def _without_missing(
+    steps: list[dict[str, Any]], available: Collection[str]
+) -> list[dict[str, Any]]:
+    """``steps`` minus those of absent characteristics, their delays kept."""
+    kept: list[dict[str, Any]] = []
+    carry = 0.0
+    for step in steps:
+        if step["char"] in available:
+            kept.append({**step, "after": step["after"] + carry})
+            carry = 0.0
+        else:
+            carry += step["after"]
+    return kept
+
+
+BUILTIN_SCRIPTS: dict[str, Callable[..., dict[str, Any]]] = {
+    "session": session_script,
+}
+
+
+def load_script(
+    spec: str | list | dict | None, available: Collection[str] | None = None
+) -> dict[str, Any]:
+    """A notification script from a built-in name, a JSON file or a structure.
+
+    Built-in scripts are fitted to the ``available`` characteristics;
+    given scripts are taken as they are.
+    """
+    if spec is None:
+        return {"loop": False, "steps": []}
+    if isinstance(spec, str):
+        if spec in BUILTIN_SCRIPTS:
+            return BUILTIN_SCRIPTS[spec](available=available)
+        spec = json.loads(Path(spec).read_text(encoding="utf-8"))
+    if isinstance(spec, list):
+        return {"loop": False, "steps": spec}
+    return {"loop": bool(spec.get("loop")), "steps": list(spec.get("steps") or [])}
+
+
+class ReplayClient:
+    """A ``BleakClient`` look-alike connected to a :class:`ReplayDevice`."""
+
+    def __init__(
+        self,
+        device: ReplayDevice,
+        disconnected_callback: Callable[[Any], None] | None = None,
+    ) -> None:
+        self._device = device
+        self._disconnected_callback = disconnected_callback
+        self._connected = False
+        # What habluetooth's wrapper exposes after a connect; the
+        # integration labels the connection path from it.
+        self._connected_scanner = SimpleNamespace(
+            name=REPLAY_SOURCE, source=REPLAY_SOURCE
+        )
+        # One ATT bearer per connection: a request waits for the previous
+        # response, so concurrent callers queue here like on a real link.
+        self._att_lock = asyncio.Lock()
+        self._subscribers: dict[str, Callable[[Any, bytearray], None]] = {}
+        self._script_task: asyncio.Task | None = None
+        # Like bleak's BlueZ backend, mtu_size reports the default (and
+        # warns) until _acquire_mtu has asked for the negotiated value.
+        self._mtu_size: int | None = None
+
+    @property
+    def address(self) -> str:
+        return self._device.address
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def services(self) -> ReplayServiceCollection:
+        return self._device.services
+
+    @property
+    def mtu_size(self) -> int:
+        if self._mtu_size is None:
+            warnings.warn("Using default MTU value.", UserWarning, stacklevel=2)
+            return 23
+        return self._mtu_size
+
+    async def _acquire_mtu(self) -> None:
+        self._mtu_size = self._device.mtu
+
+    async def connect(self, **kwargs: Any) -> bool:
+        if self._connected:
+            return True
+        await self._device.sleep(self._device.latency.cost("connect"))
+        if self._device.client is not None:
+            self._device.client._teardown()
+        self._connected = True
+        self._device.client = self
+        return True
+
+    async def disconnect(self) -> bool:
+        if not self._connected:
+            return True
+        await self._device.sleep(self._device.latency.cost("disconnect"))
+        self._teardown()
+        return True
+
+    async def __aenter__(self) -> ReplayClient:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.disconnect()
+
+    def drop_link(self) -> None:
+        """End the link from the shaver's side; fires ``disconnected_callback``."""
+        if not self._connected:
+            return
+        self._teardown()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    def _teardown(self) -> None:
+        self._connected = False
+        self._subscribers.clear()
+        if self._script_task is not None:
+            self._script_task.cancel()
+            self._script_task = None
+        if self._device.client is self:
+            self._device.client = None
+
+    async def _att(self, op: str, size: int = 0) -> None:
+        if not self._connected:
+            raise BleakError("Not connected")
+        async with self._att_lock:
+            pdus = 1
+            if op == "read":
+                pdus = max(1, -(-size // ((self._mtu_size or 23) - 1)))
+            await self._device.sleep(self._device.latency.cost(op, size, pdus))
+            if not self._connected:
+                raise BleakError("Disconnected")
+
+    def _characteristic(self, char_specifier: Any) -> ReplayCharacteristic:
+        uuid = str(getattr(char_specifier, "uuid", char_specifier)).lower()
+        char = self.services.get_characteristic(uuid)
+        if char is None:
+            raise BleakError(f"Characteristic {uuid} was not found!")
+        return char
+
+    async def read_gatt_char(self, char_specifier: Any, **kwargs: Any) -> bytearray:
+        char = self._characteristic(char_specifier)
+        if "read" not in char.properties:
+            raise BleakError(f"Characteristic {char.uuid} is not readable")
+        await self._att("read", len(self._device.values.get(char.uuid, b"")))
+        return bytearray(self._device.values.get(char.uuid, b""))
+
+    async def write_gatt_char(
+        self, char_specifier: Any, data: bytes, response: bool | None = None
+    ) -> None:
+        char = self._characteristic(char_specifier)
+        await self._att("write", len(data))
+        self._device.values[char.uuid] = bytes(data)
+
+    async def start_notify(
+        self, char_specifier: Any, callback: Callable[[Any, bytearray], None], **kwargs: Any
+    ) -> None:
+        char = self._characteristic(char_specifier)
+        if not {"notify", "indicate"} & set(char.properties):
+            raise BleakError(f"Characteristic {char.uuid} does not notify")
+        await self._att("notify")
+        self._subscribers[char.uuid] = callback
+        # The script plays once someone listens: a session that ran
+        # during the connect's reads would reach nobody.
+        if self._script_task is None and self._device.script["steps"]:
+            self._script_task = asyncio.get_running_loop().create_task(
+                self._run_script()
+            )
+
+    async def stop_notify(self, char_specifier: Any) -> None:
+        char = self._characteristic(char_specifier)
+        await self._att("notify")
+        self._subscribers.pop(char.uuid, None)
+
+    def _deliver(self, uuid: str, value: bytes) -> bool:
+        callback = self._subscribers.get(uuid)
+        if callback is None:
+            return False
+        callback(self.services.get_characteristic(uuid), bytearray(value))
+        return True
+
+    async def _run_script(self) -> None:
+        script = self._device.script
+        while True:
+            for step in script["steps"]:
+                await self._device.sleep(float(step.get("after", 0.0)))
+                if not self._connected:
+                    return
+                if step.get("drop"):
+                    self.drop_link()
+                    return
+                self._device.notify(step["char"], bytes.fromhex(step["hex"]))
+            if not script["loop"]:
+                return
+
+
+class ReplayDevice:
+    """One captured shaver, served to any number of successive connects.
+
+    Values persist across connects like on the real device: a write, or a
+    notification the script played, is what the next connect reads.
+    """
+
+    def __init__(
+        self,
+        snapshot: dict[str, Any],
+        *,
+        address: str | None = None,
+        latency: LatencyModel | None = None,
+        script: str | list | dict | None = None,
+        time_scale: float = 1.0,
+        mtu: int = 247,
+    ) -> None:
+        self.address = (
+            address or snapshot.get("address") or DEFAULT_REPLAY_ADDRESS
+        ).upper()
+        self.name: str | None = snapshot.get("adv_name")
+        self.latency = latency if latency is not None else LatencyModel.typical()
+        self.time_scale = time_scale
+        self.mtu = mtu
+        self.services = services_from_snapshot(snapshot)
+        self.values: dict[str, bytes] = {}
+        self._by_name: dict[str, str] = {}
+        for svc in snapshot["gatt_services"]:
+            for char in svc["characteristics"]:
+                uuid = char["uuid"].lower()
+                if char.get("value_hex"):
+                    self.values[uuid] = bytes.fromhex(char["value_hex"])
+                if char.get("name"):
+                    self._by_name[char["name"].lower()] = uuid
+        self.script = load_script(
+            script,
+            available={
+                char.uuid for svc in self.services for char in svc.characteristics
+            },
+        )
+        self.script["steps"] = [
+            step if step.get("drop") else {**step, "char": self.resolve(step["char"])}
+            for step in self.script["steps"]
+        ]
+        self.client: ReplayClient | None = None
+
+    @classmethod
+    def from_file(cls, path: str | Path, **kwargs: Any) -> ReplayDevice:
+        """Load a capture written by ``shaver_scan.py --json/--fixture``.
+
+        Blocking I/O: inside Home Assistant, run it in the executor.
+        """
+        snapshot = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(snapshot, **kwargs)
+
+    def resolve(self, char: str) -> str:
+        """The UUID behind a UUID or a capture name; ValueError if unknown."""
+        key = char.lower()
+        if self.services.get_characteristic(key) is not None:
+            return key
+        if key in self._by_name:
+            return self._by_name[key]
+        raise ValueError(f"Characteristic {char!r} is not in the capture")
+
+    async def sleep(self, seconds: float) -> None:
+        """Wait ``seconds`` of device time (always yields, even at 0)."""
+        await asyncio.sleep(max(0.0, seconds * self.time_scale))
+
+    def make_client(
+        self, disconnected_callback: Callable[[Any], None] | None = None
+    ) -> ReplayClient:
+        """An unconnected client, e.g. for ``async with``."""
+        return ReplayClient(self, disconnected_callback)
+
+    async def connect(
+        self, disconnected_callback: Callable[[Any], None] | None = None
+    ) -> ReplayClient:
+        """Connect a new client; an older link is closed first."""
+        client = self.make_client(disconnected_callback)
+        await client.connect()
+        return client
+
+    def notify(self, char: str, value: bytes) -> bool:
+        """Change a value and notify it; False when nobody is subscribed."""
+        uuid = self.resolve(char)
+        self.values[uuid] = bytes(value)
+        _LOGGER.debug("replay %s: %s = %s", self.address, uuid, value.hex())
+        if self.client is None:
+            return False
+        return self.client._deliver(uuid, value)
+
+    def drop_link(self) -> None:
+        """End the current link from the shaver's side, if there is one."""
+        if self.client is not None:
+            self.client.drop_link()
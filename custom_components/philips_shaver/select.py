@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
@@ -63,12 +62,6 @@ class PhilipsShavingModeSelect(PhilipsShaverEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Send the selected mode to the shaver."""
-        if not self.coordinator.transport.is_connected:
-            _LOGGER.warning(
-                "Shaver not connected – cannot set shaving mode to %s", option
-            )
-            return
-
         write_mapping = {
             "sensitive": 0x00,
             "regular": 0x01,
@@ -82,20 +75,18 @@ class PhilipsShavingModeSelect(PhilipsShaverEntity, SelectEntity):
         if val is None:
             return
 
+        current = self.coordinator.data.get("shaving_mode_value")
         try:
-            await self.coordinator.transport.write_char(CHAR_SHAVING_MODE, bytes([val]))
-            _LOGGER.info("Shaving mode set to %s (0x%02x)", option, val)
+            # Asleep: applied on the next connect (see write_queue).
+            if await self.coordinator.writer.async_write(
+                CHAR_SHAVING_MODE,
+                bytes([val]),
+                optimistic={"shaving_mode_value": val, "shaving_mode": option},
+                base=bytes([current]) if current is not None else None,
+            ):
+                _LOGGER.info("Shaving mode set to %s (0x%02x)", option, val)
         except Exception as e:
             _LOGGER.error("Failed to write shaving mode %s: %s", option, e)
-            return
-
-        # Update coordinator data immediately
-        new_data = self.coordinator.data.copy()
-        new_data["shaving_mode_value"] = val
-        new_data["shaving_mode"] = option
-        new_data["last_seen"] = datetime.now(timezone.utc)
-
-        self.coordinator.async_set_updated_data(new_data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -154,12 +145,6 @@ class PhilipsLightRingBrightnessSelect(PhilipsShaverEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Send the selected brightness to the shaver."""
-        if not self.coordinator.transport.is_connected:
-            _LOGGER.warning(
-                "Shaver not connected – cannot set brightness to %s", option
-            )
-            return
-
         write_mapping = {
             "high": 0xFF,
             "medium": 0xCD,
@@ -170,18 +155,17 @@ class PhilipsLightRingBrightnessSelect(PhilipsShaverEntity, SelectEntity):
         if val is None:
             return
 
+        current = self.coordinator.data.get("lightring_brightness_value")
         try:
-            await self.coordinator.transport.write_char(
-                CHAR_LIGHTRING_COLOR_BRIGHTNESS, bytes([val])
-            )
-            _LOGGER.info("Light ring brightness set to %s (0x%02x)", option, val)
+            if await self.coordinator.writer.async_write(
+                CHAR_LIGHTRING_COLOR_BRIGHTNESS,
+                bytes([val]),
+                optimistic={
+                    "lightring_brightness_value": val,
+                    "lightring_brightness": option,
+                },
+                base=bytes([current]) if current is not None else None,
+            ):
+                _LOGGER.info("Light ring brightness set to %s (0x%02x)", option, val)
         except Exception as e:
             _LOGGER.error("Failed to write brightness %s: %s", option, e)
-            return
-
-        new_data = self.coordinator.data.copy()
-        new_data["lightring_brightness_value"] = val
-        new_data["lightring_brightness"] = option
-        new_data["last_seen"] = datetime.now(timezone.utc)
-
-        self.coordinator.async_set_updated_data(new_data)
@@ -26,6 +26,7 @@ from .const import (
     CARTRIDGE_CAPACITY, EVAPORATION_RATE, CLEANING_CONSTANTS, CLEANING_CONSTANT_DEFAULT,
 )
 from .entity import PhilipsConnectionEntity, PhilipsShaverEntity
+from .utils import pressure_zone
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -1145,30 +1146,7 @@ class PhilipsShaverPressureStateSensor(PhilipsShaverEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        pressure = self.coordinator.data.get("pressure")
-        if pressure is None:
-            return None
-
-        # Get dynamic thresholds from coordinator
-        mode_id = self.coordinator.data.get("shaving_mode_value")
-        settings = self.coordinator.data.get(
-            "custom_shaving_settings" if mode_id == 3 else "shaving_settings"
-        )
-
-        if not settings:
-            return "no_contact"
-
-        low = settings.get("pressure_limit_low", 1500)
-        high = settings.get("pressure_limit_high", 4000)
-        base = settings.get("pressure_base_value", 500)
-
-        if pressure < base:
-            return "no_contact"
-        if pressure < low:
-            return "too_low"
-        if pressure <= high:
-            return "optimal"
-        return "too_high"
+        return pressure_zone(self.coordinator.data)
 
     @property
     def icon(self) -> str:
@@ -1385,7 +1363,12 @@ class PhilipsBridgeBootTimeSensor(PhilipsConnectionEntity, SensorEntity):
 
 
 class PhilipsAdapterSensor(PhilipsConnectionEntity, SensorEntity):
-    """Adapter currently carrying the BLE connection."""
+    """Adapter currently carrying the BLE connection.
+
+    The ATT MTU of the link rides along as an attribute — bulk reads (the
+    session and pressure history) need far fewer round-trips above the
+    23-byte default, so it explains slow downloads on a given path.
+    """
 
     _attr_translation_key = "adapter"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -1400,3 +1383,8 @@ class PhilipsAdapterSensor(PhilipsConnectionEntity, SensorEntity):
     @property
     def native_value(self) -> str | None:
         return self.coordinator.transport.connection_path
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int] | None:
+        mtu = getattr(self.coordinator.transport, "mtu", None)
+        return {"mtu": mtu} if mtu else None
@@ -0,0 +1,271 @@
+# custom_components/philips_shaver/session_stats.py
+"""Long-term statistics of shaving sessions.
+
+During a session the shaver notifies RPM, current, pressure and speed about
+once a second. The recorder keeps each of those as a state row, and a
+long-term dashboard asking "how did my shaves go this month" has to
+aggregate thousands of them.
+
+This module summarizes every session while it runs and imports the summary
+as external statistics (``philips_shaver:<device>_session_*``). Per
+session it takes:
+
+- the duration, as the shaver counted it (elapsed time if it did not),
+- the time-weighted mean and the maximum RPM and the mean current while
+  the motor ran,
+- the share of the session spent in each pressure zone,
+- the share spent at optimal speed (OneBlade only).
+
+Statistics rows are hourly, so a row holds the sessions that started in
+that hour (nearly always one). The other means are weighted by session
+duration; min and max are over the sessions. The row of the current hour is
+re-imported when another session lands in it. The sessions of that hour
+are persisted with the device data, so a restart in between does not
+drop the earlier ones from the row.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .utils import pressure_zone
+
+if TYPE_CHECKING:
+    from .coordinator import PhilipsShaverCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key of the current hour's sessions in the coordinator's device-data store.
+STORE_KEY = "session_stats"
+
+# Longest stretch between two updates credited to the readings before it.
+# Notifications come every second while shaving; a longer silence is a
+# stalled link, not a second the reading held.
+MAX_STEP = 5.0
+
+# Statistic suffix → (name, unit).
+STATISTICS: dict[str, tuple[str, str]] = {
+    "session_duration": ("session duration", UnitOfTime.SECONDS),
+    "session_rpm": ("session motor speed", "RPM"),
+    "session_current": ("session motor current", "mA"),
+    "session_pressure_too_low": ("session pressure too low", PERCENTAGE),
+    "session_pressure_optimal": ("session pressure optimal", PERCENTAGE),
+    "session_pressure_too_high": ("session pressure too high", PERCENTAGE),
+    "session_speed_optimal": ("session speed optimal", PERCENTAGE),
+}
+
+
+@dataclass
+class _Series:
+    """Time-weighted mean and maximum of one reading."""
+
+    value: float | None = None
+    area: float = 0.0
+    seconds: float = 0.0
+    max: float | None = None
+
+    def advance(self, dt: float) -> None:
+        if self.value is not None:
+            self.area += self.value * dt
+            self.seconds += dt
+
+    def set(self, value: float | None) -> None:
+        self.value = value
+        if value is not None and (self.max is None or value > self.max):
+            self.max = value
+
+    @property
+    def mean(self) -> float | None:
+        return self.area / self.seconds if self.seconds else None
+
+
+@dataclass
+class _Shares:
+    """Seconds spent in each state of an enum reading."""
+
+    value: str | None = None
+    seconds: Counter[str] = field(default_factory=Counter)
+
+    def advance(self, dt: float) -> None:
+        if self.value is not None:
+            self.seconds[self.value] += dt
+
+    def share(self, value: str) -> float | None:
+        total = sum(self.seconds.values())
+        return 100 * self.seconds[value] / total if total else None
+
+
+@dataclass
+class _Session:
+    started: datetime
+    last_update: float
+    elapsed: float = 0.0
+    shaving_time: int = 0
+    rpm: _Series = field(default_factory=_Series)
+    current: _Series = field(default_factory=_Series)
+    pressure: _Shares = field(default_factory=_Shares)
+    speed: _Shares = field(default_factory=_Shares)
+
+    def observe(self, data: dict[str, Any], now: float) -> None:
+        dt = min(now - self.last_update, MAX_STEP)
+        self.last_update = now
+        self.elapsed += dt
+        for series in (self.rpm, self.current, self.pressure, self.speed):
+            series.advance(dt)
+        # 0 is the motor spinning up or down, not a reading of the shave.
+        self.rpm.set(data.get("motor_rpm") or None)
+        self.current.set(data.get("motor_current_ma") or None)
+        self.pressure.value = pressure_zone(data)
+        self.speed.value = data.get("speed_verdict")
+        self.shaving_time = max(self.shaving_time, data.get("shaving_time") or 0)
+
+    def summary(self) -> dict[str, tuple[float, float]]:
+        """Statistic suffix → (value, max) for the readings the session had."""
+        values: dict[str, tuple[float, float]] = {}
+        duration = float(self.shaving_time or round(self.elapsed))
+        values["session_duration"] = (duration, duration)
+        if self.rpm.mean is not None:
+            values["session_rpm"] = (self.rpm.mean, self.rpm.max)
+        if self.current.mean is not None:
+            values["session_current"] = (self.current.mean, self.current.max)
+        for zone in ("too_low", "optimal", "too_high"):
+            if (share := self.pressure.share(zone)) is not None:
+                values[f"session_pressure_{zone}"] = (share, share)
+        if (share := self.speed.share("optimal")) is not None:
+            values["session_speed_optimal"] = (share, share)
+        return values
+
+
+class SessionStatistics:
+    """Follows one coordinator and imports a statistics row per session."""
+
+    def __init__(self, coordinator: PhilipsShaverCoordinator) -> None:
+        self._coordinator = coordinator
+        self._object_id = slugify(coordinator.address)
+        self._session: _Session | None = None
+        # Sessions of the hour whose row was imported last.
+        self._hour: datetime | None = None
+        self._hour_sessions: list[tuple[float, dict[str, tuple[float, float]]]] = []
+
+    def for_store(self) -> dict[str, Any] | None:
+        if self._hour is None:
+            return None
+        return {
+            "hour": self._hour.isoformat(),
+            "sessions": [
+                [weight, {suffix: list(pair) for suffix, pair in summary.items()}]
+                for weight, summary in self._hour_sessions
+            ],
+        }
+
+    @callback
+    def restore(self, stored: dict[str, Any] | None) -> None:
+        """Take back the sessions of the hour persisted before a restart."""
+        if not stored:
+            return
+        try:
+            hour = datetime.fromisoformat(stored["hour"])
+            sessions = [
+                (
+                    float(weight),
+                    {key: (float(v), float(m)) for key, (v, m) in summary.items()},
+                )
+                for weight, summary in stored["sessions"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug(
+                "%s: dropping unreadable session statistics",
+                self._coordinator.address,
+            )
+            return
+        self._hour, self._hour_sessions = hour, sessions
+
+    @callback
+    def async_observe(self) -> None:
+        """Coordinator listener: track the running session, import it when over."""
+        data = self._coordinator.data or {}
+        shaving = data.get("device_state") == "shaving"
+        now = time.monotonic()
+        if self._session is None:
+            if shaving:
+                self._session = _Session(dt_util.utcnow(), now)
+                self._session.observe(data, now)
+            return
+        self._session.observe(data, now)
+        if not shaving:
+            session, self._session = self._session, None
+            self._async_finish(session)
+
+    @callback
+    def _async_finish(self, session: _Session) -> None:
+        if session.elapsed < 1:
+            return  # a state flicker, not a shave
+        hour = session.started.replace(minute=0, second=0, microsecond=0)
+        if hour != self._hour:
+            self._hour = hour
+            self._hour_sessions = []
+        summary = session.summary()
+        # Persisted with the next save of the device data: the session
+        # ends inside an async_set_updated_data, which schedules one.
+        self._hour_sessions.append((summary["session_duration"][0], summary))
+        _LOGGER.debug(
+            "%s: shaving session over — %s", self._coordinator.address, summary
+        )
+        self._async_import(hour)
+
+    @callback
+    def _async_import(self, hour: datetime) -> None:
+        hass = self._coordinator.hass
+        if "recorder" not in hass.config.components:
+            return
+        # Imported here: the recorder pulls in SQLAlchemy, which the
+        # integration should not load before a shave actually ended.
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        title = self._coordinator.entry.title
+        for suffix, (name, unit) in STATISTICS.items():
+            rows = [
+                # Durations themselves are averaged per session.
+                (1.0 if suffix == "session_duration" else weight, summary[suffix])
+                for weight, summary in self._hour_sessions
+                if suffix in summary
+            ]
+            if not rows:
+                continue
+            total = sum(weight for weight, _ in rows)
+            if total:
+                mean = sum(weight * value for weight, (value, _) in rows) / total
+            else:
+                mean = sum(value for _, (value, _) in rows) / len(rows)
+            statistic_id = f"{DOMAIN}:{self._object_id}_{suffix}"
+            async_add_external_statistics(
+                hass,
+                {
+                    "has_mean": True,
+                    "has_sum": False,
+                    "name": f"{title} {name}",
+                    "source": DOMAIN,
+                    "statistic_id": statistic_id,
+                    "unit_of_measurement": unit,
+                },
+                [
+                    {
+                        "start": hour,
+                        "mean": mean,
+                        "min": min(value for _, (value, _) in rows),
+                        "max": max(peak for _, (_, peak) in rows),
+                    }
+                ],
+            )
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -65,20 +64,23 @@ class PhilipsLightRingSwitch(PhilipsShaverEntity, SwitchEntity):
         await self._set_lightring(False)
 
     async def _set_lightring(self, enabled: bool) -> None:
-        """Read-modify-write the app handle settings bitfield."""
-        if not self.coordinator.transport.is_connected:
-            _LOGGER.warning("Shaver not connected – cannot toggle light ring")
-            return
+        """Read-modify-write the app handle settings bitfield.
+
+        While the shaver sleeps, only the two bits this switch owns are
+        deferred; the write queue merges them onto the value it reads on
+        the next connect.
+        """
+        connected = self.coordinator.transport.is_connected
 
         # Get current raw bytes (from last poll/notification)
         raw = self.coordinator.data.get("app_handle_settings_raw")
-        if not raw:
+        if not raw and connected:
             raw = await self.coordinator.transport.read_char(CHAR_APP_HANDLE_SETTINGS)
-        if not raw:
+        if not raw and connected:
             _LOGGER.error("Cannot read app handle settings – aborting")
             return
 
-        val = int.from_bytes(raw, "little")
+        val = int.from_bytes(raw or bytes(4), "little")
 
         # Modify bits (read-modify-write)
         if enabled:
@@ -87,19 +89,23 @@ class PhilipsLightRingSwitch(PhilipsShaverEntity, SwitchEntity):
             val &= ~APP_SETTINGS_FULL_COACHING  # clear bit 4
         val &= ~APP_SETTINGS_MAX_PRESSURE       # always clear bit 5
 
-        new_raw = val.to_bytes(len(raw), "little")
+        size = len(raw) if raw else 4
+        new_raw = val.to_bytes(size, "little")
+        owned = (APP_SETTINGS_FULL_COACHING | APP_SETTINGS_MAX_PRESSURE).to_bytes(
+            size, "little"
+        )
 
         try:
-            await self.coordinator.transport.write_char(
-                CHAR_APP_HANDLE_SETTINGS, new_raw
-            )
-            _LOGGER.info("Light ring %s", "enabled" if enabled else "disabled")
+            if await self.coordinator.writer.async_write(
+                CHAR_APP_HANDLE_SETTINGS,
+                new_raw,
+                optimistic={
+                    "lightring_enabled": enabled,
+                    "app_handle_settings_raw": new_raw if raw else None,
+                },
+                mask=owned,
+                base=raw or None,
+            ):
+                _LOGGER.info("Light ring %s", "enabled" if enabled else "disabled")
         except Exception as e:
             _LOGGER.error("Failed to write light ring setting: %s", e)
-            return
-
-        new_data = self.coordinator.data.copy()
-        new_data["lightring_enabled"] = enabled
-        new_data["app_handle_settings_raw"] = new_raw
-        new_data["last_seen"] = datetime.now(timezone.utc)
-        self.coordinator.async_set_updated_data(new_data)
@@ -0,0 +1,29 @@
+# custom_components/philips_shaver/text_blocks.py
+"""Cache of the config flow's resolved text blocks.
+
+The flow resolves its reusable sentence fragments once per language and
+category (see ``config_flow._async_text_blocks``) and keeps them in
+hass.data until the integration unloads. The cache lives here rather than
+in config_flow, so unloading an entry can drop it without importing the
+flow module.
+"""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+
+# hass.data key of the resolved text blocks, per (language, category).
+DATA_TEXT_BLOCKS = "philips_shaver_text_blocks"
+
+
+@callback
+def async_text_block_cache(
+    hass: HomeAssistant,
+) -> dict[tuple[str, str], dict[str, str]]:
+    """The cached blocks, keyed by (language, category)."""
+    return hass.data.setdefault(DATA_TEXT_BLOCKS, {})
+
+
+@callback
+def async_clear_text_blocks(hass: HomeAssistant) -> None:
+    """Drop the cached text blocks (integration reload or update)."""
+    hass.data.pop(DATA_TEXT_BLOCKS, None)
@@ -10,8 +10,9 @@ import abc
 import asyncio
 import logging
 import time
+import warnings
 from datetime import datetime, timedelta, timezone
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from bleak import BleakClient
 from bleak_retry_connector import establish_connection as bleak_establish
@@ -26,10 +27,14 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_track_time_interval
 
-from packaging.version import Version
-
+from .connect_scheduler import PRIORITY_WAKE, async_get_connect_scheduler
+from .probe_handoff import ProbeHandoff
 from .const import BRIDGE_PIPELINED_READS_VERSION, CHAR_SERVICE_MAP
 from .exceptions import TransportError
+from .path_stats import async_get_path_stats
+
+if TYPE_CHECKING:
+    from .replay import ReplayDevice
 
 _LOGGER = logging.getLogger(__name__)
 TRACE = 5  # below DEBUG(10), for per-event tracing
@@ -146,30 +151,101 @@ def describe_connection_path(
         return f"unknown ({err})"
 
 
+def _visible_scanners(hass: HomeAssistant, address: str) -> list[tuple[object, int | None]]:
+    """Connectable scanners currently seeing *address* with their RSSI, strongest first.
+
+    habluetooth ranks connect candidates by an RSSI-based score, so the
+    first entry is its likely pick.
+    """
+    seen: list[tuple[object, int | None]] = []
+    for sd in async_scanner_devices_by_address(hass, address, connectable=True):
+        rssi = getattr(sd.advertisement, "rssi", None)
+        # A BlueZ RSSI-invalidation event leaves a stale -127 entry in
+        # the history without a packet on the air — that scanner does
+        # NOT currently see the device, so listing it would present a
+        # dead path as the likely carrier (same sentinel the sleep
+        # gate keys on).
+        if rssi is not None and rssi <= -127:
+            continue
+        seen.append((sd.scanner, rssi))
+    seen.sort(key=lambda s: s[1] if isinstance(s[1], int) else -999, reverse=True)
+    return seen
+
+
+def preferred_connection_source(hass: HomeAssistant, address: str) -> str | None:
+    """Scanner source the next direct connect should be pinned to.
+
+    None leaves the choice to habluetooth — no learned history yet, or
+    its likely pick is (about) as fast as anything else that can see
+    the shaver right now. See path_stats for the policy.
+    """
+    if (stats := async_get_path_stats(hass)) is None:
+        return None
+    try:
+        sources = [
+            source
+            for scanner, _rssi in _visible_scanners(hass, address)
+            if (source := getattr(scanner, "source", None))
+        ]
+    except Exception:  # noqa: BLE001 — fall back to habluetooth's choice
+        return None
+    if not sources:
+        return None
+    return stats.preferred_source(address, sources, sources[0])
+
+
+def _client_class_pinned_to(address: str, source: str) -> type[BleakClient]:
+    """A BleakClient class whose connects try scanner *source* first.
+
+    Inside HA ``bleak.BleakClient`` is habluetooth's wrapper, which picks
+    the backend in ``_async_get_best_available_backend_and_device`` and
+    offers no public way to choose the scanner. The override asks for a
+    backend on the pinned scanner and otherwise falls through to
+    habluetooth's own ranking, so a pin can never make a connect
+    impossible — only, at worst, no better. Outside HA (no such hook)
+    the plain class is returned.
+    """
+    if not hasattr(BleakClient, "_async_get_best_available_backend_and_device"):
+        return BleakClient
+
+    class _PinnedBleakClient(BleakClient):  # type: ignore[misc, valid-type]
+        def _async_get_best_available_backend_and_device(self, manager):
+            try:
+                for sd in manager.async_scanner_devices_by_address(address, True):
+                    if getattr(sd.scanner, "source", None) != source:
+                        continue
+                    backend = self._async_get_backend_for_ble_device(
+                        manager, sd.scanner, sd.ble_device
+                    )
+                    if backend is not None:
+                        return backend
+                    break  # no free slot there — let habluetooth choose
+            except Exception as err:  # noqa: BLE001 — upstream internals moved
+                _LOGGER.debug("%s: pinning to %s failed: %s", address, source, err)
+            return super()._async_get_best_available_backend_and_device(manager)
+
+    return _PinnedBleakClient
+
+
 def describe_available_paths(
     hass: HomeAssistant, address: str
 ) -> list[dict[str, object]]:
-    """Connectable scanners currently seeing *address*, strongest first.
+    """Connectable scanners currently seeing *address*, likely carrier first.
 
     Predicts habluetooth's backend choice before a connect exists:
     connects are ranked by an RSSI-based score, so the strongest entry
-    here is the likely carrier. Each entry:
-    ``{"name": str, "rssi": int | None, "is_local": bool}`` where
-    ``is_local`` means the local BlueZ stack (``HaScanner``) as opposed
-    to a remote scanner such as an ESPHome bluetooth_proxy.
+    here is the likely carrier — unless the learned connect history pins
+    another path, which then leads the list. Each entry:
+    ``{"name": str, "rssi": int | None, "is_local": bool, "source": str,
+    "pinned": bool}`` where ``is_local`` means the local BlueZ stack
+    (``HaScanner``) as opposed to a remote scanner such as an ESPHome
+    bluetooth_proxy. Paths with history also carry ``connects``,
+    ``success_rate`` and ``expected_s`` (expected seconds to a
+    connection, failed attempts included).
     """
     paths: list[dict[str, object]] = []
     try:
-        for sd in async_scanner_devices_by_address(hass, address, connectable=True):
-            rssi = getattr(sd.advertisement, "rssi", None)
-            # A BlueZ RSSI-invalidation event leaves a stale -127 entry in
-            # the history without a packet on the air — that scanner does
-            # NOT currently see the device, so listing it would present a
-            # dead path as the likely carrier (same sentinel the sleep
-            # gate keys on).
-            if rssi is not None and rssi <= -127:
-                continue
-            scanner = sd.scanner
+        for scanner, rssi in _visible_scanners(hass, address):
             name = (
                 getattr(scanner, "name", None)
                 or getattr(scanner, "source", None)
@@ -179,13 +255,27 @@ def describe_available_paths(
                 "name": name,
                 "rssi": rssi,
                 "is_local": isinstance(scanner, HaScanner),
+                "source": getattr(scanner, "source", None) or name,
+                "pinned": False,
             })
     except Exception:  # noqa: BLE001 — preview only, never break the flow
         return []
-    paths.sort(
-        key=lambda p: p["rssi"] if isinstance(p["rssi"], int) else -999,
-        reverse=True,
+    if (stats := async_get_path_stats(hass)) is None or not paths:
+        return paths
+    for path in paths:
+        if (record := stats.get(address, str(path["source"]))) is not None:
+            path["connects"] = record.attempts
+            path["success_rate"] = record.success_rate
+            path["expected_s"] = record.expected_s
+    pinned = stats.preferred_source(
+        address, [str(p["source"]) for p in paths], str(paths[0]["source"])
     )
+    if pinned is not None:
+        for i, path in enumerate(paths):
+            if path["source"] == pinned:
+                path["pinned"] = True
+                paths.insert(0, paths.pop(i))
+                break
     return paths
 
 
@@ -207,6 +297,36 @@ def is_local_bluez_connection(client: BleakClient) -> bool:
         return False
 
 
+async def async_negotiate_mtu(client: BleakClient) -> int | None:
+    """Bring a fresh connection up to its largest ATT MTU and return it.
+
+    BlueZ exchanges the MTU itself when the link comes up, but bleak's
+    D-Bus backend only learns the result through ``_acquire_mtu`` — until
+    then ``mtu_size`` reports the 23-byte default (with a warning). ESPHome
+    proxies negotiate on their side and report the result on connect. The
+    stack already chains Read Blob requests for values longer than MTU-1,
+    so a larger MTU is what cuts the round-trips of bulk reads like the
+    session and pressure history; this only makes sure it is in place and
+    known. ``None`` when the backend cannot tell.
+    """
+    # habluetooth's wrapper keeps the platform client in ``_backend``.
+    acquire = getattr(client, "_acquire_mtu", None) or getattr(
+        getattr(client, "_backend", None), "_acquire_mtu", None
+    )
+    if acquire is not None:
+        try:
+            await acquire()
+        except Exception as err:  # noqa: BLE001 — stay on the default MTU
+            _LOGGER.debug("MTU acquisition failed: %s", err)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            mtu = client.mtu_size
+    except Exception:  # noqa: BLE001 — backend without MTU reporting
+        return None
+    return int(mtu) if mtu else None
+
+
 # Return values of async_unpair_bridge_slot.
 UNPAIR_OK = "unpaired"
 UNPAIR_UNCONFIRMED = "unconfirmed"
@@ -222,6 +342,7 @@ UNPAIR_FAILED = "failed"
 # whoever changes a slot records it, and the picker re-probes exactly the
 # slots that went stale rather than everything.
 DATA_CHANGED_SLOTS = "philips_shaver_changed_slots"
+DATA_ESP_SESSIONS = "philips_shaver_esp_sessions"
 
 
 @callback
@@ -333,6 +454,11 @@ class ShaverTransport(abc.ABC):
         """Return True if the shaver BLE link is active. Same as is_connected for direct BLE."""
         return self.is_connected
 
+    @property
+    def is_replay(self) -> bool:
+        """Return True if a captured snapshot stands in for the shaver."""
+        return False
+
     @property
     def connection_path(self) -> str | None:
         """Label of the adapter/bridge currently carrying the connection."""
@@ -349,6 +475,11 @@ class ShaverTransport(abc.ABC):
         """
         return None
 
+    @property
+    def mtu(self) -> int | None:
+        """ATT MTU negotiated for the current link, if known."""
+        return None
+
     @abc.abstractmethod
     async def read_char(self, char_uuid: str) -> bytes | None:
         """Read a single GATT characteristic."""
@@ -378,6 +509,19 @@ class ShaverTransport(abc.ABC):
     async def set_notify_throttle(self, ms: int) -> None:
         """Set the notification throttle on the bridge (no-op for direct BLE)."""
 
+    async def set_conn_profile(self, profile: str) -> None:
+        """Select the bridge's connection-parameter profile (no-op for
+        direct BLE — bleak has no connection-parameter API)."""
+
+    def set_connect_priority(self, priority: int) -> None:
+        """Queue position of the next connect (no-op for the bridge, which
+        connects the shaver itself)."""
+
+    def adopt_probe_link(self, handoff: ProbeHandoff) -> bool:
+        """Take over the config-flow probe's open link for the next connect
+        (direct BLE only — the bridge owns its link)."""
+        return False
+
     @abc.abstractmethod
     def set_disconnect_callback(self, cb: Callable[[], None]) -> None:
         """Register a callback invoked when the connection drops."""
@@ -390,23 +534,49 @@ class ShaverTransport(abc.ABC):
 class BleakTransport(ShaverTransport):
     """Direct BLE transport using bleak."""
 
-    def __init__(self, hass: HomeAssistant, address: str) -> None:
+    def __init__(
+        self, hass: HomeAssistant, address: str, replay: ReplayDevice | None = None
+    ) -> None:
         self._hass = hass
         self._address = address
+        # Serves a captured snapshot instead of the radio (see replay.py).
+        # A replayed shaver never advertises, so nothing here waits for
+        # service info while one is set.
+        self._replay = replay
         self._client: BleakClient | None = None
         self._disconnect_cb: Callable[[], None] | None = None
         self._last_read_errors: dict[str, str] = {}
         self._connection_path: str | None = None
         self._connected_scanner = None
+        self._mtu: int | None = None
+        # MTU the last negotiation on a link to this shaver came up with.
+        # Poll links reuse it instead of asking on every poll: the value
+        # only labels the log there, and the reads never depend on it.
+        self._link_mtu: int | None = None
+        self._connect_priority = PRIORITY_WAKE
+        # The next connect() finishes the probe link set by
+        # adopt_probe_link instead of establishing its own.
+        self._adopted_link = False
 
     @property
     def is_connected(self) -> bool:
         return self._client is not None and self._client.is_connected
 
+    @property
+    def is_replay(self) -> bool:
+        return self._replay is not None
+
     @property
     def connection_path(self) -> str | None:
         return self._connection_path if self.is_connected else None
 
+    @property
+    def mtu(self) -> int | None:
+        return self._mtu if self.is_connected else None
+
+    def set_connect_priority(self, priority: int) -> None:
+        self._connect_priority = priority
+
     @property
     def connection_rssi(self) -> int | None:
         if not self.is_connected or self._connected_scanner is None:
@@ -425,31 +595,119 @@ class BleakTransport(ShaverTransport):
             return None
         return int(rssi)
 
+    def adopt_probe_link(self, handoff: ProbeHandoff) -> bool:
+        """Use the config flow's still-open probe link as this transport's link.
+
+        Saves the entry's first connect right after the flow: the link
+        holds its adapter slot from here on, drops reach this transport
+        through the handoff, and the next connect() only finishes the
+        setup (path, MTU).
+        """
+        if not handoff.link_open:
+            return False
+        self._client = handoff.claim_link(self._on_link_lost)
+        self._connected_scanner = getattr(self._client, "_connected_scanner", None)
+        self._adopted_link = True
+        async_get_connect_scheduler(self._hass).adopt(
+            self._address,
+            getattr(self._connected_scanner, "source", None) or "default",
+        )
+        _LOGGER.debug("%s: adopted the setup probe's link", self._address)
+        return True
+
+    def _on_link_lost(self, _client) -> None:
+        _LOGGER.info("%s: connection lost", self._address)
+        self._client = None
+        self._connection_path = None
+        self._connected_scanner = None
+        self._mtu = None
+        self._release_slot()
+        if self._disconnect_cb:
+            self._disconnect_cb()
+
     async def connect(self) -> None:
         service_info = async_last_service_info(self._hass, self._address)
-        if not service_info:
-            raise TransportError(f"Device {self._address} not in range")
-
-        def _on_disconnect(_client):
-            _LOGGER.info("%s: connection lost", self._address)
-            self._client = None
-            self._connection_path = None
-            self._connected_scanner = None
-            if self._disconnect_cb:
-                self._disconnect_cb()
-
-        self._client = await bleak_establish(
-            BleakClient,
-            service_info.device,
-            "philips_shaver",
-            disconnected_callback=_on_disconnect,
-            timeout=15.0,
-        )
-        self._connected_scanner = getattr(self._client, "_connected_scanner", None)
+        adopted, self._adopted_link = self._adopted_link, False
+        if not (adopted and self.is_connected):
+            if not service_info and self._replay is None:
+                raise TransportError(f"Device {self._address} not in range")
+            self._client = await self._establish(
+                service_info.device if service_info else None,
+                disconnected_callback=self._on_link_lost,
+            )
+            self._connected_scanner = getattr(
+                self._client, "_connected_scanner", None
+            )
+        # A connected shaver stops advertising, so the adopted link may
+        # outlive its last service info.
+        device = service_info.device if service_info else None
         self._connection_path = describe_connection_path(
-            self._hass, self._client, service_info.device
+            self._hass, self._client, device
         )
-        _LOGGER.info("%s: connected via %s", self._address, self._connection_path)
+        self._mtu = await async_negotiate_mtu(self._client)
+        self._link_mtu = self._mtu or self._link_mtu
+        _LOGGER.info(
+            "%s: connected via %s (MTU %s)%s",
+            self._address, self._connection_path, self._mtu or "unknown",
+            " — setup probe link reused" if adopted else "",
+        )
+
+    async def _establish(self, device, **kwargs) -> BleakClient:
+        """establish_connection over the fastest known path, and learn from it.
+
+        Waits for a free slot on the adapter the connect is expected to
+        take (see connect_scheduler) — the slot stays held until the link
+        ends. Pins the connect to the scanner the connect history prefers
+        (if any) and records the outcome and time-to-connection against
+        the scanner that carried it — or, on failure, the one it was
+        meant to take. A replayed link takes no slot and leaves no stats.
+        """
+        if self._replay is not None:
+            return await self._replay.connect(kwargs.get("disconnected_callback"))
+        stats = async_get_path_stats(self._hass)
+        pinned = preferred_connection_source(self._hass, self._address)
+        expected = self._expected_scanner(pinned)
+        expected_source = getattr(expected, "source", None)
+        await async_get_connect_scheduler(self._hass).async_acquire(
+            self._address,
+            expected_source or "default",
+            expected,
+            self._connect_priority,
+        )
+        client_class = BleakClient
+        if pinned is not None:
+            _LOGGER.debug("%s: pinning connect to %s", self._address, pinned)
+            client_class = _client_class_pinned_to(self._address, pinned)
+        start = time.monotonic()
+        try:
+            client = await bleak_establish(
+                client_class, device, "philips_shaver", timeout=15.0, **kwargs
+            )
+        except Exception:
+            self._release_slot()
+            if stats is not None and expected_source:
+                stats.record(
+                    self._address, expected_source, False, time.monotonic() - start
+                )
+            raise
+        scanner = getattr(client, "_connected_scanner", None)
+        if stats is not None and (source := getattr(scanner, "source", None)):
+            stats.record(self._address, source, True, time.monotonic() - start)
+        return client
+
+    def _expected_scanner(self, pinned: str | None):
+        """The scanner the next connect should take: the pin, else habluetooth's likely pick."""
+        try:
+            visible = [scanner for scanner, _rssi in _visible_scanners(self._hass, self._address)]
+        except Exception:  # noqa: BLE001 — nothing to attribute the connect to
+            return None
+        for scanner in visible:
+            if pinned is not None and getattr(scanner, "source", None) == pinned:
+                return scanner
+        return visible[0] if visible else None
+
+    def _release_slot(self) -> None:
+        async_get_connect_scheduler(self._hass).release(self._address)
 
     async def disconnect(self) -> None:
         if self._client and self._client.is_connected:
@@ -458,6 +716,7 @@ class BleakTransport(ShaverTransport):
             except Exception:
                 pass
         self._client = None
+        self._release_slot()
 
     def pop_read_error(self, char_uuid: str) -> str | None:
         """Return and clear the last read error for a characteristic, if any."""
@@ -478,17 +737,20 @@ class BleakTransport(ShaverTransport):
         """Connect-read-disconnect pattern for polling."""
         results: dict[str, bytes | None] = {u: None for u in char_uuids}
         service_info = async_last_service_info(self._hass, self._address)
-        if not service_info:
+        if not service_info and self._replay is None:
             _LOGGER.warning("Device %s not in range", self._address)
             return results
 
         client: BleakClient | None = None
         try:
-            client = await bleak_establish(
-                BleakClient, service_info.device, "philips_shaver", timeout=15.0
+            client = await self._establish(
+                service_info.device if service_info else None
             )
             if not client or not client.is_connected:
                 return results
+            if self._link_mtu is None:
+                self._link_mtu = await async_negotiate_mtu(client)
+            _LOGGER.debug("%s: poll link MTU %s", self._address, self._link_mtu)
 
             for uuid in char_uuids:
                 try:
@@ -505,6 +767,8 @@ class BleakTransport(ShaverTransport):
                     await client.disconnect()
                 except Exception:
                     pass
+            if client is not None:
+                self._release_slot()
         return results
 
     async def write_char(self, char_uuid: str, data: bytes) -> None:
@@ -543,6 +807,246 @@ class BleakTransport(ShaverTransport):
 # ---------------------------------------------------------------------------
 
 
+def _esphome_entry_data(hass: HomeAssistant, device_name: str):
+    """Runtime data of the ESPHome config entry for ``device_name``, or None.
+
+    ESPHome stores its device name with hyphens (atom-lite), our entries
+    with underscores (atom_lite). Only the API-connection surface is used:
+    ``available`` and ``async_subscribe_device_updated``.
+    """
+    entries = getattr(getattr(hass, "config_entries", None), "async_entries", None)
+    if entries is None:
+        return None
+    wanted = {device_name, device_name.replace("_", "-")}
+    for entry in entries("esphome"):
+        if entry.data.get("device_name", "") not in wanted:
+            continue
+        data = getattr(entry, "runtime_data", None)
+        if hasattr(data, "async_subscribe_device_updated"):
+            return data
+    return None
+
+
+class EspBridgeSession:
+    """Everything one ESP32 shares between its bridge slots.
+
+    A multi-slot bridge hosts several shavers (one ``bridge_id`` each),
+    and every slot used to carry its own pair of bus listeners and its
+    own heartbeat timer — each bridge event was parsed once per slot on
+    the ESP only to be dropped by all but one. The session owns those
+    for the whole ESP: one listener per event type routes each event by
+    MAC to the slot it belongs to, one timer checks the heartbeat of
+    every slot, and an idempotent service call (a read, an info request)
+    made while the identical call is still in flight waits for that one
+    instead of going to the ESP's API connection a second time.
+    ``EspBridgeTransport`` slots are thin views that attach
+    while connected.
+
+    Liveness has two sources. The ESPHome config entry knows the moment
+    its API connection drops, and the session follows it directly, so
+    pending reads fail right away instead of waiting out a timeout. The
+    heartbeat timeout is kept as the fallback for when the entry cannot
+    be found, or the link hangs without HA noticing.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_name: str) -> None:
+        self._hass = hass
+        self.device_name = device_name
+        self._views: list[EspBridgeTransport] = []
+        # Slots by detected shaver MAC; slots without one yet get every
+        # event that names a MAC (same filter as a bound slot applies).
+        self._by_mac: dict[str, list[EspBridgeTransport]] = {}
+        self._unbound: list[EspBridgeTransport] = []
+        self._event_unsub: Callable | None = None
+        self._status_unsub: Callable | None = None
+        self._heartbeat_check_unsub: Callable | None = None
+        # When a status event for any slot last arrived — every one of
+        # them proves the ESP alive.
+        self.last_heartbeat: float = 0.0
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._on_empty: Callable[[], None] | None = None
+        # ESPHome entry runtime data we follow (see _bind_api_state);
+        # replaced when the ESPHome entry reloads.
+        self._entry_data = None
+        self._entry_unsub: Callable | None = None
+        self._api_available: bool | None = None
+
+    @property
+    def views(self) -> list[EspBridgeTransport]:
+        return list(self._views)
+
+    @property
+    def api_available(self) -> bool | None:
+        """ESPHome's view of the API connection; None when not followed."""
+        return self._api_available
+
+    def attach(self, view: EspBridgeTransport) -> None:
+        if view in self._views:
+            return
+        self._views.append(view)
+        self.reindex()
+        if self._event_unsub is None:
+            self._event_unsub = self._hass.bus.async_listen(
+                ESP_EVENT_NAME, self._handle_event
+            )
+            self._status_unsub = self._hass.bus.async_listen(
+                ESP_STATUS_EVENT_NAME, self._handle_status_event
+            )
+            self._heartbeat_check_unsub = async_track_time_interval(
+                self._hass, self._check_heartbeat, timedelta(seconds=15)
+            )
+        self._bind_api_state()
+
+    def detach(self, view: EspBridgeTransport) -> None:
+        if view not in self._views:
+            return
+        self._views.remove(view)
+        self.reindex()
+        if self._views:
+            return
+        for unsub in (
+            self._event_unsub,
+            self._status_unsub,
+            self._heartbeat_check_unsub,
+            self._entry_unsub,
+        ):
+            if unsub:
+                unsub()
+        self._event_unsub = self._status_unsub = self._heartbeat_check_unsub = None
+        self._entry_unsub = self._entry_data = self._api_available = None
+        self.last_heartbeat = 0.0
+        if self._on_empty:
+            self._on_empty()
+
+    @callback
+    def reindex(self) -> None:
+        """Rebuild the MAC routing table (a slot attached, left or learned its MAC)."""
+        self._by_mac = {}
+        self._unbound = []
+        for view in self._views:
+            if view.detected_mac:
+                self._by_mac.setdefault(view.detected_mac.upper(), []).append(view)
+            else:
+                self._unbound.append(view)
+
+    def _targets(self, mac: str) -> list[EspBridgeTransport]:
+        if not mac:
+            return list(self._views)
+        return self._by_mac.get(mac.upper(), []) + self._unbound
+
+    @callback
+    def _handle_event(self, event: Event) -> None:
+        for view in self._targets(event.data.get("mac", "")):
+            view._handle_data_event(event.data)
+
+    @callback
+    def _handle_status_event(self, event: Event) -> None:
+        accepted = False
+        for view in self._targets(event.data.get("mac", "")):
+            accepted |= view._handle_status_event(event.data)
+        if accepted:
+            self.last_heartbeat = time.monotonic()
+
+    @callback
+    def _bind_api_state(self) -> None:
+        """Follow the ESPHome entry's API connection (re-bind after a reload)."""
+        data = _esphome_entry_data(self._hass, self.device_name)
+        if data is self._entry_data:
+            return
+        if self._entry_unsub:
+            self._entry_unsub()
+            self._entry_unsub = None
+        self._entry_data = data
+        self._api_available = None
+        if data is not None:
+            self._entry_unsub = data.async_subscribe_device_updated(
+                self._on_device_updated
+            )
+            self._api_available = bool(data.available)
+
+    @callback
+    def _on_device_updated(self) -> None:
+        if self._entry_data is None:
+            return
+        available = bool(self._entry_data.available)
+        if available == self._api_available:
+            return
+        self._api_available = available
+        if not available:
+            for view in list(self._views):
+                view._bridge_lost("ESPHome API connection lost")
+            return
+        # Back: ask every slot's state now instead of waiting for the
+        # next heartbeat (up to 15 s).
+        for view in list(self._views):
+            self._hass.async_create_task(view._request_info())
+
+    @callback
+    def _check_heartbeat(self, now=None) -> None:
+        """Periodic heartbeat timeout check for every slot on this ESP."""
+        # Also catches an ESPHome entry that was reloaded (or set up after
+        # us) since the last check.
+        self._bind_api_state()
+        if self.last_heartbeat == 0:
+            return  # no heartbeat received yet
+        elapsed = time.monotonic() - self.last_heartbeat
+        if elapsed > ESP_HEARTBEAT_TIMEOUT:
+            for view in list(self._views):
+                view._heartbeat_lost(elapsed)
+
+    async def async_call(
+        self, service: str, data: dict, share_inflight: bool = False
+    ) -> None:
+        """Blocking ``esphome.<service>`` call; raises like ``services.async_call``.
+
+        ``share_inflight`` marks an idempotent call: while the same
+        service (the slot's own service name) with the same data is in
+        flight, the caller waits for that call's outcome instead of making
+        a second one. Other calls go straight to the service; there is no
+        queue or batching. Writes and subscriptions are never shared.
+        """
+        if not share_inflight:
+            await self._hass.services.async_call(
+                "esphome", service, data, blocking=True
+            )
+            return
+        key = (service, tuple(sorted(data.items())))
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._hass.services.async_call(
+                    "esphome", service, data, blocking=True
+                )
+            )
+            self._inflight[key] = pending
+
+            def _done(future: asyncio.Future, key=key) -> None:
+                self._inflight.pop(key, None)
+                # Retrieved here so a failure nobody awaits any more (all
+                # callers cancelled) is not reported as unhandled.
+                if not future.cancelled():
+                    future.exception()
+
+            pending.add_done_callback(_done)
+        await asyncio.shield(pending)
+
+
+@callback
+def async_get_esp_session(hass: HomeAssistant, device_name: str) -> EspBridgeSession:
+    """The shared session of ESPHome device ``device_name``.
+
+    Kept in hass.data while any slot is attached.
+    """
+    sessions: dict[str, EspBridgeSession] = hass.data.setdefault(
+        DATA_ESP_SESSIONS, {}
+    )
+    key = device_name.lower()
+    if (session := sessions.get(key)) is None:
+        session = sessions[key] = EspBridgeSession(hass, device_name)
+        session._on_empty = lambda: sessions.pop(key, None)
+    return session
+
+
 class EspBridgeTransport(ShaverTransport):
     """BLE transport via ESP32 ESPHome bridge.
 
@@ -568,11 +1072,10 @@ class EspBridgeTransport(ShaverTransport):
         self._setup_done = False  # event listeners registered
         self._shaver_connected = False  # ESP↔Shaver BLE link active
         self._esp_alive = False  # heartbeat received from ESP
-        self._last_heartbeat: float = 0.0
         self._disconnect_cb: Callable[[], None] | None = None
-        self._event_unsub: Callable | None = None
-        self._status_unsub: Callable | None = None
-        self._heartbeat_check_unsub: Callable | None = None
+        # Shared per-ESP session (listeners, heartbeat check, outbound
+        # calls); set while this slot is attached to it.
+        self._session: EspBridgeSession | None = None
         # Waiters per characteristic. A list, not a single slot: with the
         # pipelined poll cycle a concurrent entity/service read of the
         # same uuid must not clobber the poll's future (both waiters get
@@ -596,7 +1099,14 @@ class EspBridgeTransport(ShaverTransport):
         # with. Purely diagnostic — surfaced by the ESP Build sensor.
         self._esphome_version: str | None = None
         self._idf_version: str | None = None
+        # ATT MTU of the bridge↔shaver link, reported on info and ready
+        # events (firmware >= 1.15.0). Cleared when the link drops.
+        self._mtu: int | None = None
         self._pending_info: asyncio.Future[dict[str, str]] | None = None
+        self._pending_snapshot: asyncio.Future[dict[str, str]] | None = None
+        # Connection profile the bridge last reported or accepted (see
+        # set_conn_profile); None until known.
+        self._conn_profile: str | None = None
         self._needs_resubscribe = False
         self._ready_event = asyncio.Event()
         # Counts "disconnected" status events. The coordinator compares
@@ -688,6 +1198,10 @@ class EspBridgeTransport(ShaverTransport):
     def idf_version(self) -> str | None:
         return self._idf_version
 
+    @property
+    def mtu(self) -> int | None:
+        return self._mtu if self._shaver_connected else None
+
     @property
     def bridge_boot_time(self) -> datetime | None:
         """Return the ESP bridge boot timestamp.
@@ -742,232 +1256,284 @@ class EspBridgeTransport(ShaverTransport):
                 f"ESPHome service esphome.{svc} not available yet"
             )
 
-        if self._event_unsub:
+        if self._session is not None:
             self._setup_done = True
             # Re-wait for bridge if it went offline and came back
             if not self._esp_alive:
                 await self._wait_for_bridge()
             return
 
-        @callback
-        def _handle_event(event: Event) -> None:
-            data = event.data
-            _LOGGER.log(TRACE, "BLE data event: uuid=%s, pending=%s",
-                        data.get("uuid", "?"), list(self._pending_reads.keys()))
+        # Listeners and the heartbeat check live on the ESP's shared
+        # session; this slot only registers as one of its views.
+        self._session = async_get_esp_session(self._hass, self._device_name)
+        self._session.attach(self)
+        self._setup_done = True
 
-            mac = data.get("mac", "")
+        # Wait for bridge to report alive and device connected
+        await self._wait_for_bridge()
 
-            # Filter: only process events from our shaver (once MAC is known)
-            if mac and self._detected_mac and mac.upper() != self._detected_mac.upper():
-                return
+    def _accepts_mac(self, mac: str) -> bool:
+        """Filter: only process events from our shaver (once MAC is known)."""
+        return not (
+            mac and self._detected_mac and mac.upper() != self._detected_mac.upper()
+        )
 
-            uuid = data.get("uuid", "")
-            payload_hex = data.get("payload", "")
-            error = data.get("error", "")
+    def _set_detected_mac(self, mac: str) -> None:
+        self._detected_mac = mac
+        if self._session is not None:
+            self._session.reindex()
 
-            # Handle error events from ESP (not_found, not_connected, gatt_err_*)
-            if error and uuid and uuid in self._pending_reads:
-                self._last_read_errors[uuid] = error
-                self._resolve_pending_reads(uuid, None)
-                _LOGGER.debug("ESP read error for %s: %s", uuid, error)
-                return
+    @callback
+    def _handle_data_event(self, data: dict) -> None:
+        """BLE data event from the bridge (routed here by the session)."""
+        _LOGGER.log(TRACE, "BLE data event: uuid=%s, pending=%s",
+                    data.get("uuid", "?"), list(self._pending_reads.keys()))
 
-            if not uuid:
-                return
+        mac = data.get("mac", "")
+        if not self._accepts_mac(mac):
+            return
 
-            if not payload_hex:
-                # A successful read of an empty value (0-byte payload, no
-                # error field) — e.g. a blank Device Information string.
-                # Resolve the waiters with None instead of dropping the
-                # event, which would leave them running into the read
-                # timeout and stall every poll on affected characteristics.
-                self._resolve_pending_reads(uuid, None)
-                return
+        uuid = data.get("uuid", "")
+        payload_hex = data.get("payload", "")
+        error = data.get("error", "")
 
-            if mac and not self._detected_mac:
-                self._detected_mac = mac
-                _LOGGER.debug("Detected shaver MAC: %s", mac)
+        # Handle error events from ESP (not_found, not_connected, gatt_err_*)
+        if error and uuid and uuid in self._pending_reads:
+            self._last_read_errors[uuid] = error
+            self._resolve_pending_reads(uuid, None)
+            _LOGGER.debug("ESP read error for %s: %s", uuid, error)
+            return
 
-            try:
-                payload = bytes.fromhex(payload_hex)
-            except ValueError:
-                _LOGGER.warning("Invalid hex payload: %s", payload_hex)
-                return
+        if not uuid:
+            return
 
-            # Resolve pending read(s)
-            if self._resolve_pending_reads(uuid, payload):
-                _LOGGER.log(TRACE, "Resolved pending read for %s", uuid)
-            else:
-                _LOGGER.log(TRACE, "No pending read for %s", uuid)
+        if not payload_hex:
+            # A successful read of an empty value (0-byte payload, no
+            # error field) — e.g. a blank Device Information string.
+            # Resolve the waiters with None instead of dropping the
+            # event, which would leave them running into the read
+            # timeout and stall every poll on affected characteristics.
+            self._resolve_pending_reads(uuid, None)
+            return
 
-            # Fire notification callback
-            if uuid in self._notify_callbacks:
-                self._notify_callbacks[uuid](uuid, payload)
+        if mac and not self._detected_mac:
+            self._set_detected_mac(mac)
+            _LOGGER.debug("Detected shaver MAC: %s", mac)
 
-        self._event_unsub = self._hass.bus.async_listen(
-            ESP_EVENT_NAME, _handle_event
-        )
+        try:
+            payload = bytes.fromhex(payload_hex)
+        except ValueError:
+            _LOGGER.warning("Invalid hex payload: %s", payload_hex)
+            return
 
-        # Listen for ESP↔Shaver BLE status events (connected/disconnected/ready/heartbeat)
-        @callback
-        def _handle_status_event(event: Event) -> None:
-            mac = event.data.get("mac", "")
+        # Resolve pending read(s)
+        if self._resolve_pending_reads(uuid, payload):
+            _LOGGER.log(TRACE, "Resolved pending read for %s", uuid)
+        else:
+            _LOGGER.log(TRACE, "No pending read for %s", uuid)
 
-            # Filter: only process status events from our shaver (once MAC is known)
-            if mac and self._detected_mac and mac.upper() != self._detected_mac.upper():
-                return
+        # Fire notification callback
+        if uuid in self._notify_callbacks:
+            self._notify_callbacks[uuid](uuid, payload)
 
-            status = event.data.get("status", "")
-
-            # Store bridge component version if present
-            version = event.data.get("version")
-            if version:
-                # Defensive: normalise stray surrounding quotes/whitespace so a
-                # firmware that reports e.g. '"1.8.2"' still parses as 1.8.2.
-                if isinstance(version, str):
-                    version = version.strip().strip("\"'").strip()
-                if version != self._bridge_version:
-                    self._bridge_version = version
-                    try:
-                        self._pipelined_reads = (
-                            self._pipelined_reads_enabled
-                            and Version(version)
-                            >= Version(BRIDGE_PIPELINED_READS_VERSION)
-                        )
-                    except Exception:  # noqa: BLE001 — unparseable (dev build)
-                        self._pipelined_reads = False
-
-            # Build-environment fields ride on info events only (not on
-            # heartbeats), so keep the last seen value.
-            for key, attr in (
-                ("esphome_version", "_esphome_version"),
-                ("idf_version", "_idf_version"),
-            ):
-                value = event.data.get(key)
-                if value:
-                    setattr(self, attr, str(value).strip().strip("\"'").strip())
-
-            # Every status event (including heartbeat) proves ESP is alive
-            self._last_heartbeat = time.monotonic()
-            was_alive = self._esp_alive
-            was_connected = self._shaver_connected
+    @callback
+    def _handle_status_event(self, data: dict) -> bool:
+        """ESP↔Shaver BLE status event (connected/disconnected/ready/heartbeat).
+
+        Returns False when the event belongs to another shaver; any
+        accepted event proves the ESP alive (see EspBridgeSession).
+        """
+        mac = data.get("mac", "")
+        if not self._accepts_mac(mac):
+            return False
+
+        status = data.get("status", "")
+
+        # Store bridge component version if present
+        version = data.get("version")
+        if version:
+            # Defensive: normalise stray surrounding quotes/whitespace so a
+            # firmware that reports e.g. '"1.8.2"' still parses as 1.8.2.
+            if isinstance(version, str):
+                version = version.strip().strip("\"'").strip()
+            if version != self._bridge_version:
+                self._bridge_version = version
+                # Imported here: only bridge entries compare versions.
+                from packaging.version import Version
 
-            if not self._esp_alive:
-                self._esp_alive = True
-
-            # Detect ESP restart via uptime regression.  After reboot the
-            # bridge loses all BLE subscriptions, but HA's notify_callbacks
-            # still hold stale entries.  Clear them so the "ready" handler
-            # below flags a resubscribe.  Fires on info/heartbeat/ready
-            # events (all include uptime_s).
-            uptime_str = event.data.get("uptime_s")
-            if uptime_str is not None:
                 try:
-                    new_uptime = int(uptime_str)
-                    is_restart = (
-                        self._last_uptime is not None
-                        and new_uptime < self._last_uptime
+                    self._pipelined_reads = (
+                        self._pipelined_reads_enabled
+                        and Version(version)
+                        >= Version(BRIDGE_PIPELINED_READS_VERSION)
                     )
-                    if is_restart:
-                        _LOGGER.info(
-                            "ESP bridge restarted (uptime %ds → %ds) — "
-                            "clearing stale subscriptions",
-                            self._last_uptime, new_uptime,
-                        )
-                        self._notify_callbacks.clear()
-                        self._needs_resubscribe = True
-                    # Set boot_time on first sighting and on every restart —
-                    # keeps the timestamp stable during normal runtime.
-                    if is_restart or self._boot_time is None:
-                        self._boot_time = datetime.now(timezone.utc) - timedelta(
-                            seconds=new_uptime
-                        )
-                    self._last_uptime = new_uptime
-                except ValueError:
-                    pass
-
-            if status == "info":
-                # Filter by bridge_id if present (multi-device ESP).
-                # Lowercase to match the canonicalized self._esp_bridge_id.
-                event_bridge_id = event.data.get("bridge_id", "").lower()
-                if event_bridge_id and self._esp_bridge_id and event_bridge_id != self._esp_bridge_id:
-                    return
-                # Only set _detected_mac from info events (bridge_id filtered)
-                if mac and not self._detected_mac:
-                    self._detected_mac = mac
-                paired = event.data.get("paired")
-                if paired is not None:
-                    self._ble_paired = paired
-                ble_connected = event.data.get("ble_connected")
-                if ble_connected is not None:
-                    self._shaver_connected = ble_connected == "true"
-                if self._pending_info and not self._pending_info.done():
-                    self._pending_info.set_result(dict(event.data))
-            elif status == "heartbeat":
-                ble_connected = event.data.get("ble_connected") == "true"
-                self._shaver_connected = ble_connected
-                if not ble_connected:
-                    self._cancel_pending_reads()
-            elif status == "ready":
-                self._shaver_connected = True
-                self._ready_event.set()
-                if not self._notify_callbacks:
-                    self._needs_resubscribe = True
-            elif status == "connected":
-                pass  # GATT discovery still in progress
-            elif status == "disconnected":
-                self._shaver_connected = False
-                self._disconnect_count += 1
-                self._cancel_pending_reads()
+                except Exception:  # noqa: BLE001 — unparseable (dev build)
+                    self._pipelined_reads = False
+
+        # Build-environment fields ride on info events only (not on
+        # heartbeats), so keep the last seen value.
+        for key, attr in (
+            ("esphome_version", "_esphome_version"),
+            ("idf_version", "_idf_version"),
+        ):
+            value = data.get(key)
+            if value:
+                setattr(self, attr, str(value).strip().strip("\"'").strip())
+        mtu = data.get("mtu")
+        if mtu is not None:
+            try:
+                self._mtu = int(mtu)
+            except (TypeError, ValueError):
+                pass
 
-            # Fire callback when any component of state changed
-            if self._disconnect_cb and (
-                was_alive != self._esp_alive
-                or was_connected != self._shaver_connected
-            ):
-                self._disconnect_cb()
+        if (conn_profile := data.get("conn_profile")) is not None:
+            self._conn_profile = conn_profile
 
-        self._status_unsub = self._hass.bus.async_listen(
-            ESP_STATUS_EVENT_NAME, _handle_status_event
-        )
+        # Every status event (including heartbeat) proves ESP is alive
+        was_alive = self._esp_alive
+        was_connected = self._shaver_connected
 
-        # Periodic heartbeat timeout check
-        @callback
-        def _check_heartbeat(now=None) -> None:
-            if not self._setup_done:
-                return
-            if self._last_heartbeat == 0:
-                return  # no heartbeat received yet
-            elapsed = time.monotonic() - self._last_heartbeat
-            if elapsed > ESP_HEARTBEAT_TIMEOUT and self._esp_alive:
-                self._esp_alive = False
-                _LOGGER.warning(
-                    "ESP heartbeat timeout (%.0fs) — bridge offline", elapsed
+        if not self._esp_alive:
+            self._esp_alive = True
+
+        # Detect ESP restart via uptime regression.  After reboot the
+        # bridge loses all BLE subscriptions, but HA's notify_callbacks
+        # still hold stale entries.  Clear them so the "ready" handler
+        # below flags a resubscribe.  Fires on info/heartbeat/ready
+        # events (all include uptime_s).
+        uptime_str = data.get("uptime_s")
+        if uptime_str is not None:
+            try:
+                new_uptime = int(uptime_str)
+                is_restart = (
+                    self._last_uptime is not None
+                    and new_uptime < self._last_uptime
                 )
+                if is_restart:
+                    _LOGGER.info(
+                        "ESP bridge restarted (uptime %ds → %ds) — "
+                        "clearing stale subscriptions",
+                        self._last_uptime, new_uptime,
+                    )
+                    self._notify_callbacks.clear()
+                    self._needs_resubscribe = True
+                # Set boot_time on first sighting and on every restart —
+                # keeps the timestamp stable during normal runtime.
+                if is_restart or self._boot_time is None:
+                    self._boot_time = datetime.now(timezone.utc) - timedelta(
+                        seconds=new_uptime
+                    )
+                self._last_uptime = new_uptime
+            except ValueError:
+                pass
+
+        if status == "info":
+            # Filter by bridge_id if present (multi-device ESP).
+            # Lowercase to match the canonicalized self._esp_bridge_id.
+            event_bridge_id = data.get("bridge_id", "").lower()
+            if event_bridge_id and self._esp_bridge_id and event_bridge_id != self._esp_bridge_id:
+                return True
+            # Only set _detected_mac from info events (bridge_id filtered)
+            if mac and not self._detected_mac:
+                self._set_detected_mac(mac)
+            paired = data.get("paired")
+            if paired is not None:
+                self._ble_paired = paired
+            ble_connected = data.get("ble_connected")
+            if ble_connected is not None:
+                self._shaver_connected = ble_connected == "true"
+            if self._pending_info and not self._pending_info.done():
+                self._pending_info.set_result(dict(data))
+        elif status == "snapshot":
+            event_bridge_id = data.get("bridge_id", "").lower()
+            if event_bridge_id and self._esp_bridge_id and event_bridge_id != self._esp_bridge_id:
+                return True
+            if self._pending_snapshot and not self._pending_snapshot.done():
+                self._pending_snapshot.set_result(dict(data))
+        elif status == "heartbeat":
+            ble_connected = data.get("ble_connected") == "true"
+            self._shaver_connected = ble_connected
+            if not ble_connected:
                 self._cancel_pending_reads()
-                if self._disconnect_cb:
-                    self._disconnect_cb()
+        elif status == "ready":
+            if "discovery_ms" in data:
+                # Firmware >= 1.17.0: a "cache" source means the bridge
+                # skipped GATT discovery for this link.
+                _LOGGER.debug(
+                    "%s: GATT table from %s, known %s ms after link open",
+                    self._address, data.get("gatt_source"), data["discovery_ms"],
+                )
+            self._shaver_connected = True
+            self._ready_event.set()
+            if not self._notify_callbacks:
+                self._needs_resubscribe = True
+        elif status == "connected":
+            pass  # GATT discovery still in progress
+        elif status == "disconnected":
+            self._shaver_connected = False
+            self._mtu = None
+            self._disconnect_count += 1
+            self._cancel_pending_reads()
+
+        # Fire callback when any component of state changed
+        if self._disconnect_cb and (
+            was_alive != self._esp_alive
+            or was_connected != self._shaver_connected
+        ):
+            self._disconnect_cb()
+        return True
 
-        self._heartbeat_check_unsub = async_track_time_interval(
-            self._hass, _check_heartbeat, timedelta(seconds=15)
-        )
+    @callback
+    def _heartbeat_lost(self, elapsed: float) -> None:
+        """The ESP went silent for longer than ESP_HEARTBEAT_TIMEOUT."""
+        self._bridge_lost(f"ESP heartbeat timeout ({elapsed:.0f}s)")
 
-        self._setup_done = True
+    @callback
+    def _bridge_lost(self, reason: str) -> None:
+        """Take the slot offline: fail pending reads, tell the coordinator."""
+        if not self._esp_alive:
+            return
+        self._esp_alive = False
+        _LOGGER.warning("%s — bridge offline", reason)
+        self._cancel_pending_reads()
+        if self._disconnect_cb:
+            self._disconnect_cb()
 
-        # Wait for bridge to report alive and device connected
-        await self._wait_for_bridge()
+    async def _request_info(self) -> None:
+        """Best-effort ble_get_info; the reply revives the slot."""
+        try:
+            await self._call("ble_get_info", {}, share_inflight=True)
+        except Exception:  # noqa: BLE001 — services may not be back yet; the heartbeat follows
+            pass
+
+    async def _call(
+        self, action: str, data: dict, share_inflight: bool = False
+    ) -> None:
+        """One blocking ESPHome service call for this slot, via the session queue."""
+        service = self._svc_name(action)
+        if self._session is None:
+            await self._hass.services.async_call(
+                "esphome", service, data, blocking=True
+            )
+            return
+        await self._session.async_call(
+            service, data, share_inflight=share_inflight
+        )
 
     async def _wait_for_bridge(self) -> None:
         """Wait until the ESP bridge reports alive and BLE device connected."""
         if self.is_connected:
             return
+        if self._session is not None and self._session.api_available is False:
+            # ESPHome knows the ESP is unreachable — no point polling it.
+            raise TransportError(
+                f"ESPHome API connection to {self._device_name} is down"
+            )
         self._ready_event.clear()
         _LOGGER.debug("%s: Waiting for ESP bridge ready event...", self._address)
         # Trigger immediate info event instead of waiting for next heartbeat
         try:
-            await self._hass.services.async_call(
-                "esphome", self._svc_name("ble_get_info"), {}, blocking=True,
-            )
+            await self._call("ble_get_info", {}, share_inflight=True)
         except Exception:
             pass
         # Wait up to 10s for ESP to report alive
@@ -1004,15 +1570,9 @@ class EspBridgeTransport(ShaverTransport):
         )
 
     async def disconnect(self) -> None:
-        if self._event_unsub:
-            self._event_unsub()
-            self._event_unsub = None
-        if self._status_unsub:
-            self._status_unsub()
-            self._status_unsub = None
-        if self._heartbeat_check_unsub:
-            self._heartbeat_check_unsub()
-            self._heartbeat_check_unsub = None
+        if self._session is not None:
+            self._session.detach(self)
+            self._session = None
         self._setup_done = False
         self._shaver_connected = False
         self._esp_alive = False
@@ -1037,11 +1597,10 @@ class EspBridgeTransport(ShaverTransport):
         self._pending_reads.setdefault(char_uuid, []).append(future)
 
         try:
-            await self._hass.services.async_call(
-                "esphome",
-                self._svc_name("ble_read_char"),
+            await self._call(
+                "ble_read_char",
                 {"service_uuid": service_uuid, "char_uuid": char_uuid},
-                blocking=True,
+                share_inflight=True,
             )
         except HomeAssistantError as err:
             self._discard_pending_read(char_uuid, future)
@@ -1152,15 +1711,13 @@ class EspBridgeTransport(ShaverTransport):
         service_uuid = self._get_service_uuid(char_uuid)
 
         try:
-            await self._hass.services.async_call(
-                "esphome",
-                self._svc_name("ble_write_char"),
+            await self._call(
+                "ble_write_char",
                 {
                     "service_uuid": service_uuid,
                     "char_uuid": char_uuid,
                     "data": data.hex(),
                 },
-                blocking=True,
             )
         except HomeAssistantError as err:
             raise TransportError(f"ESP write_char failed: {err}") from err
@@ -1175,11 +1732,9 @@ class EspBridgeTransport(ShaverTransport):
         self._notify_callbacks[char_uuid] = cb
 
         try:
-            await self._hass.services.async_call(
-                "esphome",
-                self._svc_name("ble_subscribe"),
+            await self._call(
+                "ble_subscribe",
                 {"service_uuid": service_uuid, "char_uuid": char_uuid},
-                blocking=True,
             )
         except HomeAssistantError as err:
             self._notify_callbacks.pop(char_uuid, None)
@@ -1192,11 +1747,9 @@ class EspBridgeTransport(ShaverTransport):
 
         service_uuid = self._get_service_uuid(char_uuid)
         try:
-            await self._hass.services.async_call(
-                "esphome",
-                self._svc_name("ble_unsubscribe"),
+            await self._call(
+                "ble_unsubscribe",
                 {"service_uuid": service_uuid, "char_uuid": char_uuid},
-                blocking=True,
             )
         except Exception:
             pass
@@ -1214,16 +1767,33 @@ class EspBridgeTransport(ShaverTransport):
         if not self.is_connected:
             return
         try:
-            await self._hass.services.async_call(
-                "esphome",
-                self._svc_name("ble_set_throttle"),
-                {"throttle_ms": str(ms)},
-                blocking=True,
-            )
+            await self._call("ble_set_throttle", {"throttle_ms": str(ms)})
             _LOGGER.info("Notification throttle set to %d ms on ESP bridge", ms)
         except HomeAssistantError as err:
             _LOGGER.debug("Failed to set throttle on ESP bridge: %s", err)
 
+    async def set_conn_profile(self, profile: str) -> None:
+        """Ask the bridge for a connection-parameter profile (>= 1.18.0).
+
+        Skipped when the bridge already reports that profile — it keeps
+        the setting across links and says so in every heartbeat, so only
+        actual changes (and reboots, which reset it to "auto") cost a
+        service call.
+        """
+        if not self._setup_done or profile == self._conn_profile:
+            return
+        if not self._hass.services.has_service(
+            "esphome", self._svc_name("ble_set_conn_profile")
+        ):
+            return
+        try:
+            await self._call("ble_set_conn_profile", {"profile": profile})
+        except HomeAssistantError as err:
+            _LOGGER.debug("Failed to set conn profile on ESP bridge: %s", err)
+            return
+        self._conn_profile = profile
+        _LOGGER.debug("%s: conn profile %s", self._address, profile)
+
     async def get_bridge_info(self) -> dict[str, str] | None:
         """Request diagnostic info from ESP bridge via ble_get_info service."""
         if not self._setup_done:
@@ -1232,12 +1802,7 @@ class EspBridgeTransport(ShaverTransport):
         self._pending_info = self._hass.loop.create_future()
 
         try:
-            await self._hass.services.async_call(
-                "esphome",
-                self._svc_name("ble_get_info"),
-                {},
-                blocking=True,
-            )
+            await self._call("ble_get_info", {}, share_inflight=True)
         except HomeAssistantError as err:
             _LOGGER.debug("ESP get_bridge_info failed: %s", err)
             self._pending_info = None
@@ -1250,5 +1815,48 @@ class EspBridgeTransport(ShaverTransport):
             self._pending_info = None
             return None
 
+    async def get_snapshot(self) -> dict[str, tuple[bytes, float]] | None:
+        """Last cached value per characteristic from the bridge (>= 1.16.0).
+
+        Returns ``{uuid: (payload, age_s)}`` without any GATT traffic — the
+        bridge answers from the values it kept from notifications and read
+        replies, also while the shaver is asleep. None when the firmware
+        has no ``ble_get_snapshot`` service or the bridge does not answer.
+        """
+        if not self._setup_done:
+            return None
+        if not self._hass.services.has_service(
+            "esphome", self._svc_name("ble_get_snapshot")
+        ):
+            return None
+
+        self._pending_snapshot = self._hass.loop.create_future()
+        try:
+            await self._call("ble_get_snapshot", {}, share_inflight=True)
+            data = await asyncio.wait_for(self._pending_snapshot, timeout=5.0)
+        except HomeAssistantError as err:
+            _LOGGER.debug("ESP get_snapshot failed: %s", err)
+            return None
+        except asyncio.TimeoutError:
+            _LOGGER.debug("ESP get_snapshot timeout")
+            return None
+        finally:
+            self._pending_snapshot = None
+
+        mac = (data.get("mac") or "").upper()
+        if mac and self._detected_mac and mac != self._detected_mac.upper():
+            # Cache left from a different shaver (re-paired bridge).
+            return None
+        values: dict[str, tuple[bytes, float]] = {}
+        for key, raw in data.items():
+            if not key.startswith("v."):
+                continue
+            age, _, payload = str(raw).partition(":")
+            try:
+                values[key[2:].lower()] = (bytes.fromhex(payload), float(age))
+            except ValueError:
+                continue
+        return values
+
     def set_disconnect_callback(self, cb: Callable[[], None]) -> None:
         self._disconnect_cb = cb
@@ -4,7 +4,8 @@
 Passive (no install) update entity that surfaces when a newer ESP bridge
 firmware is available. The "latest" version and the changelog are read
 straight from the GitHub repo at runtime, so users are notified of new
-bridge firmware without the integration shipping a release.
+bridge firmware without the integration shipping a release. One fetcher
+serves all bridge entries (see bridge_release).
 
 Flashing itself is done via ESPHome (recompile + OTA) — this entity only
 informs. It exists only for ESP-bridge transports; Direct-BLE setups have
@@ -15,7 +16,6 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import timedelta
 
 from awesomeversion import AwesomeVersion, AwesomeVersionException
 from homeassistant.components.update import (
@@ -26,15 +26,12 @@ from homeassistant.components.update import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
 
+from .bridge_release import async_get_bridge_release
 from .const import (
-    BRIDGE_CHANGELOG_URL,
     BRIDGE_RELEASE_URL,
-    BRIDGE_VERSION_URL,
     CONF_TRANSPORT_TYPE,
     DOMAIN,
     TRANSPORT_ESP_BRIDGE,
@@ -44,9 +41,6 @@ from .entity import PhilipsConnectionEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(hours=24)
-_FETCH_TIMEOUT = 30
-
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -75,7 +69,7 @@ class ShaverBridgeUpdate(PhilipsConnectionEntity, UpdateEntity):
     ) -> None:
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._device_id}_bridge_firmware"
-        self._latest_version: str | None = None
+        self._release = async_get_bridge_release(coordinator.hass)
 
     @property
     def installed_version(self) -> str | None:
@@ -106,7 +100,7 @@ class ShaverBridgeUpdate(PhilipsConnectionEntity, UpdateEntity):
         we report it as the latest, yielding string-equality → up to date.
         """
         installed = self.installed_version
-        latest = self._latest_version
+        latest = self._release.latest_version
         if not latest:
             return installed
         if installed:
@@ -118,43 +112,20 @@ class ShaverBridgeUpdate(PhilipsConnectionEntity, UpdateEntity):
         return latest
 
     async def async_added_to_hass(self) -> None:
-        """Fetch on load, then schedule a periodic refresh.
+        """Follow the shared fetcher and check once on load.
 
-        This is a CoordinatorEntity (``should_poll`` is False), so HA never
-        calls ``async_update`` on its own — we drive the 24 h refresh with our
-        own timer instead.
+        The check is shared too: entries set up together make one request,
+        and the fetcher's own timer refreshes all entities every 24 h.
         """
         await super().async_added_to_hass()
-        await self.async_update()
-
-        async def _refresh(_now) -> None:
-            await self.async_update()
-            self.async_write_ha_state()
-
         self.async_on_remove(
-            async_track_time_interval(self.hass, _refresh, SCAN_INTERVAL)
+            self._release.async_add_listener(self.async_write_ha_state)
         )
+        await self._release.async_check_version()
 
     async def async_update(self) -> None:
-        """Fetch the latest bridge version from the repo."""
-        session = async_get_clientsession(self.hass)
-        try:
-            resp = await session.get(BRIDGE_VERSION_URL, timeout=_FETCH_TIMEOUT)
-            resp.raise_for_status()
-            version = (await resp.text()).strip()
-        except Exception as err:  # noqa: BLE001 — keep last known value on any failure
-            _LOGGER.debug("Failed to fetch latest bridge version: %s", err)
-            return
-
-        if version and re.fullmatch(r"\d+\.\d+\.\d+", version):
-            self._latest_version = version
-            _LOGGER.debug(
-                "Bridge firmware check: installed=%s latest=%s",
-                self.installed_version,
-                version,
-            )
-        else:
-            _LOGGER.debug("Unexpected bridge VERSION payload: %r", version[:64])
+        """Check the published version now (``homeassistant.update_entity``)."""
+        await self._release.async_check_version(max_age=0)
 
     async def async_release_notes(self) -> str | None:
         """Lazily fetch the changelog and return every section the bridge is
@@ -163,17 +134,12 @@ class ShaverBridgeUpdate(PhilipsConnectionEntity, UpdateEntity):
         Only called when the user opens the release-notes dialog, so the 24 h
         poll stays lightweight.
         """
-        latest = self._latest_version
+        latest = self._release.latest_version
         if not latest:
             return None
 
-        session = async_get_clientsession(self.hass)
-        try:
-            resp = await session.get(BRIDGE_CHANGELOG_URL, timeout=_FETCH_TIMEOUT)
-            resp.raise_for_status()
-            changelog = await resp.text()
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug("Failed to fetch bridge changelog: %s", err)
+        changelog = await self._release.async_fetch_changelog()
+        if changelog is None:
             return None
 
         notes = _extract_changelog_sections(changelog, self.installed_version, latest)
@@ -1,6 +1,7 @@
 # config/custom_components/philips_shaver/utils.py
 import struct
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 
@@ -52,6 +53,36 @@ class ShaverCapabilities:
     light_ring: bool = False
 
 
+def pressure_zone(data: dict) -> str | None:
+    """Pressure feedback zone of the current reading.
+
+    The thresholds come from the settings of the active shaving mode
+    (the custom mode has its own); without them there is no contact.
+    """
+    pressure = data.get("pressure")
+    if pressure is None:
+        return None
+
+    mode_id = data.get("shaving_mode_value")
+    settings = data.get(
+        "custom_shaving_settings" if mode_id == 3 else "shaving_settings"
+    )
+    if not settings:
+        return "no_contact"
+
+    low = settings.get("pressure_limit_low", 1500)
+    high = settings.get("pressure_limit_high", 4000)
+    base = settings.get("pressure_base_value", 500)
+
+    if pressure < base:
+        return "no_contact"
+    if pressure < low:
+        return "too_low"
+    if pressure <= high:
+        return "optimal"
+    return "too_high"
+
+
 def parse_capabilities(val: int) -> ShaverCapabilities:
     """Parse the capabilities integer into a ShaverCapabilities dataclass."""
 
@@ -74,41 +105,41 @@ def get_real_timestamp(history_ts, total_age):
     return now_seconds + offset
 
 
-""" CHAR_HISTORY_PRESSURE_DATA """
+# Pressure history (CHAR_HISTORY_PRESSURE_DATA, 0x0317): a ring buffer of
+# fixed 15-byte records, one per shaving session:
+# B = verdict (UINT8)
+# H = duration with no / low / ok / high pressure in seconds (UINT16) x 4
+# H = average pressure (UINT16)
+# I = timestamp (UINT32, device age in seconds)
+# < = Little Endian
+PRESSURE_HISTORY_RECORD = struct.Struct("<BHHHHHI")
+
+
+def iter_pressure_history(
+    raw_data: bytes | bytearray | memoryview,
+) -> Iterator[dict]:
+    """Yield pressure-history records from ``raw_data`` one at a time.
+
+    ``struct.iter_unpack`` walks a memoryview of the buffer, so the records
+    decode in a single pass without copying each 15-byte block out first.
+    A trailing partial block (truncated read) is ignored.
+    """
+    size = PRESSURE_HISTORY_RECORD.size
+    view = memoryview(raw_data)
+    usable = len(view) - len(view) % size
+    records = PRESSURE_HISTORY_RECORD.iter_unpack(view[:usable])
+    for verdict, d_none, d_low, d_ok, d_high, avg, ts in records:
+        yield {
+            "verdict": verdict,
+            "duration_none": d_none,
+            "duration_low": d_low,
+            "duration_ok": d_ok,
+            "duration_high": d_high,
+            "pressure_average": avg,
+            "timestamp": ts,
+        }
+
+
 def parse_pressure_history(total_age, raw_data: bytes) -> list[dict]:
     """Parses the pressure history raw data into a list of dictionaries."""
-
-    history = []
-    block_size = 15
-    # Calculate how many complete 15-byte blocks are contained
-    num_blocks = len(raw_data) // block_size
-
-    for i in range(num_blocks):
-        offset = i * block_size
-        block = raw_data[offset : offset + block_size]
-
-        # Unpack according to schema:
-        # B = 1 byte (UINT8)
-        # H = 2 bytes (UINT16) x 5
-        # I = 4 bytes (UINT32) x 1
-        # < = Little Endian
-        try:
-            verdict, d_none, d_low, d_ok, d_high, avg, ts = struct.unpack(
-                "<BHHHHHI", block
-            )
-
-            history.append(
-                {
-                    "verdict": verdict,
-                    "duration_none": d_none,
-                    "duration_low": d_low,
-                    "duration_ok": d_ok,
-                    "duration_high": d_high,
-                    "pressure_average": avg,
-                    "timestamp": ts,
-                }
-            )
-        except struct.error:
-            continue
-
-    return history
+    return list(iter_pressure_history(raw_data))
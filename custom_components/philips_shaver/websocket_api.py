@@ -0,0 +1,207 @@
+# custom_components/philips_shaver/websocket_api.py
+"""Websocket subscription for the bundled card.
+
+The card used to assemble each shaver from its entities: it looked the
+device up in ``hass.devices``, its entities in ``hass.entities`` and their
+values in ``hass.states``, and rendered again on every state change. A
+live session notifies several characteristics a second, each of which
+rewrites a handful of entities, so a dashboard showing a few shavers
+processed dozens of state objects per notification.
+
+``philips_shaver/subscribe`` streams the coordinator data of one device
+instead: a snapshot first, then only the keys that changed. Each
+subscription sends at most one message per ``min_interval``; updates in
+between are folded into the next delta, so a burst of notifications
+reaches the client as one message.
+
+Messages (``event`` of the subscription)::
+
+    {"snapshot": {...}}                     # once, right after the result
+    {"delta": {...}, "removed": [...]}      # changed keys; "removed" only
+                                            # when keys disappeared
+    {"ended": true}                         # the entry unloaded (reload,
+                                            # options change): subscribe again
+
+A reload replaces the coordinator, so a subscription that outlived it
+would stay on the old one and go silent. Unloading an entry ends its
+subscriptions instead.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+WS_TYPE_SUBSCRIBE = f"{DOMAIN}/subscribe"
+# Entry id → its open subscriptions.
+DATA_WS_SUBSCRIPTIONS = "philips_shaver_ws_subscriptions"
+# Gap between two messages to one subscriber: the default, and the lowest
+# a client may ask for.
+DEFAULT_MIN_INTERVAL = 0.5
+MIN_INTERVAL_FLOOR = 0.1
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+def _card_state(coordinator) -> dict[str, Any]:
+    """The coordinator data as the card gets it.
+
+    Private keys and raw characteristic bytes stay out (the latter do not
+    serialize); whether the shaver is connected right now is added.
+    """
+    state = {
+        key: value
+        for key, value in (coordinator.data or {}).items()
+        if not key.startswith("_") and not isinstance(value, (bytes, bytearray))
+    }
+    state["connected"] = coordinator.transport.is_connected
+    return state
+
+
+@callback
+def async_end_subscriptions(hass: HomeAssistant, entry_id: str) -> None:
+    """End the subscriptions to an entry that is unloading."""
+    subscriptions = hass.data.get(DATA_WS_SUBSCRIPTIONS, {}).pop(entry_id, set())
+    for subscription in list(subscriptions):
+        subscription.async_end()
+
+
+@callback
+def _coordinator_for_device(hass: HomeAssistant, device_id: str):
+    """The entry id and coordinator owning a device (the shaver or a sub-device)."""
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        return None, None
+    entries = hass.data.get(DOMAIN, {})
+    for entry_id in device.config_entries:
+        if isinstance(data := entries.get(entry_id), dict):
+            return entry_id, data.get("coordinator")
+    return None, None
+
+
+class _Subscription:
+    """One client's stream of one device, rate-limited."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        entry_id: str,
+        coordinator,
+        min_interval: float,
+    ) -> None:
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._entry_id = entry_id
+        self._coordinator = coordinator
+        self._min_interval = min_interval
+        self._sent: dict[str, Any] = {}
+        self._last_send = 0.0
+        self._flush_unsub: CALLBACK_TYPE | None = None
+        self._remove_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Send the snapshot and follow the coordinator; returns the unsubscribe."""
+        self._sent = _card_state(self._coordinator)
+        self._send({"snapshot": self._sent})
+        self._remove_listener = self._coordinator.async_add_listener(self._on_update)
+        self._hass.data.setdefault(DATA_WS_SUBSCRIPTIONS, {}).setdefault(
+            self._entry_id, set()
+        ).add(self)
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        self._hass.data.get(DATA_WS_SUBSCRIPTIONS, {}).get(
+            self._entry_id, set()
+        ).discard(self)
+
+    @callback
+    def async_end(self) -> None:
+        """Stop from our side and tell the client."""
+        self.async_stop()
+        self._connection.subscriptions.pop(self._msg_id, None)
+        self._send({"ended": True})
+
+    @callback
+    def _on_update(self) -> None:
+        if self._flush_unsub is not None:
+            return  # the pending flush sends the state as of then
+        wait = self._min_interval - (time.monotonic() - self._last_send)
+        if wait > 0:
+            self._flush_unsub = async_call_later(self._hass, wait, self._flush)
+            return
+        self._flush()
+
+    @callback
+    def _flush(self, _now: Any = None) -> None:
+        self._flush_unsub = None
+        state = _card_state(self._coordinator)
+        changed = {
+            key: value
+            for key, value in state.items()
+            if key not in self._sent or self._sent[key] != value
+        }
+        removed = [key for key in self._sent if key not in state]
+        if not changed and not removed:
+            return
+        self._sent = state
+        message: dict[str, Any] = {"delta": changed}
+        if removed:
+            message["removed"] = removed
+        self._send(message)
+
+    @callback
+    def _send(self, event: dict[str, Any]) -> None:
+        self._last_send = time.monotonic()
+        self._connection.send_message(
+            websocket_api.event_message(self._msg_id, event)
+        )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE,
+        vol.Required("device_id"): str,
+        vol.Optional("min_interval", default=DEFAULT_MIN_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=MIN_INTERVAL_FLOOR)
+        ),
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream one shaver's data: a snapshot, then deltas."""
+    entry_id, coordinator = _coordinator_for_device(hass, msg["device_id"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Not a loaded Philips Shaver device"
+        )
+        return
+    subscription = _Subscription(
+        hass, connection, msg["id"], entry_id, coordinator, msg["min_interval"]
+    )
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = subscription.async_start()
@@ -0,0 +1,369 @@
+# custom_components/philips_shaver/write_queue.py
+"""Coalescing per-characteristic writes for the settings entities.
+
+The light ring colors, brightness, shaving mode and light-ring switch
+each wrote straight to the transport from the entity. Dragging a color
+picker fires a service call for every step of the drag. Every call became
+its own GATT write (a blocking service call on the ESP bridge) and its own
+copy of the coordinator data. The writes queued behind each other on the
+radio, and the ring kept changing for seconds after the user let go.
+
+The queue keeps at most one write per characteristic on the air. A value
+that arrives while a write is in flight replaces any value still waiting
+(last write wins), so a drag ends with the final color written right
+after the one in flight. Entities show the new value at once through an
+optimistic update of the coordinator data. The confirmed values come back
+if the last write of a burst fails.
+
+A change made while the shaver sleeps is deferred instead of dropped. The
+queue keeps it, persisted with the device data, and the coordinator
+flushes all deferred writes right after the next connect, before its read
+batch. Each deferred write remembers the value it was made against
+(``base``) and the bits it owns (``mask``). The flush reads the current
+value first. If the owned bits changed on the shaver since, the shaver's
+newer value wins and the write is dropped. Otherwise the owned bits are
+merged onto the current value and written. Later changes to the same
+characteristic merge into one deferred write, so a burst of changes made
+while asleep still costs one write on wake.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .exceptions import TransportError
+
+if TYPE_CHECKING:
+    from .coordinator import PhilipsShaverCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key of the deferred writes in the coordinator's device-data store.
+STORE_KEY = "pending_writes"
+
+
+def _and(a: bytes, b: bytes) -> bytes:
+    return bytes(x & y for x, y in zip(a, b))
+
+
+def _merge(value: bytes, data: bytes, mask: bytes) -> bytes:
+    """``data``'s bits under ``mask``, ``value``'s everywhere else."""
+    return bytes((v & ~m) | (d & m) for v, d, m in zip(value, data, mask))
+
+
+@dataclass
+class DeferredWrite:
+    """A write held back until the shaver is connected again."""
+
+    data: bytes
+    # Bits of the characteristic this write owns.
+    mask: bytes
+    # The value the change was made against; None when it was unknown.
+    base: bytes | None = None
+
+    def merged(self, newer: DeferredWrite) -> DeferredWrite:
+        """This write with ``newer`` applied on top."""
+        if len(newer.data) != len(self.data):
+            return newer
+        base = None
+        if self.base is not None and newer.base is not None:
+            # Bits first owned by the newer write take its base.
+            base = _merge(newer.base, self.base, self.mask)
+        return DeferredWrite(
+            _merge(self.data, newer.data, newer.mask),
+            bytes(a | b for a, b in zip(self.mask, newer.mask)),
+            base,
+        )
+
+    def to_store(self) -> dict[str, str | None]:
+        return {
+            "data": self.data.hex(),
+            "mask": self.mask.hex(),
+            "base": self.base.hex() if self.base is not None else None,
+        }
+
+    @classmethod
+    def from_store(cls, stored: dict[str, Any]) -> DeferredWrite:
+        base = stored.get("base")
+        return cls(
+            bytes.fromhex(stored["data"]),
+            bytes.fromhex(stored["mask"]),
+            bytes.fromhex(base) if base is not None else None,
+        )
+
+
+@dataclass
+class _CharSlot:
+    """Write state of one characteristic."""
+
+    # Latest value not yet on the air; replaced by every newer write.
+    pending: bytes | None = None
+    # Optimistic coordinator values ``pending`` carries.
+    pending_values: dict[str, Any] = field(default_factory=dict)
+    # Callers waiting for ``pending`` (or the value that replaced theirs).
+    waiters: list[asyncio.Future] = field(default_factory=list)
+    task: asyncio.Task | None = None
+    # Coordinator values as last written (from before the burst until the
+    # burst's first write went through); a failed write returns to them.
+    confirmed: dict[str, Any] = field(default_factory=dict)
+
+
+class CharWriteQueue:
+    """Last-write-wins write queue with one in-flight write per characteristic."""
+
+    def __init__(self, coordinator: PhilipsShaverCoordinator) -> None:
+        self._coordinator = coordinator
+        self._slots: dict[str, _CharSlot] = {}
+        self._deferred: dict[str, DeferredWrite] = {}
+        # Serialize bit clears per characteristic from reading the value to
+        # queueing the result, so none builds on a value another replaces.
+        self._clear_locks: dict[str, asyncio.Lock] = {}
+
+    @property
+    def has_deferred(self) -> bool:
+        return bool(self._deferred)
+
+    async def async_write(
+        self,
+        char_uuid: str,
+        data: bytes,
+        optimistic: dict[str, Any] | None = None,
+        *,
+        mask: bytes | None = None,
+        base: bytes | None = None,
+    ) -> bool:
+        """Queue ``data`` for ``char_uuid`` and wait until it (or a newer value) is written.
+
+        ``optimistic`` coordinator values are shown right away. Raises the
+        transport's error if the write carrying the value fails. Returns
+        False when the shaver is not connected and the write was deferred
+        to the next connect; ``mask`` and ``base`` then say which bits the
+        write owns and what value it was made against (see module doc).
+        """
+        waiter = self._enqueue(char_uuid, data, optimistic, mask, base)
+        if waiter is None:
+            return False
+        await waiter
+        return True
+
+    @callback
+    def _enqueue(
+        self,
+        char_uuid: str,
+        data: bytes,
+        optimistic: dict[str, Any] | None,
+        mask: bytes | None,
+        base: bytes | None,
+    ) -> asyncio.Future[None] | None:
+        """Queue or defer the write; the future to await, None if deferred."""
+        if not self._coordinator.transport.is_connected:
+            self._defer(char_uuid, data, optimistic, mask, base)
+            return None
+        slot = self._slots.setdefault(char_uuid, _CharSlot())
+        if optimistic:
+            self._apply_optimistic(slot, optimistic)
+        if slot.pending is not None:
+            _LOGGER.debug("%s: coalesced a superseded write", char_uuid)
+        else:
+            slot.pending_values = {}
+        slot.pending = bytes(data)
+        slot.pending_values.update(optimistic or {})
+        waiter = asyncio.get_running_loop().create_future()
+        slot.waiters.append(waiter)
+        if slot.task is None:
+            coordinator = self._coordinator
+            slot.task = coordinator.entry.async_create_background_task(
+                coordinator.hass,
+                self._async_drain(char_uuid, slot),
+                f"philips_shaver_write_{char_uuid}",
+            )
+            if slot.task.done():  # ran to completion eagerly
+                slot.task = None
+        return waiter
+
+    async def async_clear_bits(
+        self, char_uuid: str, key: str, bits: int, size: int = 4
+    ) -> bool:
+        """Clear ``bits`` in the bitfield the coordinator holds under ``key``.
+
+        Works on the cached value once the shaver sent it on this link: the
+        characteristic is subscribed, so the cache follows the shaver, and
+        the next notification confirms the result. Before that the cache
+        may be a default or stale, and the rest of the bitfield would be
+        overwritten with it, so the value is read first (unless ``bits``
+        covers all of it). Clears that arrive while a write is in flight
+        build on its optimistic value and go out together in the next
+        write. Returns like :meth:`async_write`.
+        """
+        coordinator = self._coordinator
+        full = (1 << (8 * size)) - 1
+        async with self._clear_locks.setdefault(char_uuid, asyncio.Lock()):
+            # Taken under the lock: a clear queued while this one waited
+            # has put its result here.
+            cached = coordinator.data.get(key)
+            known = cached if char_uuid in coordinator.received_chars else None
+            if known is None and coordinator.transport.is_connected and bits != full:
+                raw = await coordinator.transport.read_char(char_uuid)
+                if raw is None or len(raw) < size:
+                    raise TransportError(
+                        f"{char_uuid}: current value could not be read"
+                    )
+                known = int.from_bytes(raw[:size], "little")
+                coordinator.received_chars.add(char_uuid)
+            # Asleep, the deferred write only owns ``bits`` and is merged onto
+            # the value read on the next connect.
+            updated = (known if known is not None else cached or 0) & ~bits
+            waiter = self._enqueue(
+                char_uuid,
+                updated.to_bytes(size, "little"),
+                {key: updated},
+                bits.to_bytes(size, "little"),
+                known.to_bytes(size, "little") if known is not None else None,
+            )
+        if waiter is None:
+            return False
+        await waiter
+        return True
+
+    @callback
+    def _defer(
+        self,
+        char_uuid: str,
+        data: bytes,
+        optimistic: dict[str, Any] | None,
+        mask: bytes | None,
+        base: bytes | None,
+    ) -> None:
+        write = DeferredWrite(bytes(data), mask or b"\xff" * len(data), base)
+        if (older := self._deferred.get(char_uuid)) is not None:
+            write = older.merged(write)
+        self._deferred[char_uuid] = write
+        _LOGGER.info(
+            "%s: shaver not connected — %s write deferred to the next connect",
+            self._coordinator.address, char_uuid,
+        )
+        data_now = self._coordinator.data
+        data_now.update(optimistic or {})
+        # Publishes the optimistic values and persists the deferred write.
+        self._coordinator.async_set_updated_data(data_now)
+
+    def deferred_for_store(self) -> dict[str, dict[str, str | None]]:
+        return {uuid: w.to_store() for uuid, w in self._deferred.items()}
+
+    @callback
+    def restore_deferred(self, stored: dict[str, Any] | None) -> None:
+        """Take back the deferred writes persisted before a restart."""
+        for uuid, entry in (stored or {}).items():
+            try:
+                self._deferred[uuid] = DeferredWrite.from_store(entry)
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.debug("Dropping unreadable deferred write for %s", uuid)
+
+    async def async_flush_deferred(self) -> dict[str, bytes]:
+        """Apply the deferred writes on a fresh link, oldest first.
+
+        Returns the value each flushed characteristic now holds (written
+        or kept), for the caller to publish in place of reading it again.
+        Writes that could not be applied stay deferred for the next
+        connect.
+        """
+        transport = self._coordinator.transport
+        values: dict[str, bytes] = {}
+        for uuid, write in list(self._deferred.items()):
+            if not transport.is_connected:
+                break
+            current = await transport.read_char(uuid)
+            if current is None or len(current) != len(write.data):
+                if write.mask != b"\xff" * len(write.data):
+                    # Nothing to merge the owned bits onto.
+                    continue
+                target = write.data
+            else:
+                owned = _and(current, write.mask)
+                target = _merge(current, write.data, write.mask)
+                if owned == _and(write.data, write.mask):
+                    _LOGGER.debug("%s: deferred write already applied", uuid)
+                    self._deferred.pop(uuid)
+                    values[uuid] = current
+                    continue
+                if write.base is not None and owned != _and(write.base, write.mask):
+                    _LOGGER.info(
+                        "%s: %s changed on the shaver since the deferred "
+                        "write — keeping the shaver's value",
+                        self._coordinator.address, uuid,
+                    )
+                    self._deferred.pop(uuid)
+                    values[uuid] = current
+                    continue
+            try:
+                await transport.write_char(uuid, target)
+            except Exception as err:  # noqa: BLE001 — retried on the next connect
+                _LOGGER.debug("Deferred write to %s failed: %s", uuid, err)
+                break
+            _LOGGER.info(
+                "%s: applied deferred write to %s", self._coordinator.address, uuid
+            )
+            self._deferred.pop(uuid)
+            values[uuid] = target
+        return values
+
+    @callback
+    def _apply_optimistic(self, slot: _CharSlot, values: dict[str, Any]) -> None:
+        data = self._coordinator.data
+        for key, value in values.items():
+            slot.confirmed.setdefault(key, data.get(key))
+            data[key] = value
+        # Listeners only; the store is saved once the write went through.
+        self._coordinator.async_update_listeners()
+
+    async def _async_drain(self, char_uuid: str, slot: _CharSlot) -> None:
+        try:
+            while slot.pending is not None:
+                data, slot.pending = slot.pending, None
+                values, slot.pending_values = slot.pending_values, {}
+                waiters, slot.waiters = slot.waiters, []
+                try:
+                    await self._coordinator.transport.write_char(char_uuid, data)
+                except Exception as err:  # noqa: BLE001 — handed to the callers
+                    if slot.pending is not None:
+                        # Superseded anyway: these callers get the outcome
+                        # of the newer value instead.
+                        slot.waiters[:0] = waiters
+                        continue
+                    self._roll_back(slot)
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                    continue
+                # On the shaver now: a later failure of the burst returns
+                # to these values, not to those from before the burst.
+                slot.confirmed.update(values)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+                if slot.pending is None:
+                    slot.confirmed.clear()
+                    data_now = self._coordinator.data
+                    data_now["last_seen"] = datetime.now(timezone.utc)
+                    self._coordinator.async_set_updated_data(data_now)
+        finally:
+            slot.task = None
+            for waiter in slot.waiters:
+                if not waiter.done():
+                    waiter.cancel()
+            slot.waiters.clear()
+            slot.pending = None
+            slot.pending_values = {}
+
+    @callback
+    def _roll_back(self, slot: _CharSlot) -> None:
+        if not slot.confirmed:
+            return
+        self._coordinator.data.update(slot.confirmed)
+        slot.confirmed.clear()
+        self._coordinator.async_update_listeners()
@@ -51,8 +51,13 @@ void ShaverBridge::setup() {
   this->register_service(&ShaverBridge::on_set_throttle,
                           this->svc_name_("ble_set_throttle"),
                           {"throttle_ms"});
+  this->register_service(&ShaverBridge::on_set_conn_profile,
+                          this->svc_name_("ble_set_conn_profile"),
+                          {"profile"});
   this->register_service(&ShaverBridge::on_get_info,
                           this->svc_name_("ble_get_info"), {});
+  this->register_service(&ShaverBridge::on_get_snapshot,
+                          this->svc_name_("ble_get_snapshot"), {});
   this->register_service(&ShaverBridge::on_pair_mode,
                           this->svc_name_("ble_pair_mode"),
                           {"enabled", "timeout_s"});
@@ -96,6 +101,8 @@ void ShaverBridge::loop() {
     if (this->coord_ != nullptr) {
       data["ble_connected"] = this->coord_->is_connected() ? "true" : "false";
       data["mac"] = this->coord_->get_remote_mac();
+      // Lets HA notice a profile it set was lost to a reboot.
+      data["conn_profile"] = this->coord_->get_conn_profile_name();
     }
     this->fire_event(EVENT_STATUS, data);
 
@@ -184,6 +191,16 @@ void ShaverBridge::on_set_throttle(std::string throttle_ms) {
   this->coord_->set_throttle(ms);
 }
 
+void ShaverBridge::on_set_conn_profile(std::string profile) {
+  if (this->coord_ != nullptr)
+    this->coord_->set_conn_profile(profile);
+}
+
+void ShaverBridge::on_get_snapshot() {
+  if (this->coord_ != nullptr)
+    this->coord_->emit_snapshot();
+}
+
 void ShaverBridge::on_pair_mode(bool enabled, std::string timeout_s) {
   if (this->coord_ == nullptr)
     return;
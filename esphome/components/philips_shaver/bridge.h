@@ -55,7 +55,9 @@ class ShaverBridge : public Component, public api::CustomAPIDevice {
   void on_write_characteristic(std::string service_uuid,
                                 std::string char_uuid, std::string hex_data);
   void on_set_throttle(std::string throttle_ms);
+  void on_set_conn_profile(std::string profile);
   void on_get_info();
+  void on_get_snapshot();
   // Mode B services — guarded inside the Coordinator (no-ops in Mode A).
   void on_pair_mode(bool enabled, std::string timeout_s);
   void on_unpair();
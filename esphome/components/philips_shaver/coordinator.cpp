@@ -5,6 +5,7 @@
 #include "esphome/core/helpers.h"
 #include "esphome/core/version.h"
 
+#include <esp_gatt_common_api.h>
 #include <esp_system.h>
 
 namespace espbt = esphome::esp32_ble_tracker;
@@ -14,6 +15,23 @@ namespace philips_shaver {
 
 static const char *const TAG = "philips_shaver.coord";
 
+bool ShaverCoordinator::local_mtu_set_ = false;
+
+void ShaverCoordinator::ensure_local_mtu_() {
+  if (ShaverCoordinator::local_mtu_set_)
+    return;
+  // Called from the worker's setup() (AFTER_BLUETOOTH), so Bluedroid is up
+  // and no connection has been opened yet — the exchange request
+  // BLEClientBase sends on OPEN_EVT already offers the larger size.
+  esp_err_t err = esp_ble_gatt_set_local_mtu(LOCAL_MTU);
+  if (err != ESP_OK) {
+    ESP_LOGW(TAG, "esp_ble_gatt_set_local_mtu(%u) failed, status=%d",
+             (unsigned) LOCAL_MTU, err);
+    return;
+  }
+  ShaverCoordinator::local_mtu_set_ = true;
+}
+
 static espbt::ESPBTUUID parse_uuid(const std::string &uuid_str) {
   if (uuid_str.length() <= 8) {
     uint16_t uuid16 = std::stoul(uuid_str, nullptr, 16);
@@ -75,13 +93,71 @@ void ShaverCoordinator::log_conn_params_if_changed_() {
            "Conn params now: interval=%u ms latency=%u timeout=%u ms",
            (unsigned) (p.interval * 125 / 100), (unsigned) p.latency,
            (unsigned) (p.timeout * 10));
+  // The shaver may have moved the link off a standing profile.
+  if (this->conn_profile_ != ConnProfile::AUTO)
+    this->apply_conn_profile_();
 }
 
-void ShaverCoordinator::maybe_boost_conn_params_() {
+const char *ShaverCoordinator::conn_profile_name_(ConnProfile profile) {
+  switch (profile) {
+    case ConnProfile::REALTIME:
+      return "realtime";
+    case ConnProfile::BULK:
+      return "bulk";
+    case ConnProfile::IDLE:
+      return "idle";
+    default:
+      return "auto";
+  }
+}
+
+ShaverCoordinator::ConnProfileParams ShaverCoordinator::conn_profile_params_(
+    ConnProfile profile) {
+  switch (profile) {
+    case ConnProfile::REALTIME:
+      return {REALTIME_INTERVAL_MIN_UNITS, REALTIME_INTERVAL_MAX_UNITS, 0};
+    case ConnProfile::IDLE:
+      return {IDLE_INTERVAL_MIN_UNITS, IDLE_INTERVAL_MAX_UNITS, 1};
+    default:
+      return {BULK_INTERVAL_MIN_UNITS, BULK_INTERVAL_MAX_UNITS, 0};
+  }
+}
+
+bool ShaverCoordinator::set_conn_profile(const std::string &name) {
+  ConnProfile profile;
+  if (name == "auto") {
+    profile = ConnProfile::AUTO;
+  } else if (name == "realtime") {
+    profile = ConnProfile::REALTIME;
+  } else if (name == "bulk") {
+    profile = ConnProfile::BULK;
+  } else if (name == "idle") {
+    profile = ConnProfile::IDLE;
+  } else {
+    ESP_LOGW(this->log_tag_.c_str(), "Unknown conn profile '%s' — ignoring",
+             name.c_str());
+    return false;
+  }
+  if (profile == this->conn_profile_)
+    return true;
+  ESP_LOGI(this->log_tag_.c_str(), "Conn profile %s -> %s",
+           conn_profile_name_(this->conn_profile_), name.c_str());
+  this->conn_profile_ = profile;
+  // A deliberate switch is not a retry — let it through immediately.
+  this->last_boost_request_ms_ = 0;
+  this->apply_conn_profile_();
+  return true;
+}
+
+void ShaverCoordinator::apply_conn_profile_() {
   if (this->parent_ == nullptr || !this->connected_)
     return;
-  if (this->pending_calls_.size() < BOOST_QUEUE_DEPTH)
-    return;
+  ConnProfile profile = this->conn_profile_;
+  if (profile == ConnProfile::AUTO) {
+    if (this->pending_calls_.size() < BOOST_QUEUE_DEPTH)
+      return;
+    profile = ConnProfile::BULK;
+  }
   uint32_t now = millis();
   if (this->last_boost_request_ms_ != 0 &&
       (now - this->last_boost_request_ms_) < BOOST_COOLDOWN_MS)
@@ -90,32 +166,38 @@ void ShaverCoordinator::maybe_boost_conn_params_() {
   if (esp_ble_get_current_conn_params(this->parent_->get_remote_bda(),
                                       &current) != ESP_OK)
     return;
-  // Fresh connections (35 ms) and motor-on links (15 ms) are already
-  // fast; only the idle power-save profile (245 ms + latency 1) needs
-  // the boost.
-  if (current.interval <= BOOST_INTERVAL_MAX_UNITS && current.latency == 0)
+  ConnProfileParams want = conn_profile_params_(profile);
+  if (profile == ConnProfile::IDLE) {
+    if (current.interval >= want.min_units)
+      return;
+  } else if (current.interval <= want.max_units && current.latency == 0) {
     return;
+  }
 
   esp_ble_conn_update_params_t params = {};
   memcpy(params.bda, this->parent_->get_remote_bda(), sizeof(params.bda));
-  params.min_int = BOOST_INTERVAL_MIN_UNITS;
-  params.max_int = BOOST_INTERVAL_MAX_UNITS;
-  params.latency = 0;
+  params.min_int = want.min_units;
+  params.max_int = want.max_units;
+  params.latency = want.latency;
   params.timeout = current.timeout;
+  if (profile == ConnProfile::IDLE && params.timeout < IDLE_SUPERVISION_TIMEOUT)
+    params.timeout = IDLE_SUPERVISION_TIMEOUT;
 
   this->last_boost_request_ms_ = now;
   auto status = esp_ble_gap_update_conn_params(&params);
   if (status == ESP_OK) {
     ESP_LOGI(this->log_tag_.c_str(),
-             "Requesting conn-param boost %u ms/lat %u -> %u-%u ms/lat 0 "
+             "Requesting %s conn params %u ms/lat %u -> %u-%u ms/lat %u "
              "(%u call(s) queued)",
+             conn_profile_name_(profile),
              (unsigned) (current.interval * 125 / 100),
              (unsigned) current.latency,
-             (unsigned) (BOOST_INTERVAL_MIN_UNITS * 125 / 100),
-             (unsigned) (BOOST_INTERVAL_MAX_UNITS * 125 / 100),
+             (unsigned) (want.min_units * 125 / 100),
+             (unsigned) (want.max_units * 125 / 100),
+             (unsigned) want.latency,
              (unsigned) this->pending_calls_.size());
   } else {
-    ESP_LOGW(this->log_tag_.c_str(), "Conn-param boost request failed: %d",
+    ESP_LOGW(this->log_tag_.c_str(), "Conn-param request failed: %d",
              status);
   }
 }
@@ -301,6 +383,9 @@ std::map<std::string, std::string> ShaverCoordinator::collect_info_data() {
   snprintf(throttle_str, sizeof(throttle_str), "%u",
            (unsigned) this->notify_throttle_ms_);
 
+  char mtu_str[8];
+  snprintf(mtu_str, sizeof(mtu_str), "%u", (unsigned) this->mtu_);
+
   // Check if shaver MAC is in the bonded device list
   std::string paired = "false";
   if (this->parent_ != nullptr) {
@@ -321,10 +406,12 @@ std::map<std::string, std::string> ShaverCoordinator::collect_info_data() {
 
   std::map<std::string, std::string> data = {
       {"version", PHILIPS_SHAVER_VERSION},
+      {"conn_profile", conn_profile_name_(this->conn_profile_)},
       {"ble_connected", this->connected_ ? "true" : "false"},
       {"mac", this->get_remote_mac()},
       {"subscriptions", std::string(subs_str)},
       {"notify_throttle_ms", std::string(throttle_str)},
+      {"mtu", std::string(mtu_str)},
       {"paired", paired},
       {"mode", this->mode_},
       {"identity_source", this->identity_source_},
@@ -340,10 +427,31 @@ std::map<std::string, std::string> ShaverCoordinator::collect_info_data() {
   if (!this->remote_name_.empty()) {
     data["ble_name"] = this->remote_name_;
   }
+  // Parameters the link actually runs at — the shaver has the last word
+  // on what a requested profile turns into.
+  esp_gap_conn_params_t conn;
+  if (this->connected_ && this->parent_ != nullptr &&
+      esp_ble_get_current_conn_params(this->parent_->get_remote_bda(),
+                                      &conn) == ESP_OK) {
+    char buf[16];
+    snprintf(buf, sizeof(buf), "%.2f", conn.interval * 1.25f);
+    data["conn_interval_ms"] = buf;
+    snprintf(buf, sizeof(buf), "%u", (unsigned) conn.latency);
+    data["conn_latency"] = buf;
+    snprintf(buf, sizeof(buf), "%u", (unsigned) (conn.timeout * 10));
+    data["conn_timeout_ms"] = buf;
+  }
 
   // Build environment of the running firmware. The same bridge version
   // behaves differently depending on the underlying stack (Bluedroid fixes
   // ship via ESP-IDF), so surface both for support/diagnostics.
+  // Whether attribute tables persist across links (cache_services, or a
+  // bluetooth_proxy on the node that enables the same option).
+#ifdef CONFIG_BT_GATTC_CACHE_NVS_FLASH
+  data["gatt_cache"] = "true";
+#else
+  data["gatt_cache"] = "false";
+#endif
   data["esphome_version"] = ESPHOME_VERSION;
   data["idf_version"] = esp_get_idf_version();
 
@@ -399,6 +507,19 @@ void ShaverCoordinator::on_gattc_event(esp_gattc_cb_event_t event,
       break;
     }
 
+    case ESP_GATTC_CFG_MTU_EVT: {
+      if (param->cfg_mtu.status != ESP_GATT_OK) {
+        ESP_LOGW(this->log_tag_.c_str(),
+                 "MTU exchange failed, status=%d — staying at %u",
+                 param->cfg_mtu.status, (unsigned) this->mtu_);
+        break;
+      }
+      this->mtu_ = param->cfg_mtu.mtu;
+      ESP_LOGI(this->log_tag_.c_str(), "MTU negotiated: %u",
+               (unsigned) this->mtu_);
+      break;
+    }
+
     case ESP_GATTC_DISCONNECT_EVT: {
       // Detect stale bond: if we keep disconnecting quickly without auth,
       // the stored bond keys are likely invalid (e.g. after OTA or shaver BT
@@ -454,6 +575,7 @@ void ShaverCoordinator::on_gattc_event(esp_gattc_cb_event_t event,
       this->att_last_progress_ms_ = 0;
       this->last_boost_request_ms_ = 0;
       this->name_handle_ = 0;
+      this->mtu_ = ESP_GATT_DEF_BLE_MTU_SIZE;
       // Clear handle-based maps (handles are invalid after disconnect)
       // but keep desired_subscriptions_ for auto-resubscribe
       this->notify_map_.clear();
@@ -473,7 +595,14 @@ void ShaverCoordinator::on_gattc_event(esp_gattc_cb_event_t event,
     }
 
     case ESP_GATTC_SEARCH_CMPL_EVT: {
-      ESP_LOGI(this->log_tag_.c_str(), "Service discovery complete");
+      this->discovery_ms_ = millis() - this->connect_time_ms_;
+      this->services_from_cache_ =
+          param->search_cmpl.searched_service_source ==
+          ESP_GATT_SERVICE_FROM_NVS_FLASH;
+      ESP_LOGI(this->log_tag_.c_str(),
+               "Service discovery complete (%s, %u ms after open)",
+               this->services_from_cache_ ? "NVS cache" : "over the air",
+               (unsigned) this->discovery_ms_);
       this->services_discovered_ = true;
 
       // Read GAP Device Name (0x2A00) for display in HA config flow
@@ -667,6 +796,11 @@ void ShaverCoordinator::on_gattc_event(esp_gattc_cb_event_t event,
                  this->pending_char_uuid_.c_str(), hex_payload.c_str(),
                  param->read.value_len);
         this->log_conn_params_if_changed_();
+        this->cache_value_(this->pending_char_uuid_, param->read.value,
+                           param->read.value_len);
+        if (espbt::ESPBTUUID::from_raw(this->pending_char_uuid_) ==
+            espbt::ESPBTUUID::from_uint16(0x2A26))
+          this->check_gatt_cache_(param->read.value, param->read.value_len);
 
         this->emit_(EVENT_DATA,
                     {
@@ -764,6 +898,10 @@ void ShaverCoordinator::on_gattc_event(esp_gattc_cb_event_t event,
       auto it = this->notify_map_.find(param->notify.handle);
       if (it == this->notify_map_.end())
         break;
+      // Before the throttle: the cache keeps the newest value even when
+      // HA doesn't get an event for it.
+      this->cache_value_(it->second, param->notify.value,
+                         param->notify.value_len);
 
       // Throttle: max 1 event per NOTIFY_THROTTLE_MS per characteristic
       uint32_t now = millis();
@@ -1004,7 +1142,7 @@ void ShaverCoordinator::read_char(const std::string &service_uuid,
         [this, service_uuid, characteristic_uuid]() {
           this->read_char(service_uuid, characteristic_uuid);
         });
-    this->maybe_boost_conn_params_();
+    this->apply_conn_profile_();
     return;
   }
 
@@ -1081,7 +1219,7 @@ void ShaverCoordinator::subscribe(const std::string &service_uuid,
         [this, service_uuid, characteristic_uuid]() {
           this->subscribe(service_uuid, characteristic_uuid);
         });
-    this->maybe_boost_conn_params_();
+    this->apply_conn_profile_();
     return;
   }
 
@@ -1233,7 +1371,7 @@ void ShaverCoordinator::write_char(const std::string &service_uuid,
         [this, service_uuid, characteristic_uuid, hex_data]() {
           this->write_char(service_uuid, characteristic_uuid, hex_data);
         });
-    this->maybe_boost_conn_params_();
+    this->apply_conn_profile_();
     return;
   }
 
@@ -1281,6 +1419,48 @@ void ShaverCoordinator::set_throttle(uint32_t ms) {
   ESP_LOGI(this->log_tag_.c_str(), "Notification throttle set to %u ms", (unsigned) ms);
 }
 
+void ShaverCoordinator::cache_value_(const std::string &char_uuid,
+                                     const uint8_t *value, uint16_t len) {
+  if (char_uuid.empty() || len == 0 || len > MAX_CACHED_VALUE_LEN)
+    return;
+  auto it = this->value_cache_.find(char_uuid);
+  if (it == this->value_cache_.end()) {
+    if (this->value_cache_.size() >= MAX_CACHED_VALUES)
+      return;
+    it = this->value_cache_.emplace(char_uuid, CachedValue{}).first;
+  }
+  it->second.value.assign(value, value + len);
+  it->second.at_ms = millis();
+}
+
+void ShaverCoordinator::emit_snapshot() {
+  // One event for the whole cache: "v.<uuid>" → "<age_s>:<hex>". The age
+  // (not an absolute time — the ESP has no wall clock) lets HA place each
+  // value in time.
+  uint32_t now = millis();
+  char num[16];
+  std::map<std::string, std::string> data = {
+      {"status", "snapshot"},
+      {"mac", this->get_remote_mac()},
+      {"version", PHILIPS_SHAVER_VERSION},
+      {"ble_connected", this->connected_ ? "true" : "false"},
+  };
+  for (const auto &entry : this->value_cache_) {
+    snprintf(num, sizeof(num), "%u",
+             (unsigned) ((now - entry.second.at_ms) / 1000));
+    data["v." + entry.first] =
+        std::string(num) + ":" +
+        format_hex(entry.second.value.data(), entry.second.value.size());
+  }
+  snprintf(num, sizeof(num), "%u", (unsigned) this->value_cache_.size());
+  data["count"] = num;
+  snprintf(num, sizeof(num), "%u", (unsigned) (now / 1000));
+  data["uptime_s"] = num;
+  this->emit_(EVENT_STATUS, data);
+  ESP_LOGD(this->log_tag_.c_str(), "Snapshot: %u cached value(s)",
+           (unsigned) this->value_cache_.size());
+}
+
 uint16_t ShaverCoordinator::find_cccd_handle_(uint16_t char_handle) {
   // Query the ESP-IDF GATT table directly — synchronous RAM lookup,
   // bypasses ESPHome's potentially empty descriptor cache.
@@ -1374,14 +1554,51 @@ bool ShaverCoordinator::is_already_bonded_() {
 }
 
 void ShaverCoordinator::fire_ready_event_() {
+  char mtu_str[8];
+  snprintf(mtu_str, sizeof(mtu_str), "%u", (unsigned) this->mtu_);
+  char discovery_str[12];
+  snprintf(discovery_str, sizeof(discovery_str), "%u",
+           (unsigned) this->discovery_ms_);
   this->emit_(EVENT_STATUS,
               {
                   {"status", "ready"},
                   {"mac", this->get_remote_mac()},
                   {"version", PHILIPS_SHAVER_VERSION},
+                  {"mtu", std::string(mtu_str)},
+                  {"gatt_source", this->services_from_cache_ ? "cache" : "remote"},
+                  {"discovery_ms", std::string(discovery_str)},
               });
 }
 
+void ShaverCoordinator::check_gatt_cache_(const uint8_t *firmware,
+                                          uint16_t len) {
+  if (this->parent_ == nullptr || len == 0)
+    return;
+  // One NVS entry per shaver MAC (the attribute cache itself is per peer
+  // too), holding a hash of the firmware revision the table belongs to.
+  auto pref = global_preferences->make_preference<uint32_t>(
+      fnv1_hash("philips_shaver_gatt_fw_" + this->get_remote_mac()));
+  uint32_t fw_hash = fnv1_hash(
+      std::string(reinterpret_cast<const char *>(firmware), len));
+  uint32_t stored = 0;
+  if (pref.load(&stored) && stored == fw_hash)
+    return;
+  pref.save(&fw_hash);
+  if (stored == 0)
+    return;  // first firmware seen for this shaver — nothing to compare
+  ESP_LOGW(this->log_tag_.c_str(),
+           "Shaver firmware changed — dropping cached GATT table for %s",
+           this->get_remote_mac().c_str());
+  esp_ble_gattc_cache_clean(const_cast<uint8_t *>(this->parent_->get_remote_bda()));
+  if (this->services_from_cache_) {
+    // This link runs on the old table's handles. Drop it; the reconnect
+    // discovers over the air.
+    ESP_LOGW(this->log_tag_.c_str(),
+             "Link uses the stale table — reconnecting to rediscover");
+    this->parent_->disconnect();
+  }
+}
+
 void ShaverCoordinator::att_progress_() {
   this->att_last_progress_ms_ = millis();
 }
@@ -1410,6 +1627,7 @@ void ShaverCoordinator::start_post_auth_setup_() {
   }
   this->ready_fired_ = true;
   this->fire_ready_event_();
+  this->apply_conn_profile_();
   if (!this->desired_subscriptions_.empty()) {
     ESP_LOGI(this->log_tag_.c_str(),
              "Restoring %d notification subscription(s)...",
@@ -1508,6 +1726,10 @@ void ShaverCoordinator::remove_bond_by_mac(const std::string &mac) {
            mac.c_str());
 
   bool removed = false;
+  // The attribute cache is per peer as well; a re-bonded shaver may come
+  // back with different firmware.
+  esp_ble_gattc_cache_clean(bda);
+
   // Targeted removal.
   if (esp_ble_remove_bond_device(bda) == ESP_OK) {
     removed = true;
@@ -1569,6 +1791,7 @@ void ShaverCoordinator::unpair() {
     }
     if (any_set) {
       esp_ble_remove_bond_device(const_cast<uint8_t *>(bda));
+      esp_ble_gattc_cache_clean(const_cast<uint8_t *>(bda));
       ESP_LOGI(this->log_tag_.c_str(), "Bond removed");
     }
   }
@@ -1602,10 +1825,12 @@ void ShaverCoordinator::unpair() {
   this->att_last_progress_ms_ = 0;
   this->last_boost_request_ms_ = 0;
   this->name_handle_ = 0;
+  this->mtu_ = ESP_GATT_DEF_BLE_MTU_SIZE;
   this->notify_map_.clear();
   this->cccd_map_.clear();
   this->char_props_map_.clear();
   this->last_notify_ms_.clear();
+  this->value_cache_.clear();
   if (!this->pending_calls_.empty()) {
     ESP_LOGD(this->log_tag_.c_str(),
              "Discarding %u queued call(s) on unpair",
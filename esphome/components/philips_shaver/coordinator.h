@@ -2,6 +2,7 @@
 
 #include "esphome/components/esp32_ble_client/ble_client_base.h"
 #include "esphome/components/esp32_ble_tracker/esp32_ble_tracker.h"
+#include "esphome/core/preferences.h"
 
 #include <esp_gap_ble_api.h>
 #include <esp_gattc_api.h>
@@ -52,6 +53,7 @@ class ShaverCoordinator {
   // ── Setup wiring (called from to_code()) ──────────────────────────────────
   void set_parent(esp32_ble_client::BLEClientBase *parent) {
     this->parent_ = parent;
+    ShaverCoordinator::ensure_local_mtu_();
   }
   void set_bridge(ShaverBridge *bridge) { this->bridge_ = bridge; }
   // Worker registers a callback that toggles its own BLE-client enabled
@@ -148,6 +150,16 @@ class ShaverCoordinator {
                   const std::string &characteristic_uuid,
                   const std::string &hex_data);
   void set_throttle(uint32_t ms);
+  // Called by Bridge service `ble_set_conn_profile`: "realtime", "bulk",
+  // "idle" or "auto". Returns false (and changes nothing) for any other
+  // name. The profile outlives the link — it applies to reconnects too.
+  bool set_conn_profile(const std::string &name);
+  const char *get_conn_profile_name() const {
+    return conn_profile_name_(this->conn_profile_);
+  }
+  // Called by Bridge service `ble_get_snapshot`: fire one status event
+  // carrying every cached characteristic value (see value_cache_).
+  void emit_snapshot();
 
   // ── Bridge queries (heartbeat / on_get_info) ──────────────────────────────
   // Snapshot of state used to fill heartbeat + ble_get_info events. Bridge
@@ -193,6 +205,13 @@ class ShaverCoordinator {
   // queue. Re-entrant calls (a fired call completing synchronously and
   // invoking a drain) are no-ops via draining_.
   void drain_pending_calls_();
+  // Invalidate Bluedroid's NVS copy of the attribute table when the
+  // shaver's firmware revision (0x2A26) differs from the one it was
+  // discovered under. See services_from_cache_.
+  void check_gatt_cache_(const uint8_t *firmware, uint16_t len);
+  // Remember the latest value of a characteristic for ble_get_snapshot.
+  void cache_value_(const std::string &char_uuid, const uint8_t *value,
+                    uint16_t len);
   // Wrapper around bridge_->fire_event() — keeps emit-call-sites short.
   void emit_(const std::string &event_type,
              const std::map<std::string, std::string> &data);
@@ -241,6 +260,16 @@ class ShaverCoordinator {
   bool services_discovered_{false};
   bool auth_completed_{false};
   uint32_t connect_time_ms_{0};
+  // Where this link's attribute table came from, and how long after
+  // OPEN_EVT it was known. Full discovery over the air takes ~5.5 s on
+  // the XP9201 and gates "ready", so with CONFIG_BT_GATTC_CACHE_NVS_FLASH
+  // (set by the cache_services option) Bluedroid keeps the table per
+  // peer in NVS and serves the next search locally. Bluedroid drops that
+  // copy itself on a Service Changed indication; as a backstop against
+  // firmware that re-lays its table without one, the table is also tied
+  // to the firmware revision (check_gatt_cache_), and dropped on unpair.
+  bool services_from_cache_{false};
+  uint32_t discovery_ms_{0};
   uint8_t rapid_disconnect_count_{0};
   static const uint8_t MAX_RAPID_DISCONNECTS = 3;
   // Service discovery on XP9201 takes ~5.5s; 10s covers it with a small
@@ -276,25 +305,71 @@ class ShaverCoordinator {
   uint16_t last_conn_interval_units_{0};
   void log_conn_params_if_changed_();
 
-  // Connection-parameter boost: the shaver drops a ~1 min idle link to
-  // 245 ms interval + slave latency 1 (~490 ms per ATT round-trip), which
-  // stretches a 28-char poll batch to ~14 s. When enough calls pile up in
-  // pending_calls_, request a short interval for the duration of the
-  // burst. No restore needed — the shaver re-requests its power-save
-  // profile itself after going idle again, and the stack auto-accepts
-  // peripheral-initiated updates (observed live: 35→245 ms downshift
-  // without any action on our side). Success shows up in the
-  // log_conn_params_if_changed_() poll; the GAP UPDATE_CONN_PARAMS event
-  // never reaches us (dropped by esp32_ble).
-  void maybe_boost_conn_params_();
+  // ATT MTU negotiated for the current link (ESP_GATTC_CFG_MTU_EVT).
+  // BLEClientBase sends the exchange request on open; the size it offers
+  // is the controller-wide local MTU, which Bluedroid leaves at the 23-byte
+  // default unless raised. Bulk characteristics (session history, pressure
+  // history) are read with Read Blob continuations of MTU-1 bytes each, so
+  // a 300-byte blob costs ~14 round-trips at 23 but two at 247 — on a
+  // power-save link that is the difference between ~7 s and ~1 s.
+  uint16_t mtu_{ESP_GATT_DEF_BLE_MTU_SIZE};
+  // Local MTU offered in the exchange. The peer answers with its own
+  // maximum and the link settles on the smaller of the two.
+  static const uint16_t LOCAL_MTU = ESP_GATT_MAX_MTU_SIZE;
+  // The local MTU is controller-wide (shared by every slot and any
+  // bluetooth_proxy on the node), so it is applied once per boot.
+  static bool local_mtu_set_;
+  static void ensure_local_mtu_();
+
+  // Connection-parameter profiles. The shaver drops a ~1 min idle link
+  // to 245 ms interval + slave latency 1 (~490 ms per ATT round-trip),
+  // which stretches a 28-char poll batch to ~14 s, and the stack
+  // auto-accepts such peripheral-initiated updates (observed live:
+  // 35→245 ms downshift without any action on our side).
+  //
+  // HA picks the profile through ble_set_conn_profile, from what it is
+  // about to do:
+  //   BULK     — read batches, history sync: 30–45 ms, latency 0.
+  //   REALTIME — shaving (live pressure/motor notifications): 15–30 ms,
+  //              latency 0.
+  //   IDLE     — on the charger: 200–250 ms, latency 1 — what the shaver
+  //              would pick itself; requesting it early saves its battery
+  //              and our radio time.
+  //   AUTO     — no standing request. A burst of BOOST_QUEUE_DEPTH queued
+  //              calls gets BULK for its duration (the only behaviour of
+  //              bridges before 1.18.0, and what a fresh boot starts with).
+  // A link already at least as fast as a fast profile asks for (fresh
+  // 35 ms links, 15 ms motor-on links) or at least as slow as IDLE is
+  // left alone. When the shaver moves the link off a standing profile,
+  // the profile is requested again (at most every BOOST_COOLDOWN_MS so
+  // a shaver that keeps refusing is not spammed). Success shows up in
+  // the log_conn_params_if_changed_() poll; the GAP UPDATE_CONN_PARAMS
+  // event never reaches us (dropped by esp32_ble).
+  enum class ConnProfile : uint8_t { AUTO, REALTIME, BULK, IDLE };
+  struct ConnProfileParams {
+    uint16_t min_units;  // 1.25 ms units
+    uint16_t max_units;
+    uint16_t latency;
+  };
+  static const char *conn_profile_name_(ConnProfile profile);
+  static ConnProfileParams conn_profile_params_(ConnProfile profile);
+  void apply_conn_profile_();
+  ConnProfile conn_profile_{ConnProfile::AUTO};
   uint32_t last_boost_request_ms_{0};
   // Queue depth that identifies a batch (a lone deferred read isn't
   // worth a GAP round-trip).
   static const size_t BOOST_QUEUE_DEPTH = 3;
-  // Requested range in 1.25 ms units: 30–45 ms. Conservative on purpose —
-  // two coordinator slots plus bluetooth_proxy share one antenna.
-  static const uint16_t BOOST_INTERVAL_MIN_UNITS = 24;
-  static const uint16_t BOOST_INTERVAL_MAX_UNITS = 36;
+  // Fast profiles are conservative on purpose — two coordinator slots
+  // plus bluetooth_proxy share one antenna.
+  static const uint16_t BULK_INTERVAL_MIN_UNITS = 24;      // 30 ms
+  static const uint16_t BULK_INTERVAL_MAX_UNITS = 36;      // 45 ms
+  static const uint16_t REALTIME_INTERVAL_MIN_UNITS = 12;  // 15 ms
+  static const uint16_t REALTIME_INTERVAL_MAX_UNITS = 24;  // 30 ms
+  static const uint16_t IDLE_INTERVAL_MIN_UNITS = 160;     // 200 ms
+  static const uint16_t IDLE_INTERVAL_MAX_UNITS = 200;     // 250 ms
+  // Supervision timeout floor (10 ms units) for IDLE: must exceed
+  // (1 + latency) * interval * 2.
+  static const uint16_t IDLE_SUPERVISION_TIMEOUT = 400;
   // Re-request cooldown so a long burst doesn't spam GAP while the
   // peripheral is still negotiating (or refusing).
   static const uint32_t BOOST_COOLDOWN_MS = 10000;
@@ -344,6 +419,25 @@ class ShaverCoordinator {
   std::map<uint16_t, uint32_t> last_notify_ms_;           // throttle bookkeeping
   uint32_t notify_throttle_ms_{500};
 
+  // Last value per characteristic, with the millis() it arrived, from
+  // notifications (including the ones the throttle keeps from HA) and
+  // read replies. Keyed by UUID rather than handle: handles are only
+  // valid for one connection, and the point of the cache is to outlive
+  // links — after an HA restart or an API reconnect, HA repopulates from
+  // ble_get_snapshot while the shaver sleeps, without a single ATT
+  // operation. Kept across disconnects, dropped on unpair (a different
+  // shaver may bond next). Bounded so a misbehaving peer cannot grow it:
+  // entries beyond MAX_CACHED_VALUES and values longer than
+  // MAX_CACHED_VALUE_LEN (bulk blobs HA reads on demand anyway) are not
+  // cached.
+  struct CachedValue {
+    std::vector<uint8_t> value;
+    uint32_t at_ms;
+  };
+  std::map<std::string, CachedValue> value_cache_;
+  static const size_t MAX_CACHED_VALUES = 48;
+  static const uint16_t MAX_CACHED_VALUE_LEN = 64;
+
   // Pending HA service calls deferred until they can run. Two reasons a
   // call lands here: (a) service discovery hasn't completed yet — HA's
   // coordinator fires read/subscribe/write the moment the BLE link is up
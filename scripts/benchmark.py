@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the integration's decode and parse hot paths.
+
+Kept apart from the pytest suite on purpose: the tests pin *what* the
+decoders produce, this pins *how long* they take. Every case runs on the
+captured fixtures in tests/fixtures (or on synthetic blobs built from
+them), so the numbers are comparable across releases and machines only
+differ by a constant factor.
+
+Cases:
+  process_results.*        coordinator._process_results on a full snapshot
+                           (first-connect read batch) and on one UUID (the
+                           notification path)
+  parse_shaving_settings   utils.parse_shaving_settings_to_dict
+  parse_pressure_history.* utils.parse_pressure_history on large blobs
+  esp_event.*              the bridge's data-event handler: MAC filter,
+                           hex decode, waiter/callback dispatch
+  available_paths.*        transport.describe_available_paths with many
+                           connectable scanners seeing the shaver
+
+Startup cases (--startup), for slow HA restarts with several entries:
+  startup.import.*         what importing the integration adds on top of
+                           its HA dependencies, each in a fresh interpreter;
+                           the JSON lists the third-party modules it pulled
+  startup.setup_entry.*    async_setup_entry per ESP bridge entry in a test
+                           HA instance (no radio needed), as the integration
+                           logs it; "first" includes the platform imports
+
+Usage:
+    python3 scripts/benchmark.py                       # print a table
+    python3 scripts/benchmark.py -o bench_results.json # also write JSON
+    python3 scripts/benchmark.py --compare old.json    # ratio vs. a baseline
+    python3 scripts/benchmark.py -k pressure           # only matching cases
+    python3 scripts/benchmark.py --startup --entries 5 # startup cases
+
+Needs the test requirements (requirements_test.txt) — the coordinator and
+transport import Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+from unittest.mock import AsyncMock, patch
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from custom_components.philips_shaver import transport as tr  # noqa: E402
+from custom_components.philips_shaver.const import (  # noqa: E402
+    CHAR_HISTORY_PRESSURE_DATA,
+    CHAR_MOTOR_RPM,
+    CHAR_SHAVING_MODE_SETTINGS,
+)
+from custom_components.philips_shaver.coordinator import (  # noqa: E402
+    PhilipsShaverCoordinator,
+)
+from custom_components.philips_shaver.utils import (  # noqa: E402
+    PRESSURE_HISTORY_RECORD,
+    parse_pressure_history,
+    parse_shaving_settings_to_dict,
+)
+from tests.conftest import chars_as_bytes, load_json_fixture  # noqa: E402
+
+MANIFEST = REPO / "custom_components" / "philips_shaver" / "manifest.json"
+ADDRESS = "F4:B3:B1:AA:BB:CC"
+
+_PRESSURE_RECORD_SIZE = PRESSURE_HISTORY_RECORD.size
+
+
+def _measure(fn: Callable[[], Any], min_time: float, repeat: int) -> dict[str, Any]:
+    """Time ``fn`` like timeit: calibrate a loop count, then repeat.
+
+    Reports per-call figures in microseconds. ``min`` is the number to
+    compare across runs — the others only show how noisy the box was.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "loops": number,
+        "repeat": repeat,
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3),
+        "max_us": round(max(samples), 3),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Case builders — each returns {case_name: zero-arg callable}
+# ---------------------------------------------------------------------------
+
+
+def _process_results_cases() -> dict[str, Callable[[], Any]]:
+    cases: dict[str, Callable[[], Any]] = {}
+    for fixture in ("xp9201.json", "qp4530.json"):
+        results = chars_as_bytes(load_json_fixture(fixture))
+        stub = SimpleNamespace(data={})
+        # Warm once so the measured calls decode onto a populated dataset,
+        # as on every connect after the first.
+        stub.data = PhilipsShaverCoordinator._process_results(stub, results)
+        name = fixture.removesuffix(".json")
+        cases[f"process_results.full.{name}"] = (
+            lambda s=stub, r=results: PhilipsShaverCoordinator._process_results(s, r)
+        )
+
+    snapshot = chars_as_bytes(load_json_fixture("xp9201.json"))
+    stub = SimpleNamespace(data=PhilipsShaverCoordinator._process_results(
+        SimpleNamespace(data={}), snapshot
+    ))
+    single = {CHAR_MOTOR_RPM: snapshot[CHAR_MOTOR_RPM]}
+    cases["process_results.single_uuid"] = (
+        lambda: PhilipsShaverCoordinator._process_results(stub, single)
+    )
+    return cases
+
+
+def _shaving_settings_cases() -> dict[str, Callable[[], Any]]:
+    raw = chars_as_bytes(load_json_fixture("xp9201.json"))[CHAR_SHAVING_MODE_SETTINGS]
+    return {"parse_shaving_settings": lambda: parse_shaving_settings_to_dict(raw)}
+
+
+def _pressure_history_blob(records: int) -> bytes:
+    """Tile the XP9201's captured pressure records up to ``records``."""
+    snapshot = chars_as_bytes(load_json_fixture("xp9201.json"))
+    seed = snapshot.get(CHAR_HISTORY_PRESSURE_DATA, b"")
+    seed = seed[: len(seed) - len(seed) % _PRESSURE_RECORD_SIZE]
+    if not seed:
+        seed = bytes(_PRESSURE_RECORD_SIZE)
+    reps = -(-records * _PRESSURE_RECORD_SIZE // len(seed))
+    return (seed * reps)[: records * _PRESSURE_RECORD_SIZE]
+
+
+def _pressure_history_cases() -> dict[str, Callable[[], Any]]:
+    cases: dict[str, Callable[[], Any]] = {}
+    for records in (20, 1_000, 50_000):
+        blob = _pressure_history_blob(records)
+        cases[f"parse_pressure_history.{records}"] = (
+            lambda b=blob: parse_pressure_history(0, b)
+        )
+    return cases
+
+
+def _esp_event_cases() -> dict[str, Callable[[], Any]]:
+    """Capture the bridge's data-event handler from a real transport.
+
+    ``connect()`` registers the handler as a closure on the HA bus; a
+    recording bus hands it back so it can be driven directly, without
+    the event loop, exactly as HA's bus would call it.
+    """
+    listeners: dict[str, Callable] = {}
+    hass = SimpleNamespace(
+        data={},
+        services=SimpleNamespace(has_service=lambda domain, svc: True),
+        bus=SimpleNamespace(
+            async_listen=lambda name, cb: listeners.setdefault(name, cb)
+        ),
+    )
+    transport = tr.EspBridgeTransport(hass, ADDRESS, "atom_lite")
+    with patch.object(tr, "async_track_time_interval"), patch.object(
+        tr.EspBridgeTransport, "_wait_for_bridge", AsyncMock()
+    ):
+        asyncio.run(transport.connect())
+    handler = listeners[tr.ESP_EVENT_NAME]
+    transport._notify_callbacks[CHAR_MOTOR_RPM] = lambda uuid, data: None
+
+    snapshot = chars_as_bytes(load_json_fixture("xp9201.json"))
+    cases: dict[str, Callable[[], Any]] = {}
+    for label, payload in (
+        ("notify_2b", snapshot[CHAR_MOTOR_RPM]),
+        ("notify_300b", _pressure_history_blob(20)),
+    ):
+        event = SimpleNamespace(
+            data={"mac": ADDRESS, "uuid": CHAR_MOTOR_RPM, "payload": payload.hex()}
+        )
+        cases[f"esp_event.{label}"] = lambda e=event: handler(e)
+    foreign = SimpleNamespace(
+        data={"mac": "00:11:22:33:44:55", "uuid": CHAR_MOTOR_RPM, "payload": "0000"}
+    )
+    cases["esp_event.foreign_mac"] = lambda: handler(foreign)
+    return cases
+
+
+def _available_paths_cases() -> dict[str, Callable[[], Any]]:
+    # Patched once for the whole run rather than per call — the patch
+    # machinery would otherwise dominate the small cases.
+    seen: list[Any] = []
+    patch.object(
+        tr, "async_scanner_devices_by_address", lambda *a, **kw: seen
+    ).start()
+    cases: dict[str, Callable[[], Any]] = {}
+    for count in (4, 32, 256):
+        devices = [
+            SimpleNamespace(
+                scanner=SimpleNamespace(
+                    name=f"proxy-{i} ({i:012X})", source=f"{i:012X}"
+                ),
+                # Every eighth scanner holds a stale -127 entry.
+                advertisement=SimpleNamespace(
+                    rssi=-127 if i % 8 == 7 else -40 - (i * 7) % 55
+                ),
+            )
+            for i in range(count)
+        ]
+
+        def _run(d=devices):
+            seen[:] = d
+            return tr.describe_available_paths(None, ADDRESS)
+
+        cases[f"available_paths.{count}"] = _run
+    return cases
+
+
+CASE_BUILDERS = (
+    _process_results_cases,
+    _shaving_settings_cases,
+    _pressure_history_cases,
+    _esp_event_cases,
+    _available_paths_cases,
+)
+
+
+# ---------------------------------------------------------------------------
+# Startup cases
+# ---------------------------------------------------------------------------
+
+PACKAGE = "custom_components.philips_shaver"
+PLATFORM_MODULES = (
+    "sensor", "light", "select", "binary_sensor", "button", "switch", "update",
+)
+
+# Runs in a fresh interpreter per sample. HA sets up the manifest's
+# dependencies before the integration, so their imports are paid for
+# already and only what the integration adds on top is timed.
+_IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {repo!r})
+import homeassistant.components.bluetooth
+import homeassistant.components.frontend
+import homeassistant.components.http
+import homeassistant.components.lovelace
+before = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+new = sorted({{
+    m.split(".")[0] for m in set(sys.modules) - before
+    if not m.startswith(("custom_components", "homeassistant"))
+}})
+print(json.dumps({{"s": elapsed, "new_modules": new}}))
+"""
+
+
+def _import_sample(modules: list[str]) -> dict[str, Any]:
+    probe = _IMPORT_PROBE.format(repo=str(REPO), modules=modules)
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _summary(samples_us: list[float]) -> dict[str, Any]:
+    return {
+        "loops": 1,
+        "repeat": len(samples_us),
+        "min_us": round(min(samples_us), 3),
+        "median_us": round(statistics.median(samples_us), 3),
+        "max_us": round(max(samples_us), 3),
+    }
+
+
+def _import_cases(repeat: int) -> dict[str, Any]:
+    steps = {
+        "startup.import.package": [PACKAGE],
+        # HA preloads the config flow with the integration.
+        "startup.import.config_flow": [PACKAGE, f"{PACKAGE}.config_flow"],
+        "startup.import.platforms": [PACKAGE]
+        + [f"{PACKAGE}.{name}" for name in PLATFORM_MODULES],
+    }
+    results: dict[str, Any] = {}
+    for name, modules in steps.items():
+        samples = [_import_sample(modules) for _ in range(repeat)]
+        results[name] = {
+            **_summary([sample["s"] * 1e6 for sample in samples]),
+            "new_modules": samples[-1]["new_modules"],
+        }
+    return results
+
+
+class _SetupTimes(logging.Handler):
+    """Collects the setup duration the integration logs per entry."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.INFO)
+        self.ms: list[float] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg.startswith("Philips Shaver integration loaded"):
+            self.ms.append(float(record.args[1]))
+
+
+async def _setup_round(entries: int) -> list[float]:
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+    from homeassistant import loader
+
+    import custom_components.philips_shaver as integration
+    from custom_components.philips_shaver.const import (
+        CONF_ADDRESS,
+        CONF_ESP_DEVICE_NAME,
+        CONF_TRANSPORT_TYPE,
+        DOMAIN,
+        TRANSPORT_ESP_BRIDGE,
+    )
+
+    times = _SetupTimes()
+    log = logging.getLogger(PACKAGE)
+    log.addHandler(times)
+    log.setLevel(logging.INFO)
+    # The bridges never answer; their warnings are expected here, as is
+    # the loader's custom-integration notice.
+    log.propagate = False
+    logging.getLogger("homeassistant.loader").setLevel(logging.ERROR)
+    try:
+        async with async_test_home_assistant() as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            # The card is HA frontend work; the dependencies count as set
+            # up, as they are on a real install by the time entries load.
+            hass.config.components.update(
+                {"bluetooth", "esphome", "frontend", "http", "lovelace"}
+            )
+            for i in range(entries):
+                MockConfigEntry(
+                    domain=DOMAIN,
+                    unique_id=f"bench-{i}",
+                    data={
+                        CONF_ADDRESS: f"F4:B3:B1:AA:BB:{i:02X}",
+                        CONF_TRANSPORT_TYPE: TRANSPORT_ESP_BRIDGE,
+                        CONF_ESP_DEVICE_NAME: f"bench_bridge_{i}",
+                    },
+                ).add_to_hass(hass)
+            with patch.object(integration, "async_register_card", AsyncMock()), \
+                    patch.object(integration, "async_ensure_card_resource", AsyncMock()):
+                await hass.config_entries.async_setup(
+                    hass.config_entries.async_entries(DOMAIN)[0].entry_id
+                )
+                await hass.async_block_till_done()
+                for entry in hass.config_entries.async_entries(DOMAIN):
+                    await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_stop(force=True)
+    finally:
+        log.removeHandler(times)
+        log.propagate = True
+    return times.ms
+
+
+def _setup_cases(entries: int, repeat: int) -> dict[str, Any]:
+    rounds = [asyncio.run(_setup_round(entries)) for _ in range(max(repeat, 2))]
+    first, warm = rounds[0], [ms for r in rounds[1:] for ms in r]
+    return {
+        "startup.setup_entry.first": _summary([ms * 1e3 for ms in first[:1]]),
+        "startup.setup_entry.warm": _summary([ms * 1e3 for ms in warm]),
+        "startup.setup_entry.all_entries": _summary(
+            [sum(r) * 1e3 for r in rounds[1:]]
+        ),
+    }
+
+
+def run_startup(entries: int, repeat: int) -> dict[str, Any]:
+    results = {**_import_cases(repeat), **_setup_cases(entries, repeat)}
+    for name, entry in results.items():
+        print(f"  {name:<40} {entry['min_us'] / 1000:>12.2f} ms", flush=True)
+        if entry.get("new_modules"):
+            print(f"    pulls in: {', '.join(entry['new_modules'])}")
+    return {
+        "integration_version": _integration_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "entries": entries,
+        "results": results,
+    }
+
+
+def _integration_version() -> str:
+    try:
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))["version"]
+    except (OSError, ValueError, KeyError):
+        return "unknown"
+
+
+def run(selected: str | None, min_time: float, repeat: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for builder in CASE_BUILDERS:
+        for name, fn in builder().items():
+            if selected and selected not in name:
+                continue
+            results[name] = _measure(fn, min_time, repeat)
+            print(f"  {name:<40} {results[name]['min_us']:>12.2f} µs", flush=True)
+    return {
+        "integration_version": _integration_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline_path: Path) -> int:
+    """Print min-time ratios against a previous run; count regressions."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    base = baseline.get("results", {})
+    print(
+        f"\nvs. {baseline_path.name} "
+        f"({baseline.get('integration_version', '?')}, "
+        f"python {baseline.get('python', '?')}):"
+    )
+    regressions = 0
+    for name, entry in current["results"].items():
+        old = base.get(name)
+        if not old or not old.get("min_us"):
+            print(f"  {name:<40} {'new':>12}")
+            continue
+        ratio = entry["min_us"] / old["min_us"]
+        flag = ""
+        if ratio > 1.25:
+            flag = "  <-- slower"
+            regressions += 1
+        print(f"  {name:<40} {ratio:>11.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare with")
+    parser.add_argument("-k", dest="selected", help="only cases containing this")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2,
+        help="calibrate each sample to at least this many seconds (default 0.2)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="samples per case")
+    parser.add_argument(
+        "--fail-on-regression", action="store_true",
+        help="exit non-zero when --compare finds a case >25%% slower",
+    )
+    parser.add_argument(
+        "--startup", action="store_true",
+        help="run the startup cases (import time, setup per entry) instead",
+    )
+    parser.add_argument(
+        "--entries", type=int, default=3,
+        help="config entries to set up for --startup (default 3)",
+    )
+    args = parser.parse_args()
+
+    print(f"philips_shaver {_integration_version()} — python {platform.python_version()}")
+    if args.startup:
+        report = run_startup(args.entries, args.repeat)
+    else:
+        report = run(args.selected, args.min_time, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nwrote {args.output}")
+    if args.compare:
+        regressions = compare(report, args.compare)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
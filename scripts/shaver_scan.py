@@ -13,12 +13,21 @@ Usage:
   python3 shaver_scan.py AA:BB:CC:DD:EE:FF --fixture xp9201.json
                                       # Capture an anonymized test fixture
                                       # for tests/fixtures/
+  python3 shaver_scan.py --all > fleet.jsonl
+                                      # Enumerate every shaver in range at
+                                      # once, one JSON snapshot per line
+  python3 shaver_scan.py --replay tests/fixtures/xp9201.json \
+          --replay-script session --listen 40
+                                      # No radio: replay a capture as a
+                                      # virtual shaver and decode its
+                                      # scripted notifications
 
 Requirements:
   pip install bleak
 """
 
 import asyncio
+import contextlib
 import json
 import struct
 import argparse
@@ -54,6 +63,9 @@ try:
 except Exception as _imp_err:  # pragma: no cover
     HAS_DBUS_PAIRING = False
     _DBUS_IMPORT_ERR = _imp_err
+# Replay engine shared with the integration (custom_components/
+# philips_shaver/replay.py): a captured snapshot served as a virtual shaver.
+from replay import LatencyModel, ReplayDevice  # type: ignore[import-not-found]
 
 # --- Protocol detection ------------------------------------------------
 # Shaver-range Philips devices advertise one or more of the 8d56xxxx
@@ -940,25 +952,27 @@ async def find_shaver():
     return None, None
 
 
-async def _negotiate_mtu(client: BleakClient, requested: int | None) -> None:
+async def _negotiate_mtu(
+    client: BleakClient, requested: int | None, log=print
+) -> None:
     if requested is not None:
         try:
             client._mtu_size = requested
-            print(f"MTU forced to {requested} (no exchange)")
+            log(f"MTU forced to {requested} (no exchange)")
             return
         except Exception as e:
-            print(f"MTU force failed: {e} — falling back to auto-exchange")
+            log(f"MTU force failed: {e} — falling back to auto-exchange")
 
     acquire = getattr(client, "_acquire_mtu", None)
     if acquire is None:
-        print("MTU auto-exchange unavailable on this bleak version — "
-              "stuck at default 23 unless --mtu is used")
+        log("MTU auto-exchange unavailable on this bleak version — "
+            "stuck at default 23 unless --mtu is used")
         return
     try:
         await acquire()
-        print("MTU auto-exchange completed")
+        log("MTU auto-exchange completed")
     except Exception as e:
-        print(f"MTU auto-exchange failed: {e}")
+        log(f"MTU auto-exchange failed: {e}")
 
 
 def _remove_shaver_bonds() -> list[str]:
@@ -1014,32 +1028,34 @@ def _is_auth_error(msg: str) -> bool:
     return any(hint in low for hint in _AUTH_ERROR_HINTS)
 
 
-async def _do_dbus_pair(mac: str) -> bool:
+async def _do_dbus_pair(mac: str, log=print) -> bool:
     """Pair via the integration's D-Bus helper. Returns True on success."""
     if not HAS_DBUS_PAIRING:
-        print(f"--pair requested but dbus_pairing import failed: {_DBUS_IMPORT_ERR}")
+        log(f"--pair requested but dbus_pairing import failed: {_DBUS_IMPORT_ERR}")
         return False
     if not is_dbus_available():
-        print("--pair requested but D-Bus system bus is not available (non-Linux?)")
+        log("--pair requested but D-Bus system bus is not available (non-Linux?)")
         return False
     try:
-        print(f"Pairing {mac} via D-Bus (auto-confirm agent)...")
+        log(f"Pairing {mac} via D-Bus (auto-confirm agent)...")
         await async_pair_and_trust(mac)
-        print("Paired and trusted.")
+        log("Paired and trusted.")
         return True
     except PairingError as err:
-        print(f"D-Bus pairing failed: {err}")
+        log(f"D-Bus pairing failed: {err}")
         return False
 
 
-async def _read_char_into(client, char, char_info, char_entry, device_info) -> str:
+async def _read_char_into(
+    client, char, char_info, char_entry, device_info, log=print
+) -> str:
     """Read one characteristic into ``char_entry``. Returns a status string:
     "ok", "auth" (needs bonding), "link_lost", or "error"."""
     try:
         value = await client.read_gatt_char(char)
     except BleakError as e:
         msg = str(e)
-        print(f"    Read error: {e}")
+        log(f"    Read error: {e}")
         # These errors mean the link is dead; remaining reads will all
         # raise the same thing.
         if (
@@ -1050,7 +1066,7 @@ async def _read_char_into(client, char, char_info, char_entry, device_info) -> s
             return "link_lost"
         return "auth" if _is_auth_error(msg) else "error"
     except Exception as e:
-        print(f"    Read error: {e}")
+        log(f"    Read error: {e}")
         return "auth" if _is_auth_error(str(e)) else "error"
 
     hex_str = value.hex()
@@ -1079,9 +1095,9 @@ async def _read_char_into(client, char, char_info, char_entry, device_info) -> s
         )
 
     if decoded is not None:
-        print(f"    Value: {value_str}  →  {decoded}")
+        log(f"    Value: {value_str}  →  {decoded}")
     else:
-        print(f"    Value: {value_str}")
+        log(f"    Value: {value_str}")
     return "ok"
 
 
@@ -1096,8 +1112,15 @@ async def scan_device(
     json_path: str | None = None,
     fixture: bool = False,
     adv_name: str | None = None,
+    client=None,
 ):
-    """Connect to a shaver and dump all GATT services."""
+    """Connect to a shaver and dump all GATT services.
+
+    ``client`` replaces the BleakClient, e.g. with a replayed capture's;
+    it is connected by the ``async with`` like a BleakClient would be.
+    Listening then follows the legacy notifications, since a capture has
+    no newer-protocol session to probe.
+    """
     if remove_bonds:
         removed = _remove_shaver_bonds()
         if removed:
@@ -1116,7 +1139,8 @@ async def scan_device(
         paired = await _do_dbus_pair(address)
 
     print(f"Connecting to {address} ...")
-    async with BleakClient(address, timeout=30) as client:
+    replaying = client is not None
+    async with client or BleakClient(address, timeout=30) as client:
         print(f"Connected: {client.is_connected}")
 
         await _negotiate_mtu(client, mtu)
@@ -1188,14 +1212,7 @@ async def scan_device(
             print()
 
         print("=" * 60)
-        if has_legacy and has_newer:
-            protocol = "Both Shaver Legacy + Newer Condor (first-ever find on a shaver)"
-        elif has_legacy:
-            protocol = "Shaver Legacy (8d56…, supported by philips_shaver)"
-        elif has_newer:
-            protocol = "Newer / Condor (e50b…, not yet seen on shavers)"
-        else:
-            protocol = "Unknown"
+        protocol = _protocol_label(has_legacy, has_newer)
         print(f"Protocol: {protocol}")
         print(f"Total services: {service_count}")
         if lost_connection:
@@ -1203,7 +1220,9 @@ async def scan_device(
             print("      establish the bond first (shavers require auto-confirm).")
         print("=" * 60)
 
-        if has_newer and client.is_connected and not lost_connection:
+        if has_newer and replaying:
+            print("\nSkipping Condor probe: a capture holds no newer-protocol session.")
+        elif has_newer and client.is_connected and not lost_connection:
             probe = NewerProtocolProbe(
                 client,
                 listen_seconds=listen_seconds,
@@ -1213,6 +1232,8 @@ async def scan_device(
             await probe.run()
         elif has_newer:
             print("\nSkipping Condor probe because the link is no longer healthy.")
+        if replaying and listen_seconds:
+            await _listen_for_notifications(client, listen_seconds)
 
         if json_path:
             _write_capture(
@@ -1226,6 +1247,49 @@ async def scan_device(
             )
 
 
+async def _listen_for_notifications(client, seconds: int) -> None:
+    """Subscribe to every notifying characteristic and print what arrives."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    def _on_notify(char, data: bytearray) -> None:
+        char_info = KNOWN_CHARS.get(char.uuid.lower())
+        label = char_info[0] if char_info else char.uuid
+        decoded = ""
+        if char_info and char_info[2]:
+            try:
+                decoded = f"  →  {char_info[2](bytes(data))}"
+            except Exception as dec_err:
+                decoded = f"  (decode error: {dec_err})"
+        print(f"  [{loop.time() - start:7.2f}s] {label}: {data.hex()}{decoded}")
+
+    subscribed = 0
+    for service in client.services:
+        for char in service.characteristics:
+            if {"notify", "indicate"} & set(char.properties):
+                try:
+                    await client.start_notify(char, _on_notify)
+                    subscribed += 1
+                except Exception as e:
+                    print(f"  Subscribe failed for {char.uuid}: {e}")
+    print(f"\nListening to {subscribed} characteristics for {seconds}s ...")
+    for _ in range(seconds * 10):
+        if not client.is_connected:
+            print("  (link dropped)")
+            return
+        await asyncio.sleep(0.1)
+
+
+def _protocol_label(has_legacy: bool, has_newer: bool) -> str:
+    if has_legacy and has_newer:
+        return "Both Shaver Legacy + Newer Condor (first-ever find on a shaver)"
+    if has_legacy:
+        return "Shaver Legacy (8d56…, supported by philips_shaver)"
+    if has_newer:
+        return "Newer / Condor (e50b…, not yet seen on shavers)"
+    return "Unknown"
+
+
 # Placeholder identity used when writing anonymized fixtures. Same vendor
 # prefix as the Sonicare test fixtures so captures are recognizable as
 # sanitized at a glance.
@@ -1235,10 +1299,14 @@ _FIXTURE_MAC = "24:E5:AA:00:00:01"
 _PRIVATE_CHAR_NAMES = {"Serial Number", "System ID"}
 
 
-def _anonymize_snapshot(snapshot: dict) -> None:
-    """Strip unit-identifying data in place: MAC, serial number, system ID."""
-    snapshot["address"] = _FIXTURE_MAC
-    for service in snapshot["gatt_services"]:
+def _anonymize_snapshot(snapshot: dict, index: int = 1) -> None:
+    """Strip unit-identifying data in place: MAC, serial number, system ID.
+
+    ``index`` numbers the placeholder MAC, so the devices of one --all
+    survey stay apart after scrubbing.
+    """
+    snapshot["address"] = f"{_FIXTURE_MAC[:-2]}{index:02X}"
+    for service in snapshot.get("gatt_services", []):
         for char in service["characteristics"]:
             if char.get("name") in _PRIVATE_CHAR_NAMES:
                 if char.get("value_hex"):
@@ -1247,9 +1315,29 @@ def _anonymize_snapshot(snapshot: dict) -> None:
                         char["value_hex"] = char["value_text"].encode().hex()
                     else:
                         char["value_hex"] = "00" * (len(char["value_hex"]) // 2)
+    device_info = snapshot.get("device_info", {})
     for key in _PRIVATE_CHAR_NAMES:
-        if key in snapshot["device_info"]:
-            snapshot["device_info"][key] = "0" * len(snapshot["device_info"][key])
+        if key in device_info:
+            device_info[key] = "0" * len(device_info[key])
+
+
+def _build_snapshot(
+    *,
+    address: str,
+    adv_name: str | None,
+    protocol: str,
+    device_info: dict,
+    gatt_services: list,
+) -> dict:
+    """The capture format shared by --json/--fixture files and --all lines."""
+    return {
+        "captured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "address": address,
+        "adv_name": adv_name,
+        "protocol": protocol,
+        "device_info": device_info,
+        "gatt_services": gatt_services,
+    }
 
 
 def _write_capture(
@@ -1270,14 +1358,13 @@ def _write_capture(
     (the ``--fixture`` flag) the MAC and serial number are scrubbed so the
     file can go straight into ``tests/fixtures/``.
     """
-    snapshot = {
-        "captured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
-        "address": address,
-        "adv_name": adv_name,
-        "protocol": protocol,
-        "device_info": device_info,
-        "gatt_services": gatt_services,
-    }
+    snapshot = _build_snapshot(
+        address=address,
+        adv_name=adv_name,
+        protocol=protocol,
+        device_info=device_info,
+        gatt_services=gatt_services,
+    )
     if anonymize:
         _anonymize_snapshot(snapshot)
     try:
@@ -1290,6 +1377,193 @@ def _write_capture(
         print(f"\n!!! Could not write capture to {path}: {e}")
 
 
+# =====================================================================
+# Fleet survey (--all)
+# =====================================================================
+
+# Links open at once in --all mode. BlueZ adapters manage more, but many
+# controllers stall scanning and connecting while several connects are in
+# flight. 3 also matches the ESPHome bluetooth_proxy default.
+DEFAULT_MAX_CONNECTIONS = 3
+
+
+async def find_shavers(timeout: float = 20.0, log=print) -> list:
+    """Scan once and return every shaver-looking (device, adv), strongest first."""
+    log(f"Scanning for Philips shavers / OneBlades ({timeout:.0f}s)...")
+    devices = await BleakScanner.discover(timeout=timeout, return_adv=True)
+    found = [
+        (device, adv)
+        for device, adv in devices.values()
+        if _looks_like_shaver(device, adv)
+    ]
+    found.sort(key=lambda pair: pair[1].rssi if pair[1] else -127, reverse=True)
+    for device, adv in found:
+        log(f"  {device.name or '(unnamed)'} ({device.address}), "
+            f"RSSI={adv.rssi}{_adv_summary(adv)}")
+    return found
+
+
+async def snapshot_device(
+    address: str,
+    adv_name: str | None,
+    *,
+    mtu: int | None,
+    pair: bool,
+    pair_lock: asyncio.Lock,
+    log,
+) -> dict:
+    """Enumerate one shaver without the interactive output of scan_device.
+
+    All readable characteristics are requested at once. ATT still answers
+    one request at a time per link, but with the whole batch queued in
+    BlueZ each next request goes out as soon as the previous response
+    lands, without a round-trip through Python in between. Pairing is
+    serialised across devices because they share one BlueZ agent.
+    """
+    paired = False
+    if pair:
+        async with pair_lock:
+            paired = await _do_dbus_pair(address, log)
+
+    async with BleakClient(address, timeout=30) as client:
+        await _negotiate_mtu(client, mtu, log)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            mtu_actual = client.mtu_size
+
+        has_legacy = False
+        has_newer = False
+        gatt_services: list[dict] = []
+        device_info: dict[str, str] = {}
+        reads: list[tuple] = []
+        for service in list(client.services):
+            svc_low = service.uuid.lower()
+            has_legacy |= svc_low.startswith(SHAVER_LEGACY_PREFIX)
+            has_newer |= svc_low.startswith(NEWER_PREFIX)
+            svc_entry: dict = {"uuid": service.uuid, "characteristics": []}
+            gatt_services.append(svc_entry)
+            for char in service.characteristics:
+                char_info = KNOWN_CHARS.get(char.uuid.lower())
+                char_entry = {
+                    "uuid": char.uuid,
+                    "name": char_info[0] if char_info else None,
+                    "properties": list(char.properties),
+                    "handle": char.handle,
+                    "value_hex": None,
+                    "value_text": None,
+                }
+                svc_entry["characteristics"].append(char_entry)
+                if "read" in char.properties:
+                    reads.append((char, char_info, char_entry))
+
+        def _quiet(_msg):
+            pass
+
+        async def _read_batch(batch):
+            return await asyncio.gather(*(
+                _read_char_into(
+                    client, char, char_info, char_entry, device_info, _quiet
+                )
+                for char, char_info, char_entry in batch
+            ))
+
+        statuses = await _read_batch(reads)
+        # Lazy encryption: pair once, then retry what needed the bond.
+        needs_bond = [r for r, st in zip(reads, statuses) if st == "auth"]
+        if needs_bond and not paired:
+            log(f"{len(needs_bond)} read(s) need encryption, pairing ...")
+            async with pair_lock:
+                paired = await _do_dbus_pair(address, log)
+            if paired and client.is_connected:
+                retry = await _read_batch(needs_bond)
+                statuses = [
+                    st for st in statuses if st != "auth"
+                ] + list(retry)
+        ok = statuses.count("ok")
+        log(f"{ok}/{len(reads)} reads ok, MTU {mtu_actual}")
+
+    snapshot = _build_snapshot(
+        address=address,
+        adv_name=adv_name,
+        protocol=_protocol_label(has_legacy, has_newer),
+        device_info=device_info,
+        gatt_services=gatt_services,
+    )
+    snapshot["mtu"] = mtu_actual
+    snapshot["reads_ok"] = ok
+    snapshot["reads_total"] = len(reads)
+    if "link_lost" in statuses:
+        snapshot["link_lost"] = True
+    return snapshot
+
+
+async def scan_all(
+    *,
+    max_connections: int,
+    mtu: int | None,
+    pair: bool,
+    anonymize: bool,
+    out,
+    scan_timeout: float = 20.0,
+) -> int:
+    """Enumerate every shaver in range, streaming one JSON line per device.
+
+    Lines are written as devices finish, in completion order. A device
+    that fails still gets a line, with ``error`` set. Progress goes to
+    stderr so ``out`` stays clean JSON lines.
+    """
+    def _log(msg: str) -> None:
+        print(msg, file=sys.stderr)
+
+    found = await find_shavers(scan_timeout, _log)
+    if not found:
+        _log("No Philips shaver / OneBlade found.")
+        return 1
+
+    limit = asyncio.Semaphore(max(1, max_connections))
+    pair_lock = asyncio.Lock()
+    failures = 0
+    started = time.monotonic()
+
+    async def _one(index: int, device, adv) -> None:
+        nonlocal failures
+
+        def log(msg: str) -> None:
+            _log(f"[{device.address}] {msg}")
+
+        adv_name = (adv.local_name if adv else None) or device.name
+        async with limit:
+            t0 = time.monotonic()
+            try:
+                snapshot = await snapshot_device(
+                    device.address, adv_name,
+                    mtu=mtu, pair=pair, pair_lock=pair_lock, log=log,
+                )
+            except Exception as e:  # noqa: BLE001 — reported as a line
+                failures += 1
+                log(f"failed: {e}")
+                snapshot = {
+                    "address": device.address,
+                    "adv_name": adv_name,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            snapshot["rssi"] = adv.rssi if adv else None
+            snapshot["elapsed_s"] = round(time.monotonic() - t0, 2)
+        if anonymize:
+            _anonymize_snapshot(snapshot, index)
+        out.write(json.dumps(snapshot, ensure_ascii=False) + "\n")
+        out.flush()
+
+    await asyncio.gather(
+        *(_one(i, device, adv) for i, (device, adv) in enumerate(found, start=1))
+    )
+    _log(
+        f"{len(found) - failures}/{len(found)} device(s) enumerated "
+        f"in {time.monotonic() - started:.1f}s"
+    )
+    return 0 if failures < len(found) else 1
+
+
 async def main():
     parser = argparse.ArgumentParser(
         description="Philips shaver / OneBlade GATT scanner and newer-protocol probe",
@@ -1371,8 +1645,112 @@ async def main():
             "Suggested naming: <model>_<variant>.json (e.g. xp9201.json)."
         ),
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help=(
+            "Enumerate every shaver / OneBlade in range concurrently and "
+            "write one JSON snapshot per device and line (same shape as "
+            "--json) to stdout or --jsonl. Progress goes to stderr."
+        ),
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        metavar="N",
+        help=(
+            "With --all: devices connected at the same time. "
+            f"Default: {DEFAULT_MAX_CONNECTIONS}."
+        ),
+    )
+    parser.add_argument(
+        "--jsonl",
+        metavar="PATH",
+        default=None,
+        help="With --all: write the JSON lines to PATH instead of stdout.",
+    )
+    parser.add_argument(
+        "--anonymize",
+        action="store_true",
+        help=(
+            "With --all: scrub MAC and serial number like --fixture. "
+            "Placeholder MACs are numbered per device."
+        ),
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FIXTURE",
+        default=None,
+        help=(
+            "Do not touch the radio: serve a capture written by --json or "
+            "--fixture as a virtual shaver and scan that instead. Reads "
+            "answer from the capture, with realistic link timing."
+        ),
+    )
+    parser.add_argument(
+        "--replay-script",
+        metavar="SCRIPT",
+        default=None,
+        help=(
+            "With --replay: notification script to play once connected — "
+            "a JSON file (see replay.py) or 'session' for a built-in "
+            "shaving session. Combine with --listen to see it decoded."
+        ),
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        metavar="FACTOR",
+        help=(
+            "With --replay: stretch every simulated delay by FACTOR "
+            "(0 = no delays, 0.1 = ten times faster). Default: 1.0."
+        ),
+    )
     args = parser.parse_args()
 
+    if args.replay:
+        if args.mac or args.all or args.pair or args.remove_bonds:
+            parser.error("--replay takes no MAC and no --all/--pair/--remove-bonds")
+        device = ReplayDevice.from_file(
+            args.replay,
+            script=args.replay_script,
+            latency=LatencyModel.typical(),
+            time_scale=args.time_scale,
+            **({"mtu": args.mtu} if args.mtu else {}),
+        )
+        print(f"Replaying {args.replay} as {device.name or '?'} ({device.address})")
+        await scan_device(
+            device.address,
+            listen_seconds=args.listen,
+            json_path=args.fixture or args.json,
+            fixture=args.fixture is not None,
+            adv_name=device.name,
+            client=device.make_client(),
+        )
+        return
+
+    if args.all:
+        if args.mac or args.json or args.fixture or args.listen:
+            parser.error("--all takes no MAC and no --json/--fixture/--listen")
+        if args.remove_bonds:
+            removed = _remove_shaver_bonds()
+            for entry in removed:
+                print(f"Removed stale bond: {entry}", file=sys.stderr)
+        with contextlib.ExitStack() as stack:
+            out = (
+                stack.enter_context(open(args.jsonl, "w", encoding="utf-8"))
+                if args.jsonl else sys.stdout
+            )
+            sys.exit(await scan_all(
+                max_connections=args.max_connections,
+                mtu=args.mtu,
+                pair=args.pair,
+                anonymize=args.anonymize,
+                out=out,
+            ))
+
     adv_name = None
     if args.mac:
         print(f"Scanning for {args.mac} (10s)...")
@@ -44,5 +44,14 @@ EOF
 (cd "$CARD_DIR" && rm -rf dist .parcel-cache && npm run build)
 
 mkdir -p "$WWW_DIR"
-cp "$CARD_DIR/dist/philips_shaver_card.js" "$WWW_DIR/philips_shaver_card.js"
-echo "Bundled card v$VERSION -> $WWW_DIR/philips_shaver_card.js"
+CARD_JS="$WWW_DIR/philips_shaver_card.js"
+cp "$CARD_DIR/dist/philips_shaver_card.js" "$CARD_JS"
+
+# Precompressed variants, served by frontend.CardView. -n keeps the gzip
+# header free of name and mtime, so an unchanged card builds byte-identical.
+gzip -9 -n -k -f "$CARD_JS"
+rm -f "$CARD_JS.br"
+if command -v brotli >/dev/null; then
+    brotli -q 11 -k -f "$CARD_JS"
+fi
+echo "Bundled card v$VERSION -> $CARD_JS (+ precompressed variants)"
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -112,3 +115,60 @@ def unpatched_text_blocks():
     import custom_components.philips_shaver.config_flow as cf
 
     return cf._async_text_blocks.unpatched
+
+
+@pytest.fixture
+def esp_hass():
+    """Factory for a stub ``hass`` the ESP bridge transports run on.
+
+    Bus listeners are collected in ``hass.listeners`` (event name → callbacks)
+    for the tests to fire; service calls go to an ``AsyncMock``. ``missing``
+    names bridge services the firmware lacks, e.g. ``"ble_get_snapshot"``.
+    """
+
+    def _make(*, missing: tuple[str, ...] = ()) -> SimpleNamespace:
+        listeners: dict[str, list] = {}
+
+        def _listen(name, cb):
+            listeners.setdefault(name, []).append(cb)
+            return MagicMock()
+
+        return SimpleNamespace(
+            data={},
+            loop=asyncio.get_running_loop(),
+            listeners=listeners,
+            services=SimpleNamespace(
+                has_service=lambda domain, svc: not any(m in svc for m in missing),
+                async_call=AsyncMock(),
+            ),
+            bus=SimpleNamespace(async_listen=_listen),
+        )
+
+    return _make
+
+
+@pytest.fixture
+def connect_bridge():
+    """Connect one bridge slot transport per ``(mac, bridge_id)`` on a stub hass.
+
+    The bridge counts as up at once and the heartbeat timer is patched
+    (its mock is left as ``hass.heartbeat_timers``). Service calls made
+    while connecting are cleared, so the tests see only their own.
+    """
+    from custom_components.philips_shaver import transport as tr
+
+    async def _connect(hass, *slots: tuple[str, str]) -> list[tr.EspBridgeTransport]:
+        transports = [
+            tr.EspBridgeTransport(hass, mac, "atom_lite", bridge_id)
+            for mac, bridge_id in slots
+        ]
+        with patch.object(tr, "async_track_time_interval") as track, patch.object(
+            tr.EspBridgeTransport, "_wait_for_bridge", AsyncMock()
+        ):
+            for transport in transports:
+                await transport.connect()
+        hass.heartbeat_timers = track
+        hass.services.async_call.reset_mock()
+        return transports
+
+    return _connect
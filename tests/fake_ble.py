@@ -0,0 +1,391 @@
+"""Fixture-backed stand-in for a shaver behind BleakClient.
+
+``BleakTransport`` and the config-flow capabilities probe both reach the
+shaver through ``bleak_retry_connector.establish_connection`` and a
+``BleakClient``. This module replaces that pair with a fake whose GATT
+table and values come from a ``tests/fixtures`` capture, so the direct-BLE
+paths — live setup, ``read_chars``, the history download, the probe — run
+end to end without a radio.
+
+Three knobs make it useful beyond plain correctness tests:
+
+* a :class:`LatencyModel` that charges every ATT operation a configurable
+  cost (shared with the integration's replay mode in ``replay.py``). ATT is strictly request/response per connection, so operations on
+  one client are serialised the way a real link would serialise them — a
+  gathered batch of reads costs the sum of its reads, not the max.
+* disconnect injection: drop the link after *n* ATT operations, or on
+  demand, with the same ``disconnected_callback`` path BlueZ takes.
+* notification generators: feed a sequence of payloads to a subscriber at
+  a fixed interval once ``start_notify`` runs, e.g. a shaving session.
+
+Not a test module itself — pytest only collects ``test_*.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import time
+from types import SimpleNamespace
+from typing import Any
+import warnings
+
+from bleak.exc import BleakError
+
+from custom_components.philips_shaver.const import (
+    CHAR_HISTORY_AVG_CURRENT,
+    CHAR_HISTORY_DURATION,
+    CHAR_HISTORY_RPM,
+    CHAR_HISTORY_SYNC_STATUS,
+    CHAR_HISTORY_TIMESTAMP,
+)
+from custom_components.philips_shaver.replay import (
+    LatencyModel,
+    ReplayCharacteristic,
+    ReplayService,
+    ReplayServiceCollection,
+    services_from_snapshot,
+)
+
+from .conftest import chars_as_bytes
+
+DEFAULT_ADDRESS = "F4:B3:B1:AA:BB:CC"
+
+
+# The GATT table classes are shared with the integration's replay mode.
+FakeCharacteristic = ReplayCharacteristic
+FakeService = ReplayService
+FakeServiceCollection = ReplayServiceCollection
+
+
+class FakeBleakClient:
+    """A connected client handed out by :meth:`FakeBleBackend.establish_connection`."""
+
+    def __init__(
+        self,
+        backend: FakeBleBackend,
+        device: Any,
+        disconnected_callback: Callable[[Any], None] | None,
+    ) -> None:
+        self._backend = backend
+        self._device = device
+        self._disconnected_callback = disconnected_callback
+        self._connected = True
+        # What habluetooth's wrapper exposes after a connect; read by
+        # describe_connection_path and BleakTransport.connection_rssi.
+        self._connected_scanner = backend.scanner
+        # One ATT bearer per connection: a request waits for the previous
+        # response, so concurrent callers queue here like on a real link.
+        self._att_lock = asyncio.Lock()
+        self._notify_tasks: dict[str, asyncio.Task] = {}
+        # Like bleak's BlueZ backend: the link runs at the negotiated MTU
+        # from the start, but mtu_size reports the default (and warns)
+        # until _acquire_mtu has asked for it.
+        self._mtu_size: int | None = None
+
+    @property
+    def address(self) -> str:
+        return getattr(self._device, "address", DEFAULT_ADDRESS)
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def services(self) -> FakeServiceCollection:
+        return self._backend.services
+
+    @property
+    def mtu_size(self) -> int:
+        if self._mtu_size is None:
+            warnings.warn("Using default MTU value.", UserWarning, stacklevel=2)
+            return 23
+        return self._mtu_size
+
+    async def _acquire_mtu(self) -> None:
+        self._mtu_size = self._backend.mtu
+
+    async def _att(self, op: str, uuid: str, size: int = 0) -> None:
+        """Charge one ATT operation and apply any pending drop injection."""
+        if not self._connected:
+            raise BleakError("Not connected")
+        async with self._att_lock:
+            if (
+                self._backend.drop_after_ops is not None
+                and len(self._backend.ops) >= self._backend.drop_after_ops
+            ):
+                self._backend.drop_after_ops = None
+                self.drop_link()
+            if not self._connected:
+                raise BleakError("Disconnected")
+            pdus = 1
+            if op == "read":
+                pdus = max(1, -(-size // (self._backend.mtu - 1)))
+            cost = self._backend.latency.cost(op, size, pdus)
+            self._backend.busy_time += cost
+            if cost:
+                await asyncio.sleep(cost)
+            if not self._connected:
+                raise BleakError("Disconnected")
+            self._backend.ops.append((op, uuid))
+
+    def _characteristic(self, uuid: str) -> FakeCharacteristic:
+        char = self.services.get_characteristic(uuid)
+        if char is None:
+            raise BleakError(f"Characteristic {uuid} was not found!")
+        return char
+
+    async def read_gatt_char(self, char_specifier: Any, **kwargs: Any) -> bytearray:
+        uuid = str(getattr(char_specifier, "uuid", char_specifier)).lower()
+        self._characteristic(uuid)
+        value = self._backend.values.get(uuid, b"")
+        await self._att("read", uuid, len(value))
+        if uuid in self._backend.read_errors:
+            raise BleakError(self._backend.read_errors[uuid])
+        return bytearray(self._backend.values.get(uuid, b""))
+
+    async def write_gatt_char(
+        self, char_specifier: Any, data: bytes, response: bool | None = None
+    ) -> None:
+        uuid = str(getattr(char_specifier, "uuid", char_specifier)).lower()
+        self._characteristic(uuid)
+        await self._att("write", uuid, len(data))
+        self._backend.writes.append((uuid, bytes(data)))
+        handler = self._backend.write_handlers.get(uuid)
+        if handler is not None:
+            handler(bytes(data))
+        else:
+            self._backend.values[uuid] = bytes(data)
+
+    async def start_notify(
+        self, char_specifier: Any, callback: Callable[[Any, bytearray], None], **kwargs: Any
+    ) -> None:
+        uuid = str(getattr(char_specifier, "uuid", char_specifier)).lower()
+        char = self._characteristic(uuid)
+        await self._att("notify", uuid)
+        self._backend.subscribers[uuid] = (char, callback)
+        source = self._backend.notification_sources.get(uuid)
+        if source is not None:
+            values, interval = source
+            self._notify_tasks[uuid] = asyncio.get_running_loop().create_task(
+                self._run_source(uuid, values, interval)
+            )
+
+    async def stop_notify(self, char_specifier: Any) -> None:
+        uuid = str(getattr(char_specifier, "uuid", char_specifier)).lower()
+        await self._att("notify", uuid)
+        self._backend.subscribers.pop(uuid, None)
+        task = self._notify_tasks.pop(uuid, None)
+        if task is not None:
+            task.cancel()
+
+    async def _run_source(
+        self, uuid: str, values: Iterable[bytes], interval: float
+    ) -> None:
+        for value in values:
+            await asyncio.sleep(interval)
+            if not self._connected:
+                return
+            self._backend.notify(uuid, value)
+
+    async def disconnect(self) -> bool:
+        if not self._connected:
+            return True
+        cost = self._backend.latency.cost("disconnect")
+        self._backend.busy_time += cost
+        if cost:
+            await asyncio.sleep(cost)
+        self._teardown()
+        return True
+
+    def drop_link(self) -> None:
+        """Lose the link from the remote side (sleep, hourly drop, range).
+
+        Unlike :meth:`disconnect` this fires ``disconnected_callback``,
+        which is how BlueZ reports a link the host did not close.
+        """
+        if not self._connected:
+            return
+        self._teardown()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    def _teardown(self) -> None:
+        self._connected = False
+        for task in self._notify_tasks.values():
+            task.cancel()
+        self._notify_tasks.clear()
+        self._backend.subscribers.clear()
+        if self._backend.client is self:
+            self._backend.client = None
+
+
+class FakeBleBackend:
+    """One simulated shaver plus the ``establish_connection`` that reaches it.
+
+    Built from a fixture snapshot: the GATT table (services, handles,
+    properties) and every captured value. Install it with
+    :meth:`install`, which points the integration's connect paths and
+    advertisement lookups at this backend.
+    """
+
+    def __init__(
+        self,
+        snapshot: dict[str, Any],
+        latency: LatencyModel | None = None,
+        address: str = DEFAULT_ADDRESS,
+        scanner_name: str = "hci0 (00:11:22:33:44:55)",
+        rssi: int = -60,
+        mtu: int = 23,
+    ) -> None:
+        self.address = address
+        self.latency = latency or LatencyModel()
+        self.rssi = rssi
+        # ATT MTU the link settles on; long reads move MTU-1 bytes per PDU.
+        self.mtu = mtu
+        self.values: dict[str, bytes] = chars_as_bytes(snapshot)
+        self.services = services_from_snapshot(snapshot)
+        self.device = SimpleNamespace(
+            address=address, name=snapshot.get("adv_name"), details={}
+        )
+        self.scanner = SimpleNamespace(
+            name=scanner_name,
+            source=scanner_name,
+            get_discovered_device_advertisement_data=self._adv_data,
+        )
+
+        self.client: FakeBleakClient | None = None
+        self.connect_count = 0
+        # Every ATT operation in order, as (op, uuid) — for assertions on
+        # what a code path actually put on the air.
+        self.ops: list[tuple[str, str]] = []
+        self.writes: list[tuple[str, bytes]] = []
+        # Total simulated link time charged so far, independent of the
+        # event loop's clock.
+        self.busy_time = 0.0
+        self.subscribers: dict[str, tuple[FakeCharacteristic, Callable]] = {}
+        self.notification_sources: dict[str, tuple[Iterable[bytes], float]] = {}
+        self.write_handlers: dict[str, Callable[[bytes], None]] = {}
+        self.read_errors: dict[str, str] = {}
+        self.connect_errors: list[BaseException] = []
+        self.drop_after_ops: int | None = None
+        self.asleep = False
+
+    def _adv_data(self, address: str):
+        if address.upper() != self.address.upper() or self.asleep:
+            return None
+        return self.device, SimpleNamespace(rssi=self.rssi)
+
+    # ---- injection --------------------------------------------------
+
+    def fail_next_connect(self, err: BaseException | None = None) -> None:
+        """Make the next ``establish_connection`` raise ``err``."""
+        self.connect_errors.append(err or BleakError("Connection slot unavailable"))
+
+    def drop_after(self, ops: int) -> None:
+        """Let ``ops`` more ATT operations complete, then fail the next one
+        with a dropped link."""
+        self.drop_after_ops = len(self.ops) + ops
+
+    def drop_link(self) -> None:
+        """Drop the current link immediately, if there is one."""
+        if self.client is not None:
+            self.client.drop_link()
+
+    def add_notification_source(
+        self, uuid: str, values: Iterable[bytes], interval: float = 0.0
+    ) -> None:
+        """Emit ``values`` on ``uuid`` every ``interval`` s after subscribe."""
+        self.notification_sources[uuid.lower()] = (values, interval)
+
+    def notify(self, uuid: str, value: bytes) -> bool:
+        """Push one notification; False when nobody is subscribed."""
+        uuid = uuid.lower()
+        self.values[uuid] = bytes(value)
+        entry = self.subscribers.get(uuid)
+        if entry is None:
+            return False
+        char, callback = entry
+        callback(char, bytearray(value))
+        return True
+
+    def load_history(self, sessions: list[dict[str, int]]) -> None:
+        """Queue stored sessions behind the history sync characteristic.
+
+        Each session is ``{"timestamp", "duration", "avg_current", "rpm"}``
+        in raw device units. The sync status reads as the number of
+        sessions left, and writing 0 to it advances to the next record —
+        the cursor protocol ``async_fetch_history`` drives.
+        """
+        pending = list(sessions)
+
+        def _publish() -> None:
+            self.values[CHAR_HISTORY_SYNC_STATUS] = bytes([len(pending)])
+            if not pending:
+                return
+            current = pending[0]
+            self.values[CHAR_HISTORY_TIMESTAMP] = current["timestamp"].to_bytes(4, "little")
+            self.values[CHAR_HISTORY_DURATION] = current["duration"].to_bytes(2, "little")
+            self.values[CHAR_HISTORY_AVG_CURRENT] = current["avg_current"].to_bytes(2, "little")
+            self.values[CHAR_HISTORY_RPM] = current["rpm"].to_bytes(2, "little")
+
+        def _advance(data: bytes) -> None:
+            if data == b"\x00" and pending:
+                pending.pop(0)
+            _publish()
+
+        self.write_handlers[CHAR_HISTORY_SYNC_STATUS] = _advance
+        _publish()
+
+    # ---- the patched entry points -----------------------------------
+
+    async def establish_connection(
+        self,
+        client_class: Any,
+        device: Any,
+        name: str,
+        disconnected_callback: Callable[[Any], None] | None = None,
+        **kwargs: Any,
+    ) -> FakeBleakClient:
+        """Drop-in for ``bleak_retry_connector.establish_connection``."""
+        cost = self.latency.cost("connect")
+        self.busy_time += cost
+        if cost:
+            await asyncio.sleep(cost)
+        self.connect_count += 1
+        if self.connect_errors:
+            raise self.connect_errors.pop(0)
+        if self.asleep:
+            raise BleakError(f"{self.address}: device no longer reachable")
+        if self.client is not None:
+            self.client._teardown()
+        self.client = FakeBleakClient(self, device, disconnected_callback)
+        return self.client
+
+    def service_info(self, *_args: Any, **_kwargs: Any) -> SimpleNamespace | None:
+        """Drop-in for ``async_last_service_info``: a fresh advertisement."""
+        if self.asleep:
+            return None
+        return SimpleNamespace(
+            address=self.address,
+            device=self.device,
+            rssi=self.rssi,
+            time=time.monotonic(),
+            connectable=True,
+        )
+
+    def install(self, monkeypatch) -> FakeBleBackend:
+        """Route both direct-BLE connect paths to this backend."""
+        import custom_components.philips_shaver.config_flow as cf
+        import custom_components.philips_shaver.transport as tr
+
+        monkeypatch.setattr(tr, "bleak_establish", self.establish_connection)
+        monkeypatch.setattr(tr, "async_last_service_info", self.service_info)
+        monkeypatch.setattr(cf, "establish_connection", self.establish_connection)
+        monkeypatch.setattr(cf, "async_last_service_info", self.service_info)
+        monkeypatch.setattr(
+            cf,
+            "async_ble_device_from_address",
+            lambda hass, address, *a, **kw: None if self.asleep else self.device,
+        )
+        return self
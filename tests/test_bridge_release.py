@@ -0,0 +1,101 @@
+"""The shared bridge-release fetcher against a local HTTP stand-in.
+
+Concurrent checks share one request, unchanged files revalidate with a 304,
+a new version reaches every listener, and a failed request keeps the last
+copy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp import ClientSession, TCPConnector, ThreadedResolver, hdrs, web
+from aiohttp.test_utils import TestServer
+
+from custom_components.philips_shaver.bridge_release import BridgeReleaseFetcher
+
+
+class _Release:
+    """Serves VERSION with an ETag; counts requests and 304s."""
+
+    def __init__(self) -> None:
+        self.version = "1.4.0"
+        self.requests = 0
+        self.not_modified = 0
+        self.fail = False
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await self.gate.wait()
+        if self.fail:
+            return web.Response(status=503)
+        etag = f'"{self.version}"'
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+        return web.Response(text=f"{self.version}\n", headers={hdrs.ETAG: etag})
+
+
+@pytest.fixture
+async def release(socket_enabled):
+    stand_in = _Release()
+    app = web.Application()
+    app.router.add_get("/VERSION", stand_in.handle)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    # Threaded resolver: the server is an IP, and aiodns would leave a thread.
+    session = ClientSession(connector=TCPConnector(resolver=ThreadedResolver()))
+    stand_in.url = str(server.make_url("/VERSION"))
+    stand_in.session = session
+    yield stand_in
+    await session.close()
+    await server.close()
+
+
+def _fetcher(hass, release) -> BridgeReleaseFetcher:
+    return BridgeReleaseFetcher(
+        hass, release.session, version_url=release.url, changelog_url=release.url
+    )
+
+
+async def test_concurrent_checks_share_one_request(hass, release) -> None:
+    fetcher = _fetcher(hass, release)
+    release.gate.clear()
+
+    checks = [asyncio.ensure_future(fetcher.async_check_version()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    release.gate.set()
+
+    assert await asyncio.wait_for(asyncio.gather(*checks), 5) == ["1.4.0"] * 3
+    assert release.requests == 1
+    # Fresh enough: served from memory.
+    assert await fetcher.async_check_version() == "1.4.0"
+    assert release.requests == 1
+
+
+async def test_revalidates_and_fans_out_a_new_version(hass, release) -> None:
+    fetcher = _fetcher(hass, release)
+    seen: list[str | None] = []
+    remove = fetcher.async_add_listener(lambda: seen.append(fetcher.latest_version))
+
+    await fetcher.async_check_version(max_age=0)
+    await fetcher.async_check_version(max_age=0)
+    assert release.not_modified == 1
+    assert seen == ["1.4.0"]
+
+    release.version = "1.5.0"
+    assert await fetcher.async_check_version(max_age=0) == "1.5.0"
+    assert seen == ["1.4.0", "1.5.0"]
+    remove()
+
+
+async def test_failed_request_keeps_the_last_copy(hass, release) -> None:
+    fetcher = _fetcher(hass, release)
+    assert await fetcher.async_fetch_changelog() == "1.4.0\n"
+
+    release.fail = True
+    assert await fetcher.async_fetch(release.url, max_age=0) == "1.4.0\n"
+    assert await fetcher.async_check_version(max_age=0) == "1.4.0"
@@ -0,0 +1,85 @@
+"""Restoring coordinator data from the ESP bridge's last-value cache.
+
+The bridge (firmware >= 1.16.0) answers ``ble_get_snapshot`` with the
+newest value of every characteristic it saw, so HA can repopulate after a
+restart or an API reconnect without waking the shaver.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.philips_shaver import transport as tr
+from custom_components.philips_shaver.const import (
+    CHAR_BATTERY_LEVEL,
+    CHAR_DEVICE_STATE,
+)
+from custom_components.philips_shaver.coordinator import PhilipsShaverCoordinator
+
+MAC = "F4:B3:B1:00:00:0A"
+
+
+async def test_snapshot_event_is_parsed_per_uuid(esp_hass, connect_bridge) -> None:
+    hass = esp_hass()
+    (transport,) = await connect_bridge(hass, (MAC, "left"))
+
+    task = asyncio.create_task(transport.get_snapshot())
+    await asyncio.sleep(0)
+    for cb in hass.listeners[tr.ESP_STATUS_EVENT_NAME]:
+        cb(SimpleNamespace(data={
+            "status": "snapshot",
+            "bridge_id": "left",
+            "mac": MAC,
+            "count": "3",
+            f"v.{CHAR_BATTERY_LEVEL.upper()}": "12:5a",
+            f"v.{CHAR_DEVICE_STATE}": "300:01",
+            "v.broken": "x:zz",
+        }))
+
+    assert await asyncio.wait_for(task, 1) == {
+        CHAR_BATTERY_LEVEL: (b"\x5a", 12.0),
+        CHAR_DEVICE_STATE: (b"\x01", 300.0),
+    }
+    assert transport._pending_snapshot is None
+
+
+async def test_older_firmware_has_no_snapshot(esp_hass, connect_bridge) -> None:
+    hass = esp_hass(missing=("ble_get_snapshot",))
+    (transport,) = await connect_bridge(hass, (MAC, "left"))
+
+    assert await transport.get_snapshot() is None
+    hass.services.async_call.assert_not_called()
+
+
+async def test_restore_keeps_live_keys_while_the_shaver_sleeps() -> None:
+    old_seen = datetime.now(timezone.utc) - timedelta(hours=2)
+    stub = SimpleNamespace(
+        address=MAC,
+        data={"battery": 40, "device_state": "off", "last_seen": old_seen},
+        _snapshot_pending=True,
+        transport=SimpleNamespace(
+            is_connected=False,
+            get_snapshot=AsyncMock(return_value={
+                CHAR_BATTERY_LEVEL: (b"\x5a", 60.0),
+                CHAR_DEVICE_STATE: (b"\x02", 60.0),
+            }),
+        ),
+        async_set_updated_data=MagicMock(),
+    )
+    stub._process_results = lambda results: PhilipsShaverCoordinator._process_results(
+        stub, results
+    )
+
+    await PhilipsShaverCoordinator._async_restore_bridge_snapshot(stub)
+
+    (data,), _ = stub.async_set_updated_data.call_args
+    assert data["battery"] == 90
+    # Cached session state is not live — the shaver is asleep.
+    assert data["device_state"] == "off"
+    # Dated by the cache, not by the restore.
+    age = datetime.now(timezone.utc) - data["last_seen"]
+    assert timedelta(seconds=59) < age < timedelta(seconds=70)
+    assert stub._snapshot_pending is False
@@ -0,0 +1,85 @@
+"""Connection-parameter profiles requested from the ESP bridge.
+
+The coordinator asks for a fast link around bulk transfers and follows
+the shaver's state otherwise; the transport only spends a service call
+when the bridge's reported profile differs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call
+
+from custom_components.philips_shaver import transport as tr
+from custom_components.philips_shaver.const import (
+    CONN_PROFILE_AUTO,
+    CONN_PROFILE_BULK,
+    CONN_PROFILE_IDLE,
+    CONN_PROFILE_REALTIME,
+)
+from custom_components.philips_shaver.coordinator import (
+    PhilipsShaverCoordinator,
+    _conn_profile_for,
+)
+
+MAC = "F4:B3:B1:00:00:0A"
+
+
+def _heartbeat(hass, **data) -> None:
+    for cb in hass.listeners[tr.ESP_STATUS_EVENT_NAME]:
+        cb(SimpleNamespace(data={"status": "heartbeat", "mac": MAC, **data}))
+
+
+def test_profile_follows_device_state() -> None:
+    assert _conn_profile_for({"device_state": "shaving"}) == CONN_PROFILE_REALTIME
+    assert _conn_profile_for({"device_state": "charging"}) == CONN_PROFILE_IDLE
+    assert _conn_profile_for({"device_state": "off"}) == CONN_PROFILE_AUTO
+    assert _conn_profile_for(None) == CONN_PROFILE_AUTO
+
+
+async def test_only_changes_reach_the_bridge(esp_hass, connect_bridge) -> None:
+    hass = esp_hass()
+    (transport,) = await connect_bridge(hass, (MAC, ""))
+
+    await transport.set_conn_profile(CONN_PROFILE_BULK)
+    await transport.set_conn_profile(CONN_PROFILE_BULK)
+    assert hass.services.async_call.await_args_list == [
+        call("esphome", "atom_lite_ble_set_conn_profile", {"profile": "bulk"}, blocking=True)
+    ]
+
+    # A rebooted bridge reports its boot default — the next request is sent.
+    _heartbeat(hass, conn_profile="auto")
+    await transport.set_conn_profile(CONN_PROFILE_BULK)
+    assert hass.services.async_call.await_count == 2
+
+
+async def test_older_bridge_is_left_alone(esp_hass, connect_bridge) -> None:
+    hass = esp_hass(missing=("ble_set_conn_profile",))
+    (transport,) = await connect_bridge(hass, (MAC, ""))
+
+    await transport.set_conn_profile(CONN_PROFILE_REALTIME)
+
+    hass.services.async_call.assert_not_called()
+
+
+async def test_history_sync_runs_on_the_bulk_profile() -> None:
+    transport = SimpleNamespace(
+        is_connected=True,
+        read_char=AsyncMock(return_value=b"\x00"),
+        set_conn_profile=AsyncMock(),
+    )
+    stub = SimpleNamespace(
+        transport=transport,
+        _connection_lock=asyncio.Lock(),
+        data={"device_state": "charging"},
+        async_set_updated_data=MagicMock(),
+        _read_pressure_history=AsyncMock(return_value=None),
+    )
+
+    await PhilipsShaverCoordinator.async_fetch_history(stub)
+
+    assert transport.set_conn_profile.await_args_list == [
+        call(CONN_PROFILE_BULK),
+        call(CONN_PROFILE_IDLE),
+    ]
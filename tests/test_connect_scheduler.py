@@ -0,0 +1,129 @@
+"""Admission of direct-BLE connects to adapter connection slots.
+
+Shavers that wake together queue per adapter instead of racing for its
+slots: admitted while a slot is free, shaving before charging, and the
+slot is held until the link ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from bleak_retry_connector import Allocations
+import pytest
+
+from custom_components.philips_shaver import connect_scheduler as cs
+from custom_components.philips_shaver import transport as tr
+from custom_components.philips_shaver.coordinator import PhilipsShaverCoordinator
+from custom_components.philips_shaver.exceptions import ConnectSlotUnavailable
+
+from .fake_ble import FakeBleBackend
+
+ADAPTER = "hci0"
+
+
+def _mac(i: int) -> str:
+    return f"F4:B3:B1:00:00:{i:02X}"
+
+
+async def test_budget_queues_and_release_admits() -> None:
+    scheduler = cs.ConnectScheduler()
+    for i in range(cs.DEFAULT_SLOT_BUDGET):
+        await scheduler.async_acquire(_mac(i), ADAPTER, None, cs.PRIORITY_WAKE)
+
+    late = asyncio.create_task(
+        scheduler.async_acquire(_mac(9), ADAPTER, None, cs.PRIORITY_WAKE)
+    )
+    await asyncio.sleep(0)
+    assert not late.done()
+
+    scheduler.release(_mac(0))
+    await asyncio.wait_for(late, 1)
+    assert _mac(9) in scheduler.holders(ADAPTER)
+    assert _mac(0) not in scheduler.holders(ADAPTER)
+
+
+async def test_shaving_goes_before_charging() -> None:
+    scheduler = cs.ConnectScheduler()
+    for i in range(cs.DEFAULT_SLOT_BUDGET):
+        await scheduler.async_acquire(_mac(i), ADAPTER, None, cs.PRIORITY_WAKE)
+
+    admitted: list[str] = []
+
+    async def _wait(address: str, priority: int) -> None:
+        await scheduler.async_acquire(address, ADAPTER, None, priority)
+        admitted.append(address)
+
+    charging = asyncio.create_task(_wait(_mac(10), cs.PRIORITY_CHARGING))
+    await asyncio.sleep(0)
+    shaving = asyncio.create_task(_wait(_mac(11), cs.PRIORITY_SHAVING))
+    await asyncio.sleep(0)
+
+    scheduler.release(_mac(0))
+    await asyncio.wait_for(shaving, 1)
+    assert admitted == [_mac(11)]
+    assert not charging.done()
+
+    scheduler.release(_mac(1))
+    await asyncio.wait_for(charging, 1)
+    assert admitted == [_mac(11), _mac(10)]
+
+
+def test_reported_allocations_count_other_devices() -> None:
+    scheduler = cs.ConnectScheduler()
+    scanner = SimpleNamespace(
+        get_allocations=lambda: Allocations(
+            adapter=ADAPTER, slots=3, free=1, allocated=["AA:AA:AA:AA:AA:AA"] * 2
+        )
+    )
+    assert scheduler.free_slots(ADAPTER, scanner) == 1
+
+    # An admitted connect still being established counts against the
+    # reported free slot.
+    scheduler._holders[ADAPTER] = {_mac(1)}
+    assert scheduler.free_slots(ADAPTER, scanner) == 0
+
+
+async def test_wait_times_out_and_leaves_the_queue(monkeypatch) -> None:
+    monkeypatch.setattr(cs, "ADMIT_TIMEOUT", 0.05)
+    monkeypatch.setattr(cs, "ADMIT_RECHECK_INTERVAL", 0.01)
+    scheduler = cs.ConnectScheduler()
+    for i in range(cs.DEFAULT_SLOT_BUDGET):
+        await scheduler.async_acquire(_mac(i), ADAPTER, None, cs.PRIORITY_WAKE)
+
+    with pytest.raises(ConnectSlotUnavailable, match="connection slot"):
+        await scheduler.async_acquire(_mac(9), ADAPTER, None, cs.PRIORITY_WAKE)
+
+    assert scheduler._queues[ADAPTER] == []
+    scheduler.release(_mac(0))
+    assert _mac(9) not in scheduler.holders(ADAPTER)
+
+
+async def test_direct_link_holds_its_slot_until_it_ends(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    hass = SimpleNamespace(data={})
+    transport = tr.BleakTransport(hass, backend.address)
+    scheduler = cs.async_get_connect_scheduler(hass)
+
+    await transport.connect()
+    assert scheduler.holders("default") == {backend.address}
+
+    backend.drop_link()
+    assert scheduler.holders("default") == set()
+
+    backend.fail_next_connect()
+    with pytest.raises(Exception):
+        await transport.connect()
+    assert scheduler.holders("default") == set()
+
+
+def test_reconnect_priority_follows_state_before_the_drop() -> None:
+    stub = SimpleNamespace(_state_at_link_loss="shaving", data={"device_state": "off"})
+    assert PhilipsShaverCoordinator._connect_priority(stub) == cs.PRIORITY_SHAVING
+
+    stub._state_at_link_loss = "charging"
+    assert PhilipsShaverCoordinator._connect_priority(stub) == cs.PRIORITY_CHARGING
+
+    stub._state_at_link_loss = None
+    assert PhilipsShaverCoordinator._connect_priority(stub) == cs.PRIORITY_WAKE
@@ -0,0 +1,173 @@
+"""Shared per-ESP session behind the bridge slot transports.
+
+All slots of one ESP32 share its bus listeners, heartbeat check and
+outbound call queue; each slot only sees the events of its own shaver.
+The session also follows ESPHome's API connection, so a dropped link takes
+every slot offline without waiting for the heartbeat timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.philips_shaver import transport as tr
+from custom_components.philips_shaver.const import CHAR_BATTERY_LEVEL
+
+MAC_A = "F4:B3:B1:00:00:0A"
+MAC_B = "F4:B3:B1:00:00:0B"
+
+
+def _fire(hass, name: str, **data) -> None:
+    for cb in hass.listeners[name]:
+        cb(SimpleNamespace(data=data))
+
+
+async def test_slots_share_one_set_of_listeners(esp_hass, connect_bridge) -> None:
+    hass = esp_hass()
+    a, b = await connect_bridge(hass, (MAC_A, "left"), (MAC_B, "right"))
+
+    assert len(hass.listeners[tr.ESP_EVENT_NAME]) == 1
+    assert len(hass.listeners[tr.ESP_STATUS_EVENT_NAME]) == 1
+    assert hass.heartbeat_timers.call_count == 1
+    assert a._session is b._session
+
+    received: list[tuple[str, bytes]] = []
+    b._notify_callbacks[CHAR_BATTERY_LEVEL] = lambda u, d: received.append(("b", d))
+    a._notify_callbacks[CHAR_BATTERY_LEVEL] = lambda u, d: received.append(("a", d))
+    _fire(hass, tr.ESP_EVENT_NAME, mac=MAC_B, uuid=CHAR_BATTERY_LEVEL, payload="5a")
+
+    assert received == [("b", b"\x5a")]
+
+    _fire(hass, tr.ESP_STATUS_EVENT_NAME, mac=MAC_A, status="ready")
+    assert a.is_shaver_connected and not b.is_shaver_connected
+
+
+async def test_last_slot_leaving_tears_the_session_down(esp_hass, connect_bridge) -> None:
+    hass = esp_hass()
+    a, b = await connect_bridge(hass, (MAC_A, "left"), (MAC_B, "right"))
+    session = a._session
+    unsub = session._event_unsub
+
+    await a.disconnect()
+    unsub.assert_not_called()
+    assert session.views == [b]
+
+    await b.disconnect()
+    unsub.assert_called_once()
+    assert hass.data[tr.DATA_ESP_SESSIONS] == {}
+
+
+async def test_heartbeat_timeout_takes_every_slot_offline(esp_hass, connect_bridge) -> None:
+    hass = esp_hass()
+    a, b = await connect_bridge(hass, (MAC_A, "left"), (MAC_B, "right"))
+    dropped = MagicMock()
+    b.set_disconnect_callback(dropped)
+    _fire(hass, tr.ESP_STATUS_EVENT_NAME, mac=MAC_A, status="heartbeat", ble_connected="true")
+    _fire(hass, tr.ESP_STATUS_EVENT_NAME, mac=MAC_B, status="heartbeat", ble_connected="true")
+    dropped.reset_mock()
+
+    session = a._session
+    session.last_heartbeat -= tr.ESP_HEARTBEAT_TIMEOUT + 1
+    session._check_heartbeat()
+
+    assert not a._esp_alive and not b._esp_alive
+    dropped.assert_called_once()
+
+
+async def test_identical_reads_in_flight_are_shared_writes_are_not(esp_hass, connect_bridge) -> None:
+    hass = esp_hass()
+    (a,) = await connect_bridge(hass, (MAC_A, "left"))
+    gate = asyncio.Event()
+
+    async def _slow_call(*args, **kwargs):
+        await gate.wait()
+
+    hass.services.async_call.side_effect = _slow_call
+    reads = [
+        asyncio.create_task(a.read_char(CHAR_BATTERY_LEVEL, timeout=1))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.sleep(0)
+    _fire(hass, tr.ESP_EVENT_NAME, mac=MAC_A, uuid=CHAR_BATTERY_LEVEL, payload="5a")
+
+    assert await asyncio.gather(*reads) == [b"\x5a", b"\x5a"]
+    assert hass.services.async_call.await_count == 1
+
+    await a.write_char(CHAR_BATTERY_LEVEL, b"\x00")
+    await a.write_char(CHAR_BATTERY_LEVEL, b"\x00")
+    assert hass.services.async_call.await_count == 3
+
+
+class _EntryData:
+    """The slice of ESPHome's RuntimeEntryData the session follows."""
+
+    def __init__(self) -> None:
+        self.available = True
+        self.subscribers: list = []
+
+    def async_subscribe_device_updated(self, cb):
+        self.subscribers.append(cb)
+        return lambda: self.subscribers.remove(cb)
+
+    def set_available(self, available: bool) -> None:
+        self.available = available
+        for cb in list(self.subscribers):
+            cb()
+
+
+def _with_esphome_entry(hass) -> _EntryData:
+    entry_data = _EntryData()
+    entry = SimpleNamespace(data={"device_name": "atom-lite"}, runtime_data=entry_data)
+    hass.config_entries = SimpleNamespace(
+        async_entries=lambda domain: [entry] if domain == "esphome" else []
+    )
+    hass.async_create_task = asyncio.ensure_future
+    return entry_data
+
+
+async def test_api_disconnect_fails_reads_at_once(esp_hass, connect_bridge) -> None:
+    hass = esp_hass()
+    entry_data = _with_esphome_entry(hass)
+    (a,) = await connect_bridge(hass, (MAC_A, "left"))
+    _fire(hass, tr.ESP_STATUS_EVENT_NAME, mac=MAC_A, status="ready")
+    dropped = MagicMock()
+    a.set_disconnect_callback(dropped)
+    assert len(entry_data.subscribers) == 1
+
+    read = asyncio.create_task(a.read_char(CHAR_BATTERY_LEVEL, timeout=30))
+    await asyncio.sleep(0)
+    entry_data.set_available(False)
+
+    assert await asyncio.wait_for(read, 1) is None
+    assert not a.is_bridge_alive
+    dropped.assert_called_once()
+    assert a._session.api_available is False
+
+    # Back: the slot asks for its state right away.
+    hass.services.async_call.reset_mock()
+    entry_data.set_available(True)
+    for _ in range(3):
+        await asyncio.sleep(0)
+    service = hass.services.async_call.call_args.args[1]
+    assert service == "atom_lite_ble_get_info_left"
+
+    await a.disconnect()
+    assert entry_data.subscribers == []
+
+
+async def test_connect_fails_fast_while_the_api_is_down(esp_hass) -> None:
+    hass = esp_hass()
+    entry_data = _with_esphome_entry(hass)
+    entry_data.available = False
+    transport = tr.EspBridgeTransport(hass, MAC_A, "atom_lite", "left")
+
+    with patch.object(tr, "async_track_time_interval"), pytest.raises(
+        tr.TransportError, match="API connection"
+    ):
+        await transport.connect()
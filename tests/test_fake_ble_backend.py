@@ -0,0 +1,180 @@
+"""Direct-BLE paths end to end against the fixture-backed fake backend.
+
+``BleakTransport``, the coordinator's history download and the config-flow
+capabilities probe all run here against ``tests/fake_ble.py`` instead of a
+radio: the GATT table and values come from the XP9201 capture, and the
+latency model, drop injection and notification generators stand in for
+the behaviour of a real link.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.philips_shaver import probe_handoff
+from custom_components.philips_shaver.config_flow import PhilipsShaverConfigFlow
+from custom_components.philips_shaver.const import (
+    CHAR_BATTERY_LEVEL,
+    CHAR_HISTORY_SYNC_STATUS,
+    CHAR_MODEL_NUMBER,
+    CHAR_MOTOR_RPM,
+    CHAR_TOTAL_RUNNING_MOTOR,
+)
+from custom_components.philips_shaver.coordinator import PhilipsShaverCoordinator
+from custom_components.philips_shaver.transport import BleakTransport
+from custom_components.philips_shaver.utils import parse_capabilities
+
+from .fake_ble import DEFAULT_ADDRESS, FakeBleBackend, LatencyModel
+
+
+def _transport(backend: FakeBleBackend) -> BleakTransport:
+    return BleakTransport(SimpleNamespace(data={}), backend.address)
+
+
+async def test_connect_and_read_fixture_values(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    transport = _transport(backend)
+
+    await transport.connect()
+
+    assert transport.is_connected
+    assert transport.connection_path == "hci0 (00:11:22:33:44:55)"
+    assert transport.connection_rssi == -60
+    assert await transport.read_char(CHAR_BATTERY_LEVEL) == bytes([90])
+    assert (await transport.read_char(CHAR_MODEL_NUMBER)).startswith(b"XP9201")
+
+
+async def test_read_chars_is_connect_read_disconnect(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    transport = _transport(backend)
+
+    results = await transport.read_chars(
+        [CHAR_BATTERY_LEVEL, CHAR_TOTAL_RUNNING_MOTOR]
+    )
+
+    assert results[CHAR_BATTERY_LEVEL] == bytes([90])
+    assert int.from_bytes(results[CHAR_TOTAL_RUNNING_MOTOR], "little") == 239
+    assert backend.connect_count == 1
+    # The poll closes its own link again.
+    assert backend.client is None
+
+
+async def test_att_operations_are_serialised(monkeypatch, xp9201) -> None:
+    """Gathered reads on one link cost the sum of their reads, as on air."""
+    backend = FakeBleBackend(xp9201, LatencyModel(read=0.02)).install(monkeypatch)
+    transport = _transport(backend)
+    await transport.connect()
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(
+        *(transport.read_char(CHAR_BATTERY_LEVEL) for _ in range(4))
+    )
+
+    assert loop.time() - start >= 0.08
+    assert backend.busy_time >= 0.08
+
+
+async def test_injected_drop_fires_disconnect_callback(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    transport = _transport(backend)
+    dropped = MagicMock()
+    transport.set_disconnect_callback(dropped)
+    await transport.connect()
+
+    backend.drop_after(1)
+    assert await transport.read_char(CHAR_BATTERY_LEVEL) == bytes([90])
+    # The second operation hits the dropped link.
+    assert await transport.read_char(CHAR_BATTERY_LEVEL) is None
+
+    dropped.assert_called_once()
+    assert not transport.is_connected
+    assert transport.connection_path is None
+
+
+async def test_failed_connect_surfaces_the_error(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    backend.fail_next_connect()
+    transport = _transport(backend)
+
+    try:
+        await transport.connect()
+    except Exception as err:  # noqa: BLE001
+        assert "connection slot" in str(err).lower()
+    else:
+        raise AssertionError("connect should have failed")
+    assert not transport.is_connected
+
+
+async def test_notification_generator_reaches_subscriber(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    rpms = [(v).to_bytes(2, "little") for v in (18000, 18500, 19000)]
+    backend.add_notification_source(CHAR_MOTOR_RPM, rpms, interval=0.001)
+    transport = _transport(backend)
+    await transport.connect()
+
+    received: list[bytes] = []
+    await transport.subscribe(CHAR_MOTOR_RPM, lambda uuid, data: received.append(bytes(data)))
+    await asyncio.sleep(0.05)
+
+    assert received == rpms
+
+
+async def test_history_download_walks_the_cursor(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    backend.load_history(
+        [
+            {"timestamp": 1_700_000_000, "duration": 180, "avg_current": 420, "rpm": 3036},
+            {"timestamp": 1_700_086_400, "duration": 150, "avg_current": 400, "rpm": 6072},
+        ]
+    )
+    transport = _transport(backend)
+    stub = SimpleNamespace(
+        transport=transport,
+        _connection_lock=asyncio.Lock(),
+        data={},
+        async_set_updated_data=MagicMock(),
+        capabilities=parse_capabilities(0),
+        available_services=set(),
+    )
+    stub._read_pressure_history = (
+        lambda: PhilipsShaverCoordinator._read_pressure_history(stub)
+    )
+
+    sessions = await PhilipsShaverCoordinator.async_fetch_history(stub)
+
+    assert [s["duration_seconds"] for s in sessions] == [180, 150]
+    assert [s["avg_rpm"] for s in sessions] == [1000, 2000]
+    assert [s["timestamp"] for s in sessions] == [1_700_000_000, 1_700_086_400]
+    assert backend.writes == [(CHAR_HISTORY_SYNC_STATUS, b"\x00")] * 2
+    # Connected only for the download.
+    assert backend.client is None
+
+
+async def test_capabilities_probe_against_fake(monkeypatch, xp9201) -> None:
+    # Nothing adopts the probe's link here; let it close right away.
+    monkeypatch.setattr(probe_handoff, "PROBE_LINK_HOLD", 0)
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    flow = PhilipsShaverConfigFlow()
+    flow.flow_id = "test-flow"
+    flow.handler = "philips_shaver"
+
+    def _create_task(coro, *args, **kwargs):
+        return asyncio.get_running_loop().create_task(coro)
+
+    flow.hass = SimpleNamespace(
+        data={}, async_create_task=_create_task, loop=asyncio.get_running_loop()
+    )
+
+    caps = await flow._async_fetch_capabilities(DEFAULT_ADDRESS)
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert backend.client is None
+
+    assert caps["battery"] == 90
+    assert caps["model_number"] == "XP9201"
+    assert caps["connection_path"] == "hci0 (00:11:22:33:44:55)"
+    assert caps["capabilities"] > 0
+    assert len(caps["services"]) == len(xp9201["gatt_services"])
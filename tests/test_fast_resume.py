@@ -0,0 +1,79 @@
+"""Fast resume after the shaver's short (hourly) link drop.
+
+Live setup skips the ~35-read batch when the link was back within
+FAST_RESUME_MAX_GAP and the last read batch is still fresh; a bridge that
+lost its subscriptions always gets the full setup.
+"""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+from custom_components.philips_shaver.coordinator import (
+    FAST_RESUME_MAX_DATA_AGE,
+    FAST_RESUME_MAX_GAP,
+    PhilipsShaverCoordinator,
+)
+
+
+def _stub(
+    lost_ago: float | None = 0.5,
+    read_ago: float | None = 600,
+    full_read_done: bool = True,
+    esp: bool = False,
+    needs_resubscribe: bool = False,
+) -> SimpleNamespace:
+    now = time.monotonic()
+    stub = SimpleNamespace(
+        _full_read_done=full_read_done,
+        _link_lost_at=None if lost_ago is None else now - lost_ago,
+        _last_read_batch_at=None if read_ago is None else now - read_ago,
+        _is_esp_bridge=esp,
+        transport=SimpleNamespace(needs_resubscribe=needs_resubscribe),
+    )
+    stub._fast_resume_possible = (
+        lambda: PhilipsShaverCoordinator._fast_resume_possible(stub)
+    )
+    return stub
+
+
+def _can(stub) -> bool:
+    return PhilipsShaverCoordinator._can_fast_resume(stub)
+
+
+def test_short_drop_with_fresh_data_resumes() -> None:
+    stub = _stub()
+    assert _can(stub)
+    # Decided once per drop — the next setup runs in full unless the
+    # link drops again.
+    assert stub._link_lost_at is None
+    assert not _can(stub)
+
+
+def test_long_gap_runs_full_setup() -> None:
+    assert not _can(_stub(lost_ago=FAST_RESUME_MAX_GAP + 5))
+
+
+def test_stale_data_runs_full_setup() -> None:
+    assert not _can(_stub(read_ago=FAST_RESUME_MAX_DATA_AGE + 60))
+
+
+def test_first_connect_never_resumes() -> None:
+    assert not _can(_stub(full_read_done=False, read_ago=None))
+    assert not _can(_stub(lost_ago=None))
+
+
+def test_bridge_that_lost_subscriptions_runs_full_setup() -> None:
+    assert _can(_stub(esp=True))
+    assert not _can(_stub(esp=True, needs_resubscribe=True))
+
+
+def test_subscriptions_kept_only_while_resume_possible() -> None:
+    # Consulted when the live connection ends: keep the bridge's
+    # subscriptions only if the next setup may fast-resume.
+    assert PhilipsShaverCoordinator._fast_resume_possible(_stub())
+    assert not PhilipsShaverCoordinator._fast_resume_possible(_stub(lost_ago=None))
+    assert not PhilipsShaverCoordinator._fast_resume_possible(
+        _stub(read_ago=FAST_RESUME_MAX_DATA_AGE + 60)
+    )
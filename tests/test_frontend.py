@@ -3,13 +3,13 @@
 The card must end up in the Lovelace resource registry in storage mode
 (dynamic loading — survives the service worker's cached app shell, issue
 #14) and fall back to ``add_extra_js_url`` when the registry is read-only
-(YAML mode) or unavailable.
+(YAML mode) or unavailable. Either way it is loaded from its content-hashed
+URL, served precompressed and immutable.
 """
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import gzip
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,21 +18,19 @@ from homeassistant.helpers import issue_registry as ir
 
 from custom_components.philips_shaver.const import DOMAIN
 from custom_components.philips_shaver.frontend import (
+    CARD_FILENAME,
     CARD_URL,
+    DATA_CARD_ASSET,
+    IMMUTABLE_CACHE,
     ISSUE_STANDALONE_CARD,
+    CardView,
     async_register_card,
     async_remove_card_resource,
+    load_card_asset,
 )
 
-VERSION = json.loads(
-    (
-        Path(__file__).parents[1]
-        / "custom_components"
-        / "philips_shaver"
-        / "manifest.json"
-    ).read_text(encoding="utf-8")
-)["version"]
-VERSIONED_URL = f"{CARD_URL}?v={VERSION}"
+ASSET = load_card_asset()
+HASHED_URL = ASSET.url
 
 
 class FakeStorageResources:
@@ -85,16 +83,6 @@ def mock_static_paths(hass):
     hass.http.async_register_static_paths = AsyncMock()
 
 
-@pytest.fixture(autouse=True)
-def mock_integration_version():
-    """Resolve the integration version without the loader machinery."""
-    with patch(
-        "custom_components.philips_shaver.frontend.async_get_integration",
-        return_value=SimpleNamespace(version=VERSION),
-    ):
-        yield
-
-
 @pytest.fixture
 def mock_extra_js():
     with patch(
@@ -108,13 +96,13 @@ def _set_resources(hass, resources) -> None:
 
 
 async def test_resource_created(hass, mock_extra_js) -> None:
-    """Storage mode, fresh install: one versioned resource, no extra JS."""
+    """Storage mode, fresh install: one hashed resource, no extra JS."""
     resources = FakeStorageResources()
     _set_resources(hass, resources)
 
     await async_register_card(hass)
 
-    assert [item["url"] for item in resources.items] == [VERSIONED_URL]
+    assert [item["url"] for item in resources.items] == [HASHED_URL]
     mock_extra_js.assert_not_called()
     hass.http.async_register_static_paths.assert_awaited_once()
 
@@ -125,6 +113,11 @@ async def test_resource_updated_in_place_and_deduped(hass, mock_extra_js) -> Non
         [
             {"id": "1", "type": "module", "url": CARD_URL},
             {"id": "2", "type": "module", "url": f"{CARD_URL}?v=0.1.0"},
+            {
+                "id": "3",
+                "type": "module",
+                "url": f"/philips_shaver_card/0123456789abcdef/{CARD_FILENAME}",
+            },
         ]
     )
     _set_resources(hass, resources)
@@ -132,15 +125,15 @@ async def test_resource_updated_in_place_and_deduped(hass, mock_extra_js) -> Non
     await async_register_card(hass)
 
     assert [(item["id"], item["url"]) for item in resources.items] == [
-        ("1", VERSIONED_URL)
+        ("1", HASHED_URL)
     ]
     mock_extra_js.assert_not_called()
 
 
 async def test_resource_already_current(hass, mock_extra_js) -> None:
-    """Same version registered again: nothing changes, nothing is created."""
+    """Same card registered again: nothing changes, nothing is created."""
     resources = FakeStorageResources(
-        [{"id": "1", "type": "module", "url": VERSIONED_URL}]
+        [{"id": "1", "type": "module", "url": HASHED_URL}]
     )
     _set_resources(hass, resources)
     resources.async_create_item = AsyncMock()
@@ -159,14 +152,14 @@ async def test_yaml_mode_falls_back_to_extra_js(hass, mock_extra_js) -> None:
 
     await async_register_card(hass)
 
-    mock_extra_js.assert_called_once_with(hass, VERSIONED_URL)
+    mock_extra_js.assert_called_once_with(hass, HASHED_URL)
 
 
 async def test_no_lovelace_falls_back_to_extra_js(hass, mock_extra_js) -> None:
     """No Lovelace data at all: fall back rather than lose the card."""
     await async_register_card(hass)
 
-    mock_extra_js.assert_called_once_with(hass, VERSIONED_URL)
+    mock_extra_js.assert_called_once_with(hass, HASHED_URL)
 
 
 async def test_registry_error_falls_back_to_extra_js(hass, mock_extra_js) -> None:
@@ -177,7 +170,7 @@ async def test_registry_error_falls_back_to_extra_js(hass, mock_extra_js) -> Non
 
     await async_register_card(hass)
 
-    mock_extra_js.assert_called_once_with(hass, VERSIONED_URL)
+    mock_extra_js.assert_called_once_with(hass, HASHED_URL)
 
 
 async def test_standalone_leftover_creates_repair_issue(hass, mock_extra_js) -> None:
@@ -193,7 +186,7 @@ async def test_standalone_leftover_creates_repair_issue(hass, mock_extra_js) ->
     issue = ir.async_get(hass).async_get_issue(DOMAIN, ISSUE_STANDALONE_CARD)
     assert issue is not None
     # Our own resource was still registered alongside the repair issue.
-    assert VERSIONED_URL in [item["url"] for item in resources.items]
+    assert HASHED_URL in [item["url"] for item in resources.items]
 
 
 async def test_own_resource_does_not_trigger_repair_issue(hass, mock_extra_js) -> None:
@@ -213,7 +206,7 @@ async def test_remove_card_resource(hass) -> None:
     other = "/hacsfiles/some-other-card/card.js"
     resources = FakeStorageResources(
         [
-            {"id": "1", "type": "module", "url": VERSIONED_URL},
+            {"id": "1", "type": "module", "url": HASHED_URL},
             {"id": "2", "type": "module", "url": CARD_URL},
             {"id": "3", "type": "module", "url": other},
         ]
@@ -227,7 +220,7 @@ async def test_remove_card_resource(hass) -> None:
 
 async def test_remove_card_resource_yaml_mode_is_noop(hass) -> None:
     """Read-only YAML resources: removal must not blow up."""
-    _set_resources(hass, FakeYamlResources([{"id": "1", "url": VERSIONED_URL}]))
+    _set_resources(hass, FakeYamlResources([{"id": "1", "url": HASHED_URL}]))
 
     await async_remove_card_resource(hass)
 
@@ -247,20 +240,18 @@ async def test_real_lovelace_storage_roundtrip(hass, mock_extra_js) -> None:
     resources = (
         lovelace["resources"] if isinstance(lovelace, dict) else lovelace.resources
     )
-    assert [item["url"] for item in resources.async_items()] == [VERSIONED_URL]
+    assert [item["url"] for item in resources.async_items()] == [HASHED_URL]
 
-    # Second run (restart with same version): still exactly one entry.
+    # Second run (restart with the same card): still exactly one entry.
     await async_register_card(hass)
-    assert [item["url"] for item in resources.async_items()] == [VERSIONED_URL]
+    assert [item["url"] for item in resources.async_items()] == [HASHED_URL]
 
-    # Version bump: updated in place.
-    with patch(
-        "custom_components.philips_shaver.frontend.async_get_integration",
-        return_value=SimpleNamespace(version="99.0.0"),
-    ):
-        await async_register_card(hass)
+    # New card after an update (next HA run): updated in place.
+    newer = SimpleNamespace(url=f"/philips_shaver_card/{'f' * 16}/{CARD_FILENAME}")
+    hass.data[DATA_CARD_ASSET] = newer
+    await async_register_card(hass)
     items = resources.async_items()
-    assert [item["url"] for item in items] == [f"{CARD_URL}?v=99.0.0"]
+    assert [item["url"] for item in items] == [newer.url]
 
     await async_remove_card_resource(hass)
     assert resources.async_items() == []
@@ -284,7 +275,7 @@ async def test_resource_restored_after_remove_and_readd(hass, mock_extra_js) ->
 
     await async_ensure_card_resource(hass)
 
-    assert [item["url"] for item in resources.items] == [VERSIONED_URL]
+    assert [item["url"] for item in resources.items] == [HASHED_URL]
     mock_extra_js.assert_not_called()
 
 
@@ -298,4 +289,42 @@ async def test_yaml_fallback_registered_once_per_run(hass, mock_extra_js) -> Non
     await async_ensure_card_resource(hass)
     await async_ensure_card_resource(hass)
 
-    mock_extra_js.assert_called_once_with(hass, VERSIONED_URL)
+    mock_extra_js.assert_called_once_with(hass, HASHED_URL)
+
+
+def test_asset_hash_and_gzip_match_the_bundle() -> None:
+    raw = ASSET.bodies["identity"]
+    assert gzip.decompress(ASSET.bodies["gzip"]) == raw
+    assert HASHED_URL.split("/")[2] == ASSET.digest
+
+
+def test_stale_gzip_variant_is_ignored(tmp_path) -> None:
+    (tmp_path / CARD_FILENAME).write_bytes(b"new card")
+    (tmp_path / f"{CARD_FILENAME}.gz").write_bytes(gzip.compress(b"old card"))
+
+    asset = load_card_asset(tmp_path)
+
+    assert gzip.decompress(asset.bodies["gzip"]) == b"new card"
+
+
+async def test_card_view_negotiates_encoding_and_caches_forever() -> None:
+    view = CardView(ASSET)
+
+    def _request(accept: str):
+        return SimpleNamespace(headers={"Accept-Encoding": accept})
+
+    plain = await view.get(_request(""), ASSET.digest)
+    assert plain.body == ASSET.bodies["identity"]
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["Cache-Control"] == IMMUTABLE_CACHE
+    assert plain.content_type == "text/javascript"
+
+    zipped = await view.get(_request("gzip, deflate"), ASSET.digest)
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.body == ASSET.bodies["gzip"]
+    assert zipped.headers["Vary"] == "Accept-Encoding"
+
+    # A dashboard still holding the previous hash gets the current card,
+    # but not pinned under the old URL.
+    stale = await view.get(_request("gzip"), "0" * 16)
+    assert stale.headers["Cache-Control"] == "no-cache"
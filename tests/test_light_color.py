@@ -0,0 +1,67 @@
+"""The light-ring color entities show the coordinator's color.
+
+During a write that is the optimistic color; when the write fails the
+write queue restores the confirmed one, which may be no color at all yet.
+The entity is instantiated without its HA-bound ``__init__``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.philips_shaver.const import (
+    CHAR_LIGHTRING_COLOR_LOW,
+    LIGHTRING_DEFAULT_COLORS,
+)
+from custom_components.philips_shaver.exceptions import TransportError
+from custom_components.philips_shaver.light import PhilipsColorConfigLight
+from custom_components.philips_shaver.write_queue import CharWriteQueue
+
+
+class _Transport:
+    is_connected = True
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+
+    async def write_char(self, char_uuid: str, data: bytes) -> None:
+        await self.gate.wait()
+        raise TransportError("Not connected")
+
+
+def _light() -> PhilipsColorConfigLight:
+    coordinator = SimpleNamespace(
+        hass=None,
+        data={},
+        transport=_Transport(),
+        async_update_listeners=MagicMock(),
+        async_set_updated_data=MagicMock(),
+        entry=SimpleNamespace(
+            async_create_background_task=lambda hass, coro, name: asyncio.ensure_future(coro)
+        ),
+    )
+    coordinator.writer = CharWriteQueue(coordinator)
+    light = PhilipsColorConfigLight.__new__(PhilipsColorConfigLight)
+    light.coordinator = coordinator
+    light._uuid = CHAR_LIGHTRING_COLOR_LOW
+    light._key = "color_low"
+    light._attr_translation_key = "color_low"
+    return light
+
+
+async def test_failed_write_shows_the_confirmed_color_again() -> None:
+    light = _light()
+    assert light.rgb_color == LIGHTRING_DEFAULT_COLORS[CHAR_LIGHTRING_COLOR_LOW]
+
+    turn_on = asyncio.ensure_future(light.async_turn_on(rgb_color=(1, 2, 3)))
+    await asyncio.sleep(0)
+    assert light.rgb_color == (1, 2, 3)
+
+    light.coordinator.transport.gate.set()
+    await asyncio.wait_for(turn_on, 1)
+
+    # The color was never read: back to the default, not the failed color.
+    assert light.coordinator.data["color_low"] is None
+    assert light.rgb_color == LIGHTRING_DEFAULT_COLORS[CHAR_LIGHTRING_COLOR_LOW]
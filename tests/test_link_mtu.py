@@ -0,0 +1,133 @@
+"""ATT MTU negotiation and reporting on both transports.
+
+Bulk reads (session and pressure history) are chained Read Blob requests
+of MTU-1 bytes each, so the link MTU decides how many round-trips a
+download takes. Direct BLE asks bleak for the negotiated value on connect;
+the bridge reports it on ``info`` and ``ready`` events (firmware >= 1.15.0).
+Both surface as the ``mtu`` attribute of the Adapter sensor.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+import warnings
+
+from custom_components.philips_shaver import transport as tr
+from custom_components.philips_shaver.const import CHAR_BATTERY_LEVEL
+from custom_components.philips_shaver.sensor import PhilipsAdapterSensor
+
+from .fake_ble import FakeBleBackend, FakeBleakClient, LatencyModel
+
+ADDRESS = "F4:B3:B1:AA:BB:CC"
+
+
+async def test_direct_connect_reports_negotiated_mtu(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201, mtu=247).install(monkeypatch)
+    transport = tr.BleakTransport(SimpleNamespace(data={}), backend.address)
+
+    with warnings.catch_warnings():
+        # bleak warns when mtu_size is read before acquisition.
+        warnings.simplefilter("error")
+        await transport.connect()
+
+    assert transport.mtu == 247
+    backend.drop_link()
+    assert transport.mtu is None
+
+
+async def test_polls_negotiate_once(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201, mtu=247).install(monkeypatch)
+    transport = tr.BleakTransport(SimpleNamespace(data={}), backend.address)
+    asked: list[int] = []
+    acquire = FakeBleakClient._acquire_mtu
+
+    async def _counted(client) -> None:
+        asked.append(1)
+        await acquire(client)
+
+    monkeypatch.setattr(FakeBleakClient, "_acquire_mtu", _counted)
+
+    for _ in range(3):
+        await transport.read_chars([CHAR_BATTERY_LEVEL])
+
+    assert backend.connect_count == 3
+    assert len(asked) == 1
+    assert transport._link_mtu == 247
+
+
+async def test_larger_mtu_cuts_bulk_read_round_trips(monkeypatch, xp9201) -> None:
+    busy = {}
+    for mtu in (23, 247):
+        backend = FakeBleBackend(xp9201, LatencyModel(read=0.001), mtu=mtu)
+        backend.install(monkeypatch)
+        backend.values[CHAR_BATTERY_LEVEL] = bytes(300)
+        transport = tr.BleakTransport(SimpleNamespace(data={}), backend.address)
+        await transport.connect()
+        assert len(await transport.read_char(CHAR_BATTERY_LEVEL)) == 300
+        busy[mtu] = backend.busy_time
+
+    # 14 PDUs of 22 bytes against 2 of 246.
+    assert busy[247] * 5 < busy[23]
+
+
+async def test_negotiate_mtu_without_backend_support() -> None:
+    class _Client:
+        @property
+        def mtu_size(self) -> int:
+            raise NotImplementedError
+
+    assert await tr.async_negotiate_mtu(_Client()) is None
+
+
+async def _bridge_status_handler():
+    listeners = {}
+    hass = SimpleNamespace(
+        data={},
+        services=SimpleNamespace(has_service=lambda domain, svc: True),
+        bus=SimpleNamespace(
+            async_listen=lambda name, cb: listeners.setdefault(name, cb)
+        ),
+    )
+    transport = tr.EspBridgeTransport(hass, ADDRESS, "atom_lite")
+    with patch.object(tr, "async_track_time_interval"), patch.object(
+        tr.EspBridgeTransport, "_wait_for_bridge", AsyncMock()
+    ):
+        await transport.connect()
+    handler = listeners[tr.ESP_STATUS_EVENT_NAME]
+
+    def _fire(**data):
+        handler(SimpleNamespace(data={"mac": ADDRESS, **data}))
+
+    return transport, _fire
+
+
+async def test_bridge_mtu_from_info_and_ready() -> None:
+    transport, fire = await _bridge_status_handler()
+
+    fire(status="info", ble_connected="true", mtu="247")
+    assert transport.mtu == 247
+
+    fire(status="disconnected", reason="0x13")
+    assert transport.mtu is None
+
+    fire(status="ready", mtu="185")
+    assert transport.mtu == 185
+
+
+async def test_bridge_without_mtu_field_stays_unknown() -> None:
+    # Pre-1.15.0 bridges never send the field.
+    transport, fire = await _bridge_status_handler()
+    fire(status="info", ble_connected="true", version="1.14.0")
+    assert transport.mtu is None
+
+
+def test_adapter_sensor_mtu_attribute() -> None:
+    sensor = PhilipsAdapterSensor.__new__(PhilipsAdapterSensor)
+    sensor.coordinator = SimpleNamespace(
+        transport=SimpleNamespace(connection_path="hci0", mtu=247)
+    )
+    assert sensor.extra_state_attributes == {"mtu": 247}
+
+    sensor.coordinator.transport.mtu = None
+    assert sensor.extra_state_attributes is None
@@ -0,0 +1,218 @@
+"""Learned connect history per scanner and the path choice built on it.
+
+habluetooth picks the connect path by RSSI; path_stats records how each
+scanner actually performed for a shaver and pins the next connect to a
+clearly faster one. The preview lists that path first with its expected
+time to connect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.philips_shaver import path_stats as ps
+from custom_components.philips_shaver import transport as tr
+
+from .fake_ble import FakeBleBackend
+
+ADDRESS = "F4:B3:B1:AA:BB:CC"
+
+
+def _stats() -> ps.ConnectPathStats:
+    with patch.object(ps, "Store", MagicMock()):
+        return ps.ConnectPathStats(SimpleNamespace())
+
+
+def _train(stats, source: str, ok: int, failed: int, elapsed: float) -> None:
+    for _ in range(ok):
+        stats.record(ADDRESS, source, True, elapsed)
+    for _ in range(failed):
+        stats.record(ADDRESS, source, False, 15.0)
+
+
+def _hass(stats) -> SimpleNamespace:
+    return SimpleNamespace(data={ps.DATA_PATH_STATS: stats})
+
+
+def test_expected_time_prices_in_failures() -> None:
+    reliable = ps.PathRecord()
+    flaky = ps.PathRecord()
+    for _ in range(5):
+        reliable.record(True, 2.0)
+        flaky.record(True, 1.0)
+    for _ in range(5):
+        flaky.record(False, 15.0)
+
+    assert reliable.success_rate == 1.0
+    assert flaky.success_rate == 0.5
+    # Faster per success, but every second attempt burns a timeout.
+    assert reliable.expected_s < flaky.expected_s
+    assert ps.PathRecord().expected_s is None
+
+
+def test_old_behaviour_fades_out() -> None:
+    record = ps.PathRecord()
+    for _ in range(ps.MAX_ATTEMPTS_WINDOW):
+        record.record(False, 15.0)
+    record.record(True, 1.0)
+    assert record.attempts == ps.MAX_ATTEMPTS_WINDOW // 2 + 1
+    assert record.successes == 1
+
+
+def test_pin_needs_history_and_a_clear_margin() -> None:
+    stats = _stats()
+    candidates = ["proxy", "hci0"]
+
+    _train(stats, "hci0", ok=2, failed=0, elapsed=1.0)
+    # Too few attempts to override habluetooth's pick.
+    assert stats.preferred_source(ADDRESS, candidates, "proxy") is None
+
+    _train(stats, "hci0", ok=1, failed=0, elapsed=1.0)
+    # Default never tried: a good record wins.
+    assert stats.preferred_source(ADDRESS, candidates, "proxy") == "hci0"
+
+    _train(stats, "proxy", ok=3, failed=0, elapsed=1.2)
+    # About as fast — stay with the RSSI choice.
+    assert stats.preferred_source(ADDRESS, candidates, "proxy") is None
+
+    _train(stats, "proxy", ok=0, failed=3, elapsed=15.0)
+    assert stats.preferred_source(ADDRESS, candidates, "proxy") == "hci0"
+    # Already the default — nothing to pin.
+    assert stats.preferred_source(ADDRESS, candidates, "hci0") is None
+    # Not visible right now — cannot be pinned.
+    assert stats.preferred_source(ADDRESS, ["proxy"], "proxy") is None
+
+
+async def test_load_skips_aged_and_malformed_records() -> None:
+    stats = _stats()
+    fresh = ps.PathRecord(attempts=3, successes=3, connect_s=1.0, last_attempt=ps.time.time())
+    old = ps.PathRecord(attempts=3, successes=3, connect_s=1.0, last_attempt=1.0)
+    stats._store.async_load = AsyncMock(return_value={
+        "paths": {
+            ADDRESS: {
+                "hci0": ps.asdict(fresh),
+                "proxy": ps.asdict(old),
+                "bogus": {"unknown_field": 1},
+            }
+        }
+    })
+
+    await stats.async_load()
+
+    assert stats.get(ADDRESS.lower(), "hci0") == fresh
+    assert stats.get(ADDRESS, "proxy") is None
+    assert stats.get(ADDRESS, "bogus") is None
+
+
+async def test_side_by_side_setups_share_one_load(hass) -> None:
+    loads = 0
+
+    async def _load(self) -> None:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0)
+
+    with patch.object(ps, "Store", MagicMock()), patch.object(
+        ps.ConnectPathStats, "async_load", _load
+    ):
+        first, second = await asyncio.gather(
+            ps.async_setup_path_stats(hass), ps.async_setup_path_stats(hass)
+        )
+
+    assert first is second is ps.async_get_path_stats(hass)
+    assert loads == 1
+
+
+def test_forget_drops_the_address() -> None:
+    stats = _stats()
+    _train(stats, "hci0", ok=1, failed=0, elapsed=1.0)
+    stats.async_forget(ADDRESS)
+    assert stats.get(ADDRESS, "hci0") is None
+
+
+def _seen(monkeypatch, *entries: tuple[str, int]) -> None:
+    devices = [
+        SimpleNamespace(
+            scanner=SimpleNamespace(name=f"{source} (AA:BB)", source=source),
+            advertisement=SimpleNamespace(rssi=rssi),
+        )
+        for source, rssi in entries
+    ]
+    monkeypatch.setattr(
+        tr, "async_scanner_devices_by_address", lambda *a, **kw: devices
+    )
+
+
+def test_preview_leads_with_the_pinned_path(monkeypatch) -> None:
+    _seen(monkeypatch, ("proxy", -55), ("hci0", -75))
+    stats = _stats()
+    _train(stats, "proxy", ok=1, failed=3, elapsed=4.0)
+    _train(stats, "hci0", ok=4, failed=0, elapsed=1.0)
+
+    paths = tr.describe_available_paths(_hass(stats), ADDRESS)
+
+    assert [p["source"] for p in paths] == ["hci0", "proxy"]
+    assert paths[0]["pinned"] is True
+    assert paths[0]["connects"] == 4
+    assert paths[0]["success_rate"] == 1.0
+    assert paths[0]["expected_s"] < paths[1]["expected_s"]
+    assert tr.preferred_connection_source(_hass(stats), ADDRESS) == "hci0"
+
+
+def test_preview_without_history_is_rssi_order(monkeypatch) -> None:
+    _seen(monkeypatch, ("hci0", -75), ("proxy", -55))
+
+    paths = tr.describe_available_paths(_hass(_stats()), ADDRESS)
+
+    assert [p["source"] for p in paths] == ["proxy", "hci0"]
+    assert not any(p["pinned"] for p in paths)
+    assert "expected_s" not in paths[0]
+
+
+async def test_direct_connects_are_recorded(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201, scanner_name="hci0").install(monkeypatch)
+    _seen(monkeypatch, ("hci0", -60))
+    stats = _stats()
+    transport = tr.BleakTransport(_hass(stats), backend.address)
+
+    await transport.connect()
+    backend.fail_next_connect()
+    with pytest.raises(Exception):
+        await transport.connect()
+
+    record = stats.get(backend.address, "hci0")
+    assert (record.attempts, record.successes) == (2, 1)
+    assert record.connect_s is not None and record.failure_s is not None
+
+
+def test_pinned_client_tries_the_pinned_scanner_first(monkeypatch) -> None:
+    chosen = []
+
+    class _Wrapper:
+        def _async_get_backend_for_ble_device(self, manager, scanner, ble_device):
+            return None if scanner.source == "full" else f"backend:{scanner.source}"
+
+        def _async_get_best_available_backend_and_device(self, manager):
+            chosen.append("habluetooth")
+            return "backend:rssi"
+
+    monkeypatch.setattr(tr, "BleakClient", _Wrapper)
+    manager = SimpleNamespace(
+        async_scanner_devices_by_address=lambda address, connectable: [
+            SimpleNamespace(scanner=SimpleNamespace(source=s), ble_device=None)
+            for s in ("proxy", "hci0", "full")
+        ]
+    )
+
+    pinned = tr._client_class_pinned_to(ADDRESS, "hci0")()
+    assert pinned._async_get_best_available_backend_and_device(manager) == "backend:hci0"
+    assert chosen == []
+
+    # No free slot on the pinned scanner: habluetooth's own ranking.
+    full = tr._client_class_pinned_to(ADDRESS, "full")()
+    assert full._async_get_best_available_backend_and_device(manager) == "backend:rssi"
+    assert chosen == ["habluetooth"]
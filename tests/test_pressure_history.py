@@ -0,0 +1,124 @@
+"""Pressure history (0x0317): streaming decoder and its download.
+
+The XP9201 capture holds a full 20-slot ring buffer, so it pins both the
+record layout and the coordinator's ordering/filtering on real bytes. The
+download runs against the fixture-backed fake backend on the same
+connection as the session-history cursor walk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.philips_shaver.const import (
+    CHAR_HISTORY_PRESSURE_DATA,
+    SVC_CONTROL,
+    SVC_HISTORY,
+)
+from custom_components.philips_shaver.coordinator import PhilipsShaverCoordinator
+from custom_components.philips_shaver.transport import BleakTransport
+from custom_components.philips_shaver.utils import (
+    iter_pressure_history,
+    parse_capabilities,
+    parse_pressure_history,
+)
+
+from .conftest import chars_as_bytes
+from .fake_ble import FakeBleBackend
+
+# Capabilities of the XP9201 (0x69): motion, pressure, unit cleaning, light ring.
+XP9201_CAPS = 0x69
+
+
+def test_decodes_captured_ring_buffer(xp9201) -> None:
+    raw = chars_as_bytes(xp9201)[CHAR_HISTORY_PRESSURE_DATA]
+    records = list(iter_pressure_history(raw))
+
+    assert len(records) == 20
+    assert records[0] == {
+        "verdict": 5,
+        "duration_none": 94,
+        "duration_low": 111,
+        "duration_ok": 410,
+        "duration_high": 248,
+        "pressure_average": 4865,
+        "timestamp": 7032662,
+    }
+
+
+def test_decoder_is_lazy_and_ignores_partial_block(xp9201) -> None:
+    raw = chars_as_bytes(xp9201)[CHAR_HISTORY_PRESSURE_DATA]
+    records = iter_pressure_history(bytearray(raw[:37]))
+
+    assert not isinstance(records, list)
+    assert [r["timestamp"] for r in records] == [7032662, 4873202]
+
+
+def test_list_wrapper_matches_stream(xp9201) -> None:
+    raw = chars_as_bytes(xp9201)[CHAR_HISTORY_PRESSURE_DATA]
+    assert parse_pressure_history(0, raw) == list(iter_pressure_history(raw))
+    assert parse_pressure_history(0, b"") == []
+
+
+def _coordinator(transport, caps: int, services: set[str]) -> SimpleNamespace:
+    stub = SimpleNamespace(
+        transport=transport,
+        _connection_lock=asyncio.Lock(),
+        data={},
+        async_set_updated_data=MagicMock(),
+        capabilities=parse_capabilities(caps),
+        available_services=services,
+    )
+    stub._read_pressure_history = (
+        lambda: PhilipsShaverCoordinator._read_pressure_history(stub)
+    )
+    return stub
+
+
+async def test_fetch_history_downloads_pressure_records(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    backend.load_history([])
+    stub = _coordinator(
+        BleakTransport(SimpleNamespace(data={}), backend.address),
+        XP9201_CAPS,
+        {SVC_CONTROL, SVC_HISTORY},
+    )
+
+    await PhilipsShaverCoordinator.async_fetch_history(stub)
+
+    records = stub.data["pressure_history"]
+    assert len(records) == 20
+    # Oldest first — the ring's write position is not the age order.
+    timestamps = [r["timestamp"] for r in records]
+    assert timestamps == sorted(timestamps)
+    assert timestamps[-1] == 7032662
+    # One long read, no per-block round-trips.
+    assert backend.ops.count(("read", CHAR_HISTORY_PRESSURE_DATA)) == 1
+
+
+async def test_fetch_history_skips_pressure_without_sensor(monkeypatch, qp4530) -> None:
+    backend = FakeBleBackend(qp4530).install(monkeypatch)
+    backend.load_history([])
+    stub = _coordinator(
+        BleakTransport(SimpleNamespace(data={}), backend.address), 0, {SVC_HISTORY}
+    )
+
+    await PhilipsShaverCoordinator.async_fetch_history(stub)
+
+    assert "pressure_history" not in stub.data
+    assert ("read", CHAR_HISTORY_PRESSURE_DATA) not in backend.ops
+
+
+async def test_unwritten_slots_are_dropped(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    raw = chars_as_bytes(xp9201)[CHAR_HISTORY_PRESSURE_DATA]
+    backend.values[CHAR_HISTORY_PRESSURE_DATA] = raw[:30] + bytes(270)
+    transport = BleakTransport(SimpleNamespace(data={}), backend.address)
+    await transport.connect()
+    stub = _coordinator(transport, XP9201_CAPS, set())
+
+    records = await PhilipsShaverCoordinator._read_pressure_history(stub)
+
+    assert [r["timestamp"] for r in records] == [4873202, 7032662]
@@ -6,14 +6,20 @@ zeroconf discovery builds the picker in the background, and the banner it
 produces can sit unopened for hours. Home Assistant re-runs the step when
 that banner is clicked, so the dialog would be current — except the cache
 answers first and shows the bridge state from when the flow was created.
+
+Slot probes are also shared between flows for the same short window, and
+all candidate ESPs are probed at once, so the picker costs one probe
+timeout rather than one per ESPHome node.
 """
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import custom_components.philips_shaver.config_flow as cf
+from custom_components.philips_shaver.transport import note_slot_changed
 from custom_components.philips_shaver.config_flow import PhilipsShaverConfigFlow
 
 BONDED = {
@@ -168,3 +174,86 @@ async def test_reachable_esp_that_answers_no_probe_is_not_listed() -> None:
     values = [o["value"] for o in options]
     assert values == ["atom-s3r"], values
     assert options[0]["label"].startswith("⚪"), options
+
+
+# --- shared probes and concurrency ---------------------------------------
+
+def _answering_hass() -> SimpleNamespace:
+    """hass whose bridges answer every ble_get_info with BONDED."""
+    listeners: list = []
+
+    def _listen(name, cb):
+        listeners.append(cb)
+        return lambda: listeners.remove(cb)
+
+    async def _call(domain, service, data, blocking=False):
+        bridge_id = service.rsplit("_ble_get_info_", 1)[-1]
+        for cb in list(listeners):
+            cb(SimpleNamespace(data={**BONDED, "status": "info", "bridge_id": bridge_id}))
+
+    loop = asyncio.get_running_loop()
+    return SimpleNamespace(
+        data={},
+        loop=loop,
+        services=SimpleNamespace(
+            has_service=lambda *_: True, async_call=AsyncMock(side_effect=_call)
+        ),
+        bus=SimpleNamespace(async_listen=_listen),
+    )
+
+
+def _probing_flow(hass) -> PhilipsShaverConfigFlow:
+    flow = PhilipsShaverConfigFlow()
+    flow.hass = hass
+    return flow
+
+
+async def test_slot_probe_is_shared_until_the_slot_changes() -> None:
+    hass = _answering_hass()
+
+    first = await _probing_flow(hass)._probe_bridge_info("atom_s3r", "shaver_1")
+    second = await _probing_flow(hass)._probe_bridge_info("atom_s3r", "shaver_1")
+
+    assert first == second and first["identity_address"]
+    assert hass.services.async_call.await_count == 1
+
+    note_slot_changed(hass, "atom_s3r", "shaver_1")
+    await _probing_flow(hass)._probe_bridge_info("atom_s3r", "shaver_1")
+    assert hass.services.async_call.await_count == 2
+
+
+async def test_dropdown_probes_all_esps_at_once() -> None:
+    flow = PhilipsShaverConfigFlow()
+    flow.hass = SimpleNamespace(
+        config=SimpleNamespace(components=set()), data={},
+        config_entries=SimpleNamespace(
+            async_entries=lambda domain: [
+                _esp_entry("Atom S3R BLE Bridge", "atom-s3r", available=True),
+                _esp_entry("Atom Lite BLE Bridge", "atom-lite", available=True),
+            ]
+        ),
+        services=SimpleNamespace(
+            has_service=lambda *_: False,
+            async_services=lambda: {"esphome": {
+                "atom_s3r_ble_get_info_shaver_1": None,
+                "atom_lite_ble_get_info_shaver_1": None,
+            }},
+        ),
+    )
+    flow._async_current_entries = lambda: []
+    started: list[str] = []
+    both = asyncio.Event()
+
+    async def _probe(dev, dids):
+        # Sequential probing never gets the second ESP going.
+        started.append(dev)
+        if len(started) == 2:
+            both.set()
+        await both.wait()
+        return [(did, BONDED) for did in dids]
+
+    flow._probe_shaver_bridges = AsyncMock(side_effect=_probe)
+
+    options = await asyncio.wait_for(flow._get_esphome_device_options(), 1)
+
+    assert [o["value"] for o in options] == ["atom-s3r", "atom-lite"]
@@ -0,0 +1,126 @@
+"""Hand-over of the config-flow probe to the entry's first connect.
+
+The probe leaves its static reads (and, for direct BLE, its open link)
+behind. The coordinator's first connect reuses both instead of connecting
+and reading the same values again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.philips_shaver import connect_scheduler as cs
+from custom_components.philips_shaver import probe_handoff as ph
+from custom_components.philips_shaver import transport as tr
+from custom_components.philips_shaver.config_flow import PhilipsShaverConfigFlow
+from custom_components.philips_shaver.const import (
+    CHAR_BATTERY_LEVEL,
+    CHAR_FIRMWARE_REVISION,
+    CHAR_MODEL_NUMBER,
+)
+from custom_components.philips_shaver.coordinator import PhilipsShaverCoordinator
+
+from .fake_ble import FakeBleBackend
+
+
+def _hass() -> SimpleNamespace:
+    loop = asyncio.get_running_loop()
+    return SimpleNamespace(
+        data={}, loop=loop, async_create_task=loop.create_task
+    )
+
+
+async def _probe(hass, backend) -> dict:
+    flow = PhilipsShaverConfigFlow()
+    flow.flow_id = "test-flow"
+    flow.handler = "philips_shaver"
+    flow.hass = hass
+    return await flow._async_fetch_capabilities(backend.address)
+
+
+async def test_probe_link_is_adopted_by_the_first_connect(monkeypatch, xp9201) -> None:
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    hass = _hass()
+
+    await _probe(hass, backend)
+    assert backend.connect_count == 1
+    assert backend.client.is_connected
+
+    handoff = ph.async_pop_probe(hass, backend.address.lower())
+    assert set(handoff.values) <= ph.PROBE_REUSABLE_CHARS
+    assert handoff.values[CHAR_MODEL_NUMBER] == b"XP9201"
+
+    transport = tr.BleakTransport(hass, backend.address)
+    scheduler = cs.async_get_connect_scheduler(hass)
+    assert transport.adopt_probe_link(handoff)
+    assert scheduler.holders(backend.scanner.source) == {backend.address}
+    await transport.connect()
+
+    assert backend.connect_count == 1
+    assert transport.connection_path == "hci0 (00:11:22:33:44:55)"
+    assert await transport.read_char(CHAR_BATTERY_LEVEL) == b"\x5a"
+
+    # Drops of the adopted link reach the transport's callback.
+    dropped = MagicMock()
+    transport.set_disconnect_callback(dropped)
+    backend.drop_link()
+    dropped.assert_called_once()
+    assert not transport.is_connected
+    assert scheduler.holders(backend.scanner.source) == set()
+
+
+async def test_unclaimed_probe_link_is_closed(monkeypatch, xp9201) -> None:
+    monkeypatch.setattr(ph, "PROBE_LINK_HOLD", 0)
+    backend = FakeBleBackend(xp9201).install(monkeypatch)
+    hass = _hass()
+
+    await _probe(hass, backend)
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert backend.client is None
+    # The values outlive the link.
+    handoff = ph.async_pop_probe(hass, backend.address)
+    assert handoff.values and handoff.client is None
+
+
+def test_handoff_seeds_data_and_expires(monkeypatch) -> None:
+    hass = SimpleNamespace(data={})
+    transport = SimpleNamespace(adopt_probe_link=lambda handoff: False)
+    stub = SimpleNamespace(
+        hass=hass,
+        address="F4:B3:B1:AA:BB:CC",
+        data={"battery": 50},
+        transport=transport,
+        _probed_chars=set(),
+    )
+    stub._process_results = lambda results: PhilipsShaverCoordinator._process_results(
+        stub, results
+    )
+    ph.async_stash_probe(
+        hass,
+        ph.ProbeHandoff(
+            stub.address.lower(),
+            {
+                CHAR_MODEL_NUMBER: b"XP9201",
+                CHAR_FIRMWARE_REVISION: b"1.2.3",
+                CHAR_BATTERY_LEVEL: b"\x10",
+            },
+        ),
+    )
+
+    PhilipsShaverCoordinator.async_apply_probe_handoff(stub)
+
+    assert stub.data["model_number"] == "XP9201"
+    assert stub.data["firmware"] == "1.2.3"
+    # Dynamic values are not handed over.
+    assert stub.data["battery"] == 50
+    assert stub._probed_chars == {CHAR_MODEL_NUMBER, CHAR_FIRMWARE_REVISION}
+    # Consumed once.
+    assert ph.async_pop_probe(hass, stub.address) is None
+
+    ph.async_stash_probe(hass, ph.ProbeHandoff(stub.address, {CHAR_MODEL_NUMBER: b"X"}))
+    monkeypatch.setattr(ph.time, "monotonic", lambda: 1e12)
+    assert ph.async_pop_probe(hass, stub.address) is None
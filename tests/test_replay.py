@@ -0,0 +1,124 @@
+"""A captured snapshot replayed as a live shaver.
+
+The replay device answers reads from the capture, keeps written values
+across connects, and plays a notification script to subscribers. The
+integration's direct-BLE transport runs on it without a radio or an
+advertisement.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from bleak.exc import BleakError
+import pytest
+
+from custom_components.philips_shaver import connect_scheduler as cs
+from custom_components.philips_shaver import transport as tr
+from custom_components.philips_shaver.const import (
+    CHAR_BATTERY_LEVEL,
+    CHAR_DEVICE_STATE,
+    CHAR_MODEL_NUMBER,
+    CHAR_PRESSURE,
+    CHAR_SHAVING_MODE,
+    CHAR_SHAVING_TIME,
+)
+from custom_components.philips_shaver.replay import (
+    LatencyModel,
+    ReplayDevice,
+    session_script,
+)
+
+
+def _device(snapshot, script=None) -> ReplayDevice:
+    return ReplayDevice(
+        snapshot, latency=LatencyModel(), script=script, time_scale=0
+    )
+
+
+async def test_reads_answer_from_the_capture_and_writes_persist(xp9201) -> None:
+    device = _device(xp9201)
+
+    async with device.make_client() as client:
+        assert await client.read_gatt_char(CHAR_MODEL_NUMBER) == b"XP9201"
+        await client.write_gatt_char(CHAR_SHAVING_MODE, b"\x01")
+        with pytest.raises(BleakError, match="not found"):
+            await client.read_gatt_char("0000ffff-0000-1000-8000-00805f9b34fb")
+    assert not client.is_connected
+
+    client = await device.connect()
+    assert await client.read_gatt_char(CHAR_SHAVING_MODE) == b"\x01"
+    await client.disconnect()
+
+
+async def test_script_plays_to_subscribers_and_can_drop_the_link(xp9201) -> None:
+    script = session_script(seconds=3)
+    script["steps"].append({"after": 1.0, "drop": True})
+    device = _device(xp9201, script)
+    dropped: list = []
+    client = await device.connect(disconnected_callback=dropped.append)
+
+    received: list[tuple[str, bytes]] = []
+    for uuid in (CHAR_DEVICE_STATE, CHAR_SHAVING_TIME):
+        await client.start_notify(
+            uuid, lambda char, data: received.append((char.uuid, bytes(data)))
+        )
+    for _ in range(50):
+        if dropped:
+            break
+        await asyncio.sleep(0)
+
+    assert dropped == [client]
+    assert received[0] == (CHAR_DEVICE_STATE, b"\x02")
+    assert [v for u, v in received if u == CHAR_SHAVING_TIME] == [
+        b"\x00\x00", b"\x01\x00", b"\x02\x00", b"\x03\x00"
+    ]
+    assert received[-1] == (CHAR_DEVICE_STATE, b"\x01")
+    # The values the script left behind are what the next connect reads.
+    assert device.values[CHAR_SHAVING_TIME] == b"\x03\x00"
+
+
+def test_script_names_resolve_against_the_capture(xp9201) -> None:
+    device = _device(xp9201, [{"after": 0, "char": "Battery Level", "hex": "10"}])
+    assert device.script["steps"][0]["char"] == CHAR_BATTERY_LEVEL
+
+    with pytest.raises(ValueError, match="not in the capture"):
+        _device(xp9201, [{"after": 0, "char": "Nope", "hex": "00"}])
+
+
+def test_builtin_session_fits_the_capture(qp4530) -> None:
+    # The OneBlade capture has no pressure characteristic.
+    device = _device(qp4530, "session")
+
+    played = {step["char"] for step in device.script["steps"]}
+    assert CHAR_PRESSURE not in played
+    assert {CHAR_DEVICE_STATE, CHAR_SHAVING_TIME} <= played
+    # The skipped steps' delays stay in: still one tick per second.
+    assert sum(step["after"] for step in device.script["steps"]) == 32.0
+
+
+async def test_bleak_transport_runs_on_a_replayed_shaver(monkeypatch, xp9201) -> None:
+    # A replayed shaver never advertises.
+    monkeypatch.setattr(tr, "async_last_service_info", lambda *a, **kw: None)
+    hass = SimpleNamespace(data={})
+    device = _device(xp9201, [{"after": 0, "char": "Battery Level", "hex": "4b"}])
+    transport = tr.BleakTransport(hass, device.address, replay=device)
+
+    assert (await transport.read_chars([CHAR_MODEL_NUMBER]))[CHAR_MODEL_NUMBER] == b"XP9201"
+
+    await transport.connect()
+    assert transport.is_replay and transport.is_connected
+    assert transport.connection_path == "replay"
+    assert transport.mtu == 247
+    # No adapter slot is taken for a link that never touches one.
+    assert cs.async_get_connect_scheduler(hass).holders("default") == set()
+
+    received: list[bytes] = []
+    await transport.subscribe(CHAR_BATTERY_LEVEL, lambda uuid, data: received.append(data))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert received == [bytearray(b"\x4b")]
+
+    await transport.disconnect()
+    assert not transport.is_connected
@@ -0,0 +1,138 @@
+"""Per-session statistics: one external statistics row per hour of shaving.
+
+The coordinator listener is fed a stub coordinator whose data walks through
+a session; the recorder import is captured instead of written.
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.components.recorder import statistics as recorder_statistics
+
+from custom_components.philips_shaver import session_stats
+from custom_components.philips_shaver.session_stats import SessionStatistics
+
+SETTINGS = {
+    "pressure_base_value": 500,
+    "pressure_limit_low": 1500,
+    "pressure_limit_high": 4000,
+}
+
+
+@pytest.fixture
+def imports(monkeypatch) -> dict[str, dict]:
+    """statistic_id → (metadata, rows) of every import, last one wins."""
+    captured: dict[str, dict] = {}
+
+    def _add(hass, metadata, statistics) -> None:
+        captured[metadata["statistic_id"]] = {"meta": metadata, "rows": list(statistics)}
+
+    monkeypatch.setattr(recorder_statistics, "async_add_external_statistics", _add)
+    return captured
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(session_stats.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _tracker() -> tuple[SimpleNamespace, SessionStatistics]:
+    coordinator = SimpleNamespace(
+        address="F4:B3:B1:AA:BB:CC",
+        data={"device_state": "off", "shaving_settings": SETTINGS},
+        hass=SimpleNamespace(config=SimpleNamespace(components={"recorder"})),
+        entry=SimpleNamespace(title="S7887"),
+    )
+    return coordinator, SessionStatistics(coordinator)
+
+
+def _step(coordinator, tracker, clock, seconds: float = 0, **values) -> None:
+    clock[0] += seconds
+    coordinator.data = {**coordinator.data, **values}
+    tracker.async_observe()
+
+
+def _hold(coordinator, tracker, clock, seconds: int) -> None:
+    """Readings unchanged for ``seconds``, notified every 5 s."""
+    for _ in range(seconds // 5):
+        _step(coordinator, tracker, clock, 5)
+
+
+def _row(imports, suffix: str) -> dict:
+    entry = imports[f"philips_shaver:f4_b3_b1_aa_bb_cc_{suffix}"]
+    (row,) = entry["rows"]
+    return row
+
+
+def test_session_becomes_one_row_per_statistic(imports, clock) -> None:
+    coordinator, tracker = _tracker()
+    _step(coordinator, tracker, clock, device_state="shaving", motor_rpm=6000,
+          motor_current_ma=300, pressure=2000, shaving_time=0)
+    _hold(coordinator, tracker, clock, 30)
+    _step(coordinator, tracker, clock, motor_rpm=8000, pressure=4500, shaving_time=30)
+    _hold(coordinator, tracker, clock, 10)
+    assert imports == {}  # nothing until the session is over
+    _step(coordinator, tracker, clock, device_state="off", motor_rpm=0, shaving_time=40)
+
+    duration = _row(imports, "session_duration")
+    assert duration["mean"] == 40
+    assert duration["start"].minute == 0 and duration["start"].second == 0
+    rpm = _row(imports, "session_rpm")
+    assert rpm["mean"] == pytest.approx(6500)
+    assert rpm["max"] == 8000
+    assert _row(imports, "session_current")["mean"] == 300
+    assert _row(imports, "session_pressure_optimal")["mean"] == pytest.approx(75)
+    assert _row(imports, "session_pressure_too_high")["mean"] == pytest.approx(25)
+    assert _row(imports, "session_pressure_too_low")["mean"] == 0
+    # No speed readings on this model: no statistic.
+    assert not any(key.endswith("speed_optimal") for key in imports)
+    meta = imports["philips_shaver:f4_b3_b1_aa_bb_cc_session_rpm"]["meta"]
+    assert meta["source"] == "philips_shaver"
+    assert meta["name"] == "S7887 session motor speed"
+    assert meta["has_mean"] and not meta["has_sum"]
+
+
+def test_sessions_in_one_hour_share_its_row(imports, clock) -> None:
+    coordinator, tracker = _tracker()
+    for seconds, rpm in ((60, 6000), (20, 7000)):
+        _step(coordinator, tracker, clock, device_state="shaving", motor_rpm=rpm,
+              shaving_time=0)
+        _hold(coordinator, tracker, clock, seconds)
+        _step(coordinator, tracker, clock, device_state="off", shaving_time=seconds)
+
+    duration = _row(imports, "session_duration")
+    assert (duration["mean"], duration["min"], duration["max"]) == (40, 20, 60)
+    # Weighted by duration: the long session counts three times.
+    assert _row(imports, "session_rpm")["mean"] == pytest.approx(6250)
+
+
+def test_no_import_without_the_recorder(imports, clock) -> None:
+    coordinator, tracker = _tracker()
+    coordinator.hass.config.components = set()
+    _step(coordinator, tracker, clock, device_state="shaving", motor_rpm=6000)
+    _step(coordinator, tracker, clock, 5, device_state="off")
+    assert imports == {}
+
+
+def test_hour_survives_a_restart(imports, clock) -> None:
+    coordinator, tracker = _tracker()
+    _step(coordinator, tracker, clock, device_state="shaving", shaving_time=0)
+    _hold(coordinator, tracker, clock, 60)
+    _step(coordinator, tracker, clock, device_state="off", shaving_time=60)
+    # Through JSON, like the coordinator's Store.
+    stored = json.loads(json.dumps(tracker.for_store()))
+
+    coordinator, tracker = _tracker()
+    tracker.restore(stored)
+    _step(coordinator, tracker, clock, device_state="shaving", shaving_time=0)
+    _hold(coordinator, tracker, clock, 20)
+    _step(coordinator, tracker, clock, device_state="off", shaving_time=20)
+
+    duration = _row(imports, "session_duration")
+    # The row still holds the session from before the restart.
+    assert (duration["min"], duration["max"]) == (20, 60)
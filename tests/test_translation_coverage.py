@@ -326,3 +326,38 @@ async def test_pair_step_renders_with_and_without_a_reason() -> None:
     failed = await flow.async_step_pair()
     assert 'alert-type="error"' in failed["description_placeholders"]["alert"]
     _renders(failed)
+
+
+async def test_text_blocks_are_cached_per_language_until_reload(
+    monkeypatch, unpatched_text_blocks
+) -> None:
+    """Progress re-renders reuse the resolved blocks instead of the loader."""
+    from types import SimpleNamespace
+
+    import custom_components.philips_shaver.config_flow as cf
+    from custom_components.philips_shaver.text_blocks import async_clear_text_blocks
+
+    loads: list[tuple[str, str]] = []
+
+    async def _translations(hass, language, category, integrations):
+        loads.append((language, category))
+        return {f"component.philips_shaver.{category}.error.x": language}
+
+    language = "de"
+
+    async def _language(hass):
+        return language
+
+    monkeypatch.setattr(cf, "async_get_translations", _translations)
+    monkeypatch.setattr(cf, "_async_user_language", _language)
+    hass = SimpleNamespace(data={})
+
+    for _ in range(3):
+        assert await unpatched_text_blocks(hass) == {"error.x": "de"}
+    language = "en"
+    assert await unpatched_text_blocks(hass) == {"error.x": "en"}
+    assert loads == [("de", "config"), ("en", "config")]
+
+    async_clear_text_blocks(hass)
+    await unpatched_text_blocks(hass)
+    assert loads[-1] == ("en", "config") and len(loads) == 3
@@ -36,7 +36,7 @@ def _flow() -> PhilipsShaverConfigFlow:
     flow.flow_id = "test-flow"
     flow.handler = "philips_shaver"
     flow.discovery_info = SimpleNamespace(address=ADDRESS, name="Philips Shaver")
-    flow.hass = SimpleNamespace()
+    flow.hass = SimpleNamespace(data={})
     return flow
 
 
@@ -167,7 +167,7 @@ def test_available_paths_drop_stale_rssi_invalidation(monkeypatch) -> None:
         lambda hass, address, connectable=True: [stale, live],
     )
 
-    paths = tr.describe_available_paths(SimpleNamespace(), ADDRESS)
+    paths = tr.describe_available_paths(SimpleNamespace(data={}), ADDRESS)
 
     assert len(paths) == 1
     assert paths[0]["name"].startswith("atom-s3r")
@@ -186,4 +186,4 @@ def test_available_paths_all_stale_yields_empty(monkeypatch) -> None:
         lambda hass, address, connectable=True: [stale],
     )
 
-    assert tr.describe_available_paths(SimpleNamespace(), ADDRESS) == []
+    assert tr.describe_available_paths(SimpleNamespace(data={}), ADDRESS) == []
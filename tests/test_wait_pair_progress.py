@@ -41,6 +41,7 @@ def _flow() -> PhilipsShaverConfigFlow:
         return _FakeTask(done=False)
 
     flow.hass = SimpleNamespace(
+        data={},
         async_create_task=MagicMock(side_effect=_create_task),
         services=SimpleNamespace(async_call=AsyncMock()),
     )
@@ -0,0 +1,163 @@
+"""The card's websocket subscription: one snapshot, then rate-limited deltas."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import voluptuous as vol
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.philips_shaver import websocket_api as ws
+from custom_components.philips_shaver.const import DOMAIN
+from custom_components.philips_shaver.websocket_api import (
+    WS_TYPE_SUBSCRIBE,
+    ws_subscribe,
+)
+
+# What the websocket registry validates a command with before calling it.
+SUBSCRIBE_SCHEMA = vol.Schema(ws_subscribe._ws_schema)
+
+
+class _Coordinator:
+    def __init__(self) -> None:
+        self.data = {
+            "battery": 80,
+            "shaving_mode": "regular",
+            "app_handle_settings_raw": b"\x10\x00",
+            "_connecting": True,
+        }
+        self.transport = SimpleNamespace(is_connected=False)
+        self.listeners: list = []
+
+    def async_add_listener(self, update_callback):
+        self.listeners.append(update_callback)
+        return lambda: self.listeners.remove(update_callback)
+
+    def update(self, **values) -> None:
+        self.data = {**self.data, **values}
+        for listener in list(self.listeners):
+            listener()
+
+
+class _Connection:
+    """The parts of ActiveConnection the command uses; events as plain dicts."""
+
+    def __init__(self) -> None:
+        self.subscriptions: dict = {}
+        self.results: list = []
+        self.errors: list = []
+        self.events: list = []
+
+    def send_result(self, msg_id, result=None) -> None:
+        self.results.append(msg_id)
+
+    def send_error(self, msg_id, code, message) -> None:
+        self.errors.append(code)
+
+    def send_message(self, message) -> None:
+        self.events.append(message["event"])
+
+
+def _setup(hass):
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "F4:B3:B1:AA:BB:CC")}
+    )
+    coordinator = _Coordinator()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+    return _Connection(), device, coordinator
+
+
+def _subscribe(hass, connection, device_id, **options) -> None:
+    msg = SUBSCRIBE_SCHEMA({"id": 1, "type": WS_TYPE_SUBSCRIBE, "device_id": device_id, **options})
+    ws_subscribe(hass, connection, msg)
+
+
+async def test_snapshot_then_rate_limited_deltas(hass, monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr(ws.time, "monotonic", lambda: clock[0])
+    connection, device, coordinator = _setup(hass)
+
+    _subscribe(hass, connection, device.id, min_interval=1)
+
+    assert connection.results == [1]
+    # No private keys, no raw bytes.
+    assert connection.events == [
+        {"snapshot": {"battery": 80, "shaving_mode": "regular", "connected": False}}
+    ]
+
+    # A burst within the interval arrives as one delta with the last values.
+    coordinator.update(battery=79)
+    coordinator.transport.is_connected = True
+    coordinator.update(battery=78, shaving_mode="sensitive")
+    assert len(connection.events) == 1
+    clock[0] += 1
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert connection.events[1:] == [
+        {"delta": {"battery": 78, "shaving_mode": "sensitive", "connected": True}}
+    ]
+
+    # Past the interval an update goes out at once; a vanished key is removed.
+    coordinator.data.pop("shaving_mode")
+    clock[0] += 2
+    coordinator.update()
+    # ...unless nothing changed for the client.
+    clock[0] += 2
+    coordinator.update(_connecting=False)
+    assert connection.events[2:] == [{"delta": {}, "removed": ["shaving_mode"]}]
+
+    connection.subscriptions[1]()
+    assert coordinator.listeners == []
+
+
+async def test_unsubscribe_cancels_a_pending_delta(hass) -> None:
+    connection, device, coordinator = _setup(hass)
+    _subscribe(hass, connection, device.id)
+
+    coordinator.update(battery=10)
+    connection.subscriptions[1]()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert len(connection.events) == 1
+
+
+async def test_unknown_device_is_an_error(hass) -> None:
+    connection, _device, _coordinator = _setup(hass)
+
+    _subscribe(hass, connection, "nope")
+
+    assert connection.errors == ["not_found"]
+    assert connection.subscriptions == {}
+
+
+async def test_unloading_the_entry_ends_the_subscription(hass) -> None:
+    connection, device, coordinator = _setup(hass)
+    _subscribe(hass, connection, device.id)
+    (entry_id,) = hass.data[DOMAIN]
+
+    # What async_unload_entry does once the coordinator is shut down.
+    hass.data[DOMAIN].pop(entry_id)
+    ws.async_end_subscriptions(hass, entry_id)
+
+    assert connection.events[-1] == {"ended": True}
+    assert connection.subscriptions == {}
+    assert coordinator.listeners == []
+
+    # The reloaded entry's coordinator serves the next subscription.
+    reloaded = _Coordinator()
+    hass.data[DOMAIN][entry_id] = {"coordinator": reloaded}
+    _subscribe(hass, connection, device.id)
+    reloaded.update(battery=10)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert connection.events[-1] == {"delta": {"battery": 10}}
+    connection.subscriptions[1]()
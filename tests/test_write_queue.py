@@ -0,0 +1,315 @@
+"""Coalescing of rapid settings writes (light ring colors, modes, switch).
+
+A burst of writes to one characteristic puts at most one write on the air
+at a time, and only the latest waiting value follows it. Entities see each
+value at once; the confirmed value comes back if the burst's write fails.
+While the shaver sleeps, writes are deferred, persisted, and flushed on the
+next connect unless the shaver's value changed in the meantime.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.philips_shaver.const import (
+    CHAR_APP_HANDLE_SETTINGS,
+    CHAR_LIGHTRING_COLOR_LOW,
+    CHAR_SHAVING_MODE,
+    CHAR_SYSTEM_NOTIFICATIONS,
+)
+from custom_components.philips_shaver.exceptions import TransportError
+from custom_components.philips_shaver.write_queue import CharWriteQueue, DeferredWrite
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.writes: list[tuple[str, bytes]] = []
+        self.gate = asyncio.Event()
+        self.fail = False
+        # Values the shaver refuses even while ``fail`` is off.
+        self.rejects: set[bytes] = set()
+        self.is_connected = True
+        self.values: dict[str, bytes] = {}
+        self.reads = 0
+
+    async def read_char(self, char_uuid: str) -> bytes | None:
+        self.reads += 1
+        await asyncio.sleep(0)  # a read yields, like one over the air
+        return self.values.get(char_uuid)
+
+    async def write_char(self, char_uuid: str, data: bytes) -> None:
+        self.writes.append((char_uuid, data))
+        await self.gate.wait()
+        if self.fail or data in self.rejects:
+            raise TransportError("Not connected")
+
+
+async def _settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def _coordinator() -> SimpleNamespace:
+    stub = SimpleNamespace(
+        hass=None,
+        address="F4:B3:B1:AA:BB:CC",
+        data={"color_low": (255, 0, 0)},
+        received_chars=set(),
+        transport=_Transport(),
+        async_update_listeners=MagicMock(),
+        async_set_updated_data=MagicMock(),
+        entry=SimpleNamespace(
+            async_create_background_task=lambda hass, coro, name: asyncio.ensure_future(coro)
+        ),
+    )
+    stub.writer = CharWriteQueue(stub)
+    return stub
+
+
+async def test_burst_writes_the_first_and_the_last_value() -> None:
+    coord = _coordinator()
+
+    def _write(i: int) -> asyncio.Future:
+        return asyncio.ensure_future(
+            coord.writer.async_write(
+                CHAR_LIGHTRING_COLOR_LOW,
+                bytes([i, 0, 0, 0xFF]),
+                optimistic={"color_low": (i, 0, 0)},
+            )
+        )
+
+    calls = [_write(0)]
+    await _settle()
+    calls += [_write(i) for i in range(1, 5)]
+    await _settle()
+    # Every value shows at once; one write is on the air.
+    assert coord.data["color_low"] == (4, 0, 0)
+    assert len(coord.transport.writes) == 1
+
+    coord.transport.gate.set()
+    await asyncio.wait_for(asyncio.gather(*calls), 1)
+
+    assert coord.transport.writes == [
+        (CHAR_LIGHTRING_COLOR_LOW, bytes([0, 0, 0, 0xFF])),
+        (CHAR_LIGHTRING_COLOR_LOW, bytes([4, 0, 0, 0xFF])),
+    ]
+    coord.async_set_updated_data.assert_called_once()
+    assert "last_seen" in coord.data
+
+
+async def test_characteristics_do_not_wait_for_each_other() -> None:
+    coord = _coordinator()
+    color = asyncio.ensure_future(
+        coord.writer.async_write(CHAR_LIGHTRING_COLOR_LOW, b"\x01\x02\x03\xff")
+    )
+    mode = asyncio.ensure_future(coord.writer.async_write(CHAR_SHAVING_MODE, b"\x02"))
+    await _settle()
+
+    assert {uuid for uuid, _ in coord.transport.writes} == {
+        CHAR_LIGHTRING_COLOR_LOW, CHAR_SHAVING_MODE
+    }
+    coord.transport.gate.set()
+    await asyncio.wait_for(asyncio.gather(color, mode), 1)
+
+
+async def test_failed_write_restores_the_confirmed_value() -> None:
+    coord = _coordinator()
+    coord.transport.fail = True
+    coord.transport.gate.set()
+
+    with pytest.raises(TransportError):
+        await coord.writer.async_write(
+            CHAR_LIGHTRING_COLOR_LOW,
+            b"\x00\xff\x00\xff",
+            optimistic={"color_low": (0, 255, 0)},
+        )
+
+    assert coord.data["color_low"] == (255, 0, 0)
+    coord.async_set_updated_data.assert_not_called()
+
+    # The queue is usable again afterwards.
+    coord.transport.fail = False
+    await coord.writer.async_write(CHAR_LIGHTRING_COLOR_LOW, b"\x00\xff\x00\xff")
+    assert len(coord.transport.writes) == 2
+
+
+async def test_failed_successor_restores_the_value_written_before_it() -> None:
+    coord = _coordinator()
+    coord.transport.rejects.add(b"\x00\x00\xff\xff")
+    first = asyncio.ensure_future(
+        coord.writer.async_write(
+            CHAR_LIGHTRING_COLOR_LOW,
+            b"\x00\xff\x00\xff",
+            optimistic={"color_low": (0, 255, 0)},
+        )
+    )
+    await _settle()
+    second = asyncio.ensure_future(
+        coord.writer.async_write(
+            CHAR_LIGHTRING_COLOR_LOW,
+            b"\x00\x00\xff\xff",
+            optimistic={"color_low": (0, 0, 255)},
+        )
+    )
+    await _settle()
+
+    coord.transport.gate.set()
+    await asyncio.wait_for(first, 1)
+    with pytest.raises(TransportError):
+        await asyncio.wait_for(second, 1)
+
+    # Green reached the shaver; the red from before the burst is stale.
+    assert coord.data["color_low"] == (0, 255, 0)
+
+
+async def test_sleeping_shaver_defers_merges_and_persists() -> None:
+    coord = _coordinator()
+    coord.transport.is_connected = False
+    bit4, bit5 = b"\x10\x00\x00\x00", b"\x20\x00\x00\x00"
+
+    assert not await coord.writer.async_write(
+        CHAR_LIGHTRING_COLOR_LOW, b"\x00\xff\x00\xff", optimistic={"color_low": (0, 255, 0)}
+    )
+    await coord.writer.async_write(CHAR_APP_HANDLE_SETTINGS, bit4, mask=bit4)
+    await coord.writer.async_write(CHAR_APP_HANDLE_SETTINGS, bytes(4), mask=bit5)
+
+    assert coord.transport.writes == []
+    assert coord.data["color_low"] == (0, 255, 0)
+    stored = coord.writer.deferred_for_store()
+    # Later changes to one characteristic merge into one write.
+    assert DeferredWrite.from_store(stored[CHAR_APP_HANDLE_SETTINGS]) == DeferredWrite(
+        bit4, b"\x30\x00\x00\x00"
+    )
+
+    restored = CharWriteQueue(coord)
+    restored.restore_deferred(stored)
+    assert restored.deferred_for_store() == stored
+
+
+async def test_flush_merges_owned_bits_onto_the_current_value() -> None:
+    coord = _coordinator()
+    coord.transport.is_connected = False
+    await coord.writer.async_write(
+        CHAR_APP_HANDLE_SETTINGS,
+        b"\x10\x00\x00\x00",
+        mask=b"\x30\x00\x00\x00",
+        base=b"\x20\x00\x00\x00",
+    )
+
+    coord.transport.is_connected = True
+    coord.transport.gate.set()
+    # Bit 0 was set on the shaver meanwhile; the owned bits are untouched.
+    coord.transport.values[CHAR_APP_HANDLE_SETTINGS] = b"\x21\x00\x00\x00"
+
+    flushed = await coord.writer.async_flush_deferred()
+
+    assert coord.transport.writes == [(CHAR_APP_HANDLE_SETTINGS, b"\x11\x00\x00\x00")]
+    assert flushed == {CHAR_APP_HANDLE_SETTINGS: b"\x11\x00\x00\x00"}
+    assert not coord.writer.has_deferred
+
+
+async def test_flush_keeps_a_value_changed_on_the_shaver() -> None:
+    coord = _coordinator()
+    coord.transport.is_connected = False
+    await coord.writer.async_write(CHAR_SHAVING_MODE, b"\x02", base=b"\x01")
+    await coord.writer.async_write(CHAR_LIGHTRING_COLOR_LOW, b"\x00\xff\x00\xff")
+
+    coord.transport.is_connected = True
+    coord.transport.gate.set()
+    # Changed in the app since: the shaver's value wins.
+    coord.transport.values[CHAR_SHAVING_MODE] = b"\x03"
+    # Already what the deferred write wanted.
+    coord.transport.values[CHAR_LIGHTRING_COLOR_LOW] = b"\x00\xff\x00\xff"
+
+    flushed = await coord.writer.async_flush_deferred()
+
+    assert coord.transport.writes == []
+    assert flushed == {
+        CHAR_SHAVING_MODE: b"\x03",
+        CHAR_LIGHTRING_COLOR_LOW: b"\x00\xff\x00\xff",
+    }
+    assert not coord.writer.has_deferred
+
+
+async def test_bit_clears_use_the_cache_and_batch_into_one_write() -> None:
+    coord = _coordinator()
+    coord.data["system_notifications"] = 0x1F
+    coord.received_chars.add(CHAR_SYSTEM_NOTIFICATIONS)
+
+    def _clear(bits: int) -> asyncio.Future:
+        return asyncio.ensure_future(
+            coord.writer.async_clear_bits(
+                CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", bits
+            )
+        )
+
+    calls = [_clear(0x02)]
+    await _settle()
+    calls += [_clear(0x01), _clear(0x04)]
+    await _settle()
+    assert coord.data["system_notifications"] == 0x18
+
+    coord.transport.gate.set()
+    assert await asyncio.wait_for(asyncio.gather(*calls), 1) == [True] * 3
+
+    # No reads; the two clears behind the first share its successor.
+    assert coord.transport.writes == [
+        (CHAR_SYSTEM_NOTIFICATIONS, (0x1D).to_bytes(4, "little")),
+        (CHAR_SYSTEM_NOTIFICATIONS, (0x18).to_bytes(4, "little")),
+    ]
+
+
+async def test_bit_clear_reads_a_register_not_received_on_this_link() -> None:
+    coord = _coordinator()
+    # The default, never confirmed by the shaver.
+    coord.data["system_notifications"] = 0
+    coord.transport.values[CHAR_SYSTEM_NOTIFICATIONS] = (0x06).to_bytes(4, "little")
+    coord.transport.gate.set()
+
+    assert await coord.writer.async_clear_bits(
+        CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", 0x02
+    )
+
+    # Only the acknowledged bit is cleared; the other one stays set.
+    assert coord.transport.writes == [
+        (CHAR_SYSTEM_NOTIFICATIONS, (0x04).to_bytes(4, "little"))
+    ]
+    assert coord.data["system_notifications"] == 0x04
+
+    coord.transport.values.clear()
+    coord.received_chars.clear()
+    with pytest.raises(TransportError):
+        await coord.writer.async_clear_bits(
+            CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", 0x04
+        )
+    assert len(coord.transport.writes) == 1
+
+
+async def test_concurrent_bit_clears_build_on_each_other() -> None:
+    coord = _coordinator()
+    coord.data["system_notifications"] = 0
+    coord.transport.values[CHAR_SYSTEM_NOTIFICATIONS] = (0x06).to_bytes(4, "little")
+    coord.transport.gate.set()
+
+    assert await asyncio.wait_for(
+        asyncio.gather(
+            coord.writer.async_clear_bits(
+                CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", 0x02
+            ),
+            coord.writer.async_clear_bits(
+                CHAR_SYSTEM_NOTIFICATIONS, "system_notifications", 0x04
+            ),
+        ),
+        1,
+    ) == [True, True]
+
+    # One read; the second clear keeps the first one's acknowledgement.
+    assert coord.transport.reads == 1
+    assert coord.transport.writes[-1] == (
+        CHAR_SYSTEM_NOTIFICATIONS, (0x00).to_bytes(4, "little")
+    )
+    assert coord.data["system_notifications"] == 0